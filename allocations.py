@@ -0,0 +1,201 @@
+import sys
+import tracemalloc
+from collections import defaultdict, deque
+from types import FrameType
+from typing import Any, Deque, Dict, List, Optional, TextIO, Tuple
+
+
+SURFACE_FACTORIES = frozenset({
+    'Surface.copy',
+    'Surface.convert',
+    'Surface.convert_alpha',
+    'Surface.subsurface',
+    'Font.render',
+    'pygame.image.load',
+    'pygame.transform.flip',
+    'pygame.transform.rotate',
+    'pygame.transform.rotozoom',
+    'pygame.transform.scale',
+    'pygame.transform.smoothscale',
+})
+TRACKED_PREFIX = 'show_'
+GROWTH_WINDOW = 300
+GROWTH_WINDOWS = 3
+GROWTH_LIMIT = 16
+REPORT_INTERVAL = 1800
+TOP_LINES = 5
+
+
+class AllocationTracker:
+    """A class for measuring memory allocated by the render loop, each frame
+    and in each `show_*` function.
+
+    Python memory is measured with `tracemalloc`. Surfaces are counted by the
+    calls creating them (see `SURFACE_FACTORIES`), made from the thread which
+    started tracking. Surfaces created by calling the `Surface` class itself
+    aren't counted, though their objects' memory is still traced.
+
+    Growth is flagged when the mean traced memory of `GROWTH_WINDOWS`
+    consecutive windows of `GROWTH_WINDOW` frames keeps rising by more than
+    `GROWTH_LIMIT` bytes per frame, along with the lines allocating the most
+    since tracking started or since growth was last flagged.
+
+    Attributes:
+        frames: Amount of frames measured since the last report.
+        surfaces: Total and maximum surfaces created in a frame.
+        allocated: Total and maximum peak bytes allocated within a frame.
+        retained: Total bytes still held at the end of each frame.
+        functions: Calls, surfaces created and bytes retained by each
+                   `show_*` function since the last report.
+    """
+    def __init__(self, stream: TextIO = sys.stderr,
+                 interval: int = REPORT_INTERVAL) -> None:
+        self._stream = stream
+        self._interval = interval
+        self._calls: List[Tuple[FrameType, str, int, int]] = []
+        self._created = 0
+        self._memory = 0
+        self._window = [0, 0]
+        self._means: Deque[float] = deque(maxlen=GROWTH_WINDOWS + 1)
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._tracing = False
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clears the statistics gathered since the last report."""
+        self.frames = 0
+        self.surfaces = [0, 0]
+        self.allocated = [0, 0]
+        self.retained = 0
+        self.functions: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+
+    def start(self) -> None:
+        """Starts tracking allocations."""
+        self._tracing = not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+        self._snapshot = self._take_snapshot()
+        self._memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        sys.setprofile(self._profile)
+
+    def stop(self) -> None:
+        """Stops tracking allocations and writes a final report."""
+        sys.setprofile(None)
+        if self.frames:
+            self._stream.write(self.report())
+        self._snapshot = None
+        if self._tracing:
+            tracemalloc.stop()
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        """Returns a snapshot of traced memory, excluding the tracker's."""
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ])
+
+    def _profile(self, frame: FrameType, event: str, arg: Any) -> None:
+        """Counts created surfaces and attributes allocations to functions.
+        Installed with `sys.setprofile`.
+
+        Args:
+            frame: Frame of the running function.
+            event: Kind of event.
+            arg: Function called, for C function events.
+        """
+        if event == 'c_call':
+            name = getattr(arg, '__qualname__', '')
+            if '.' not in name:
+                name = f'{getattr(arg, "__module__", None)}.{name}'
+            if name in SURFACE_FACTORIES:
+                self._created += 1
+        elif event == 'call':
+            name = frame.f_code.co_name
+            if (name.startswith(TRACKED_PREFIX) and frame.f_globals.get(
+                    '__name__', '').startswith('periodical.')):
+                self._calls.append(
+                    (frame, name, self._created,
+                     tracemalloc.get_traced_memory()[0]))
+        elif event == 'return' and self._calls and self._calls[-1][0] is frame:
+            _, name, created, memory = self._calls.pop()
+            stats = self.functions[name]
+            stats[0] += 1
+            stats[1] += self._created - created
+            stats[2] += tracemalloc.get_traced_memory()[0] - memory
+
+    def frame(self) -> None:
+        """Ends the measurement of a frame. Should be called once per frame,
+        after the display is updated."""
+        memory, peak = tracemalloc.get_traced_memory()
+        self.frames += 1
+        for totals, value in ((self.surfaces, self._created),
+                              (self.allocated, peak - self._memory)):
+            totals[0] += value
+            totals[1] = max(totals[1], value)
+        self.retained += memory - self._memory
+        self._created = 0
+        self._memory = memory
+        self._window[0] += memory
+        self._window[1] += 1
+        if self._window[1] == GROWTH_WINDOW:
+            self._check_growth()
+        if self.frames >= self._interval:
+            self._stream.write(self.report())
+            self._reset()
+        tracemalloc.reset_peak()
+
+    def _check_growth(self) -> None:
+        """Closes a window of frames and flags steady growth, if found."""
+        self._means.append(self._window[0] / self._window[1])
+        self._window = [0, 0]
+        if len(self._means) <= GROWTH_WINDOWS:
+            return
+        means = list(self._means)
+        rate = (means[-1] - means[0]) / (GROWTH_WINDOWS * GROWTH_WINDOW)
+        if rate > GROWTH_LIMIT and all(
+                a < b for a, b in zip(means, means[1:])):
+            self._stream.write(self._report_growth(rate))
+            self._means.clear()
+
+    def _report_growth(self, rate: float) -> str:
+        """Returns a warning of steady growth and the lines behind it.
+
+        Args:
+            rate: Mean growth in bytes per frame.
+
+        Returns:
+            Human readable warning.
+        """
+        lines = [f'allocations: memory grew by {rate:.0f} bytes per frame '
+                 f'over the last {GROWTH_WINDOWS * GROWTH_WINDOW} frames']
+        snapshot = self._take_snapshot()
+        if self._snapshot:
+            for stat in snapshot.compare_to(self._snapshot,
+                                            'lineno')[:TOP_LINES]:
+                lines.append(f'  {stat}')
+        self._snapshot = snapshot
+        return '\n'.join(lines) + '\n'
+
+    def report(self) -> str:
+        """Returns a summary of the allocations since the last report.
+
+        Returns:
+            Human readable table of allocations.
+        """
+        frames = max(self.frames, 1)
+        lines = [
+            f'allocations over {self.frames} frames:',
+            f'  surfaces per frame: {self.surfaces[0] / frames:.1f} mean, '
+            f'{self.surfaces[1]} max',
+            f'  bytes allocated per frame: '
+            f'{self.allocated[0] / frames:.0f} mean, '
+            f'{self.allocated[1]} max',
+            f'  bytes retained per frame: {self.retained / frames:.0f} mean',
+        ]
+        for name, (calls, surfaces, retained) in sorted(
+                self.functions.items()):
+            lines.append(f'  {name}: {calls} calls, '
+                         f'{surfaces / calls:.1f} surfaces and '
+                         f'{retained / calls:.0f} bytes retained per call')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,274 @@
+import argparse
+import csv
+import json
+import os
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+from periodical.bots import STRATEGIES
+from periodical.catalog import Catalog, get_catalog
+from periodical.config import PATH
+from periodical.simulate import play_game, RECORD
+
+
+COUNTERS = 'offers', 'buys', 'synthesized'
+HISTOGRAMS = 'energy', 'light_exhausted', 'heavy_exhausted', 'turns'
+BATCH = 1000
+
+
+class Aggregate:
+    """A class for keeping running statistics over a stream of game records,
+    without keeping the records themselves.
+
+    Aggregates of separate streams can be merged.
+
+    Attributes:
+        offers: Turns each element, by atomic number, started in the market.
+        buys: Purchases of each element, by atomic number.
+        synthesized: Syntheses of each element, by atomic number.
+        energy: Turns by the energy harvested during them.
+        light_exhausted: Games by the turn the light deck ran out.
+        heavy_exhausted: Games by the turn the heavy deck ran out.
+        turns: Games by their amount of turns.
+        games: Amount of games recorded.
+        goals: Amount of games which reached their goal.
+    """
+    def __init__(self, size: int = 0) -> None:
+        self.offers = array('q', bytes(8 * size))
+        self.buys = array('q', bytes(8 * size))
+        self.synthesized = array('q', bytes(8 * size))
+        self.energy: Counter = Counter()
+        self.light_exhausted: Counter = Counter()
+        self.heavy_exhausted: Counter = Counter()
+        self.turns: Counter = Counter()
+        self.games = 0
+        self.goals = 0
+
+    def _fit(self, size: int) -> None:
+        """Extends the per element counters to fit the given size.
+
+        Args:
+            size: Required length of the counters.
+        """
+        for name in COUNTERS:
+            counter = getattr(self, name)
+            if len(counter) < size:
+                counter.extend(bytes(8 * (size - len(counter))))
+
+    def _count(self, name: str, numbers: List[int]) -> None:
+        """Adds to an element counter.
+
+        Args:
+            name: Name of the counter.
+            numbers: Atomic numbers to count.
+        """
+        if numbers:
+            self._fit(max(numbers) + 1)
+        counter = getattr(self, name)
+        for number in numbers:
+            counter[number] += 1
+
+    def update(self, record: RECORD) -> None:
+        """Adds a turn or game record to the statistics.
+
+        Args:
+            record: Record of a turn or of an entire game.
+        """
+        if 'turn' not in record:
+            self.games += 1
+            self.goals += bool(record.get('goal'))
+            self.turns[record['turns']] += 1
+            return
+        self._count('offers', record['market'])
+        self._count('buys', record['bought'])
+        self._count('synthesized', record['synthesized'])
+        self.energy[record['energy']] += 1
+        if record['light_exhausted']:
+            self.light_exhausted[record['turn']] += 1
+        if record['heavy_exhausted']:
+            self.heavy_exhausted[record['turn']] += 1
+
+    def merge(self, other: 'Aggregate') -> 'Aggregate':
+        """Adds another aggregate's statistics to this one.
+
+        Args:
+            other: Aggregate to add.
+
+        Returns:
+            This aggregate.
+        """
+        self._fit(len(other.offers))
+        for name in COUNTERS:
+            counter = getattr(self, name)
+            for number, count in enumerate(getattr(other, name)):
+                counter[number] += count
+        for name in HISTOGRAMS:
+            getattr(self, name).update(getattr(other, name))
+        self.games += other.games
+        self.goals += other.goals
+        return self
+
+    def _get_categories(self, catalog: Catalog) -> Dict[str, List[int]]:
+        """Returns the element counters summed by category.
+
+        Args:
+            catalog: Catalog to categorize elements by.
+
+        Returns:
+            Offers, buys and syntheses of each category.
+        """
+        categories: Dict[str, List[int]] = {}
+        for number in catalog.numbers():
+            if number >= len(self.offers):
+                break
+            category = catalog.create_card(number).category
+            totals = categories.setdefault(category, [0, 0, 0])
+            for i, name in enumerate(COUNTERS):
+                totals[i] += getattr(self, name)[number]
+        return categories
+
+    def to_csv(self, directory: str, catalog: Catalog) -> None:
+        """Writes summaries of the statistics as csv files.
+
+        Args:
+            directory: Directory to write the files to.
+            catalog: Catalog to name and categorize elements by.
+        """
+        os.makedirs(directory, exist_ok=True)
+        elements = []
+        for number in catalog.numbers():
+            if number >= len(self.offers):
+                break
+            card = catalog.create_card(number)
+            offers, buys, synthesized = (getattr(self, name)[number]
+                                         for name in COUNTERS)
+            elements.append((number, card.symbol, card.category, offers, buys,
+                             _rate(buys, offers), synthesized))
+        categories = [(category, offers, buys, _rate(buys, offers), synth)
+                      for category, (offers, buys, synth)
+                      in sorted(self._get_categories(catalog).items())]
+        exhaustion = sorted(set(self.light_exhausted)
+                            | set(self.heavy_exhausted))
+        tables = {
+            'elements': (('number', 'symbol', 'category', 'offers', 'buys',
+                          'buy_rate', 'synthesized'), elements),
+            'categories': (('category', 'offers', 'buys', 'buy_rate',
+                            'synthesized'), categories),
+            'energy': (('energy', 'turns'), sorted(self.energy.items())),
+            'exhaustion': (('turn', 'light', 'heavy'),
+                           [(turn, self.light_exhausted[turn],
+                             self.heavy_exhausted[turn])
+                            for turn in exhaustion]),
+            'games': (('turns', 'games'), sorted(self.turns.items())),
+        }
+        for name, (header, rows) in tables.items():
+            with open(os.path.join(directory, f'{name}.csv'), 'w',
+                      newline='', encoding='utf-8') as file_handler:
+                writer = csv.writer(file_handler)
+                writer.writerow(header)
+                writer.writerows(rows)
+
+    def to_npz(self, path: str, catalog: Catalog) -> None:
+        """Writes the statistics as a compressed NumPy archive.
+
+        Histograms are stored densely, indexed by their key.
+
+        Args:
+            path: Path of the archive.
+            catalog: Catalog to categorize elements by.
+
+        Raises:
+            ImportError: If NumPy isn't installed.
+        """
+        if np is None:
+            raise ImportError('NumPy is required for .npz output')
+        categories = self._get_categories(catalog)
+        arrays = {name: np.array(getattr(self, name), dtype=np.int64)
+                  for name in COUNTERS}
+        for name in HISTOGRAMS:
+            histogram = getattr(self, name)
+            dense = np.zeros(max(histogram, default=-1) + 1, dtype=np.int64)
+            for key, count in histogram.items():
+                dense[key] = count
+            arrays[name] = dense
+        arrays['categories'] = np.array(sorted(categories))
+        arrays['category_counts'] = np.array(
+            [categories[category] for category in sorted(categories)],
+            dtype=np.int64).reshape(-1, len(COUNTERS))
+        arrays['games'] = np.array([self.games, self.goals], dtype=np.int64)
+        np.savez_compressed(path, **arrays)
+
+
+def _rate(part: int, total: int) -> float:
+    """Returns the ratio of part to total, or 0 if total is 0."""
+    return part / total if total else 0.0
+
+
+def iter_records(path: str) -> Iterator[RECORD]:
+    """Yields records one at a time from a newline delimited json file.
+
+    Args:
+        path: Path to the file.
+
+    Yields:
+        Record of a turn or of an entire game.
+    """
+    with open(path, 'r', encoding='utf-8') as file_handler:
+        for line in file_handler:
+            if line.strip():
+                yield json.loads(line)
+
+
+def aggregate_games(name: str, seeds: Tuple[int, int]) -> Aggregate:
+    """Plays games with a strategy and aggregates their records.
+
+    Args:
+        name: Name of strategy to play.
+        seeds: First seed and the seed following the last one.
+
+    Returns:
+        Statistics of the games.
+    """
+    aggregate = Aggregate(get_catalog(PATH).last + 1)
+    for seed in range(*seeds):
+        play_game(STRATEGIES[name], seed, record=aggregate.update)
+    return aggregate
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Aggregates statistics over simulated games.')
+    parser.add_argument('records', nargs='*',
+                        help='newline delimited json files of records')
+    parser.add_argument('--simulate', type=int, default=0,
+                        help='amount of games to simulate')
+    parser.add_argument('--strategy', default='greedy',
+                        choices=list(STRATEGIES))
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--out', default='analytics')
+    parser.add_argument('--npz', action='store_true',
+                        help='write a NumPy archive instead of csv files')
+    args = parser.parse_args()
+
+    catalog = get_catalog(PATH)
+    total = Aggregate(catalog.last + 1)
+    for path in args.records:
+        for record in iter_records(path):
+            total.update(record)
+    batches = [(start, min(start + BATCH, args.simulate))
+               for start in range(0, args.simulate, BATCH)]
+    with ProcessPoolExecutor(args.workers) as pool:
+        for aggregate in pool.map(aggregate_games,
+                                  [args.strategy] * len(batches), batches):
+            total.merge(aggregate)
+    if args.npz:
+        total.to_npz(args.out, catalog)
+    else:
+        total.to_csv(args.out, catalog)
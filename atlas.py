@@ -0,0 +1,176 @@
+import json
+import os
+from threading import RLock
+from typing import Any, Callable, Dict, List, Tuple
+
+import pygame
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+from periodical.config import LAYOUT, Size
+
+
+SHEET = Size(width=1024, height=1024)
+INDEX = 'index.json'
+# guards font rendering and packing, which may run on a prewarming thread
+RENDER_LOCK = RLock()
+
+
+class Atlas:
+    """A class for packing pre-rendered images onto a few large surfaces.
+
+    Images are packed row by row onto sheets and handed out as subsurfaces,
+    which share their sheet's pixels, so drawing them never allocates new
+    surfaces.
+
+    Sets of images, such as those of different scales, are kept under
+    different names. The set in use and the one used before it stay in
+    memory, while older sets are dropped, to be reloaded from the disk cache
+    if needed again.
+
+    Attributes:
+        size: Size of each sheet.
+        name: Name of the set of images in use.
+        sheets: Surfaces holding all packed images.
+    """
+    def __init__(self, size: Size = SHEET, name: str = '') -> None:
+        self.size = size
+        self.name = name
+        self.sheets: List[Surface] = []
+        self._regions: Dict[str, Surface] = {}
+        self._areas: Dict[str, Tuple[int, Rect]] = {}
+        self._x = self._y = self._row_height = 0
+        self._stored: Dict[str, Tuple[Any, ...]] = {}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._regions
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def _allocate(self, width: int, height: int) -> Tuple[int, Rect]:
+        """Reserves an area for an image, opening a new sheet if necessary.
+
+        Args:
+            width: Image's width.
+            height: Image's height.
+
+        Returns:
+            Index of the sheet and the reserved area on it.
+        """
+        if self._x + width > self.size.width:
+            self._x, self._y = 0, self._y + self._row_height
+            self._row_height = 0
+        if not self.sheets or self._y + height > self.size.height:
+            self.sheets.append(Surface(self.size.size).convert())
+            self._x = self._y = self._row_height = 0
+        area = Rect(self._x, self._y, width, height)
+        self._x += width
+        self._row_height = max(self._row_height, height)
+        return len(self.sheets) - 1, area
+
+    def add(self, key: str, image: Surface) -> Surface:
+        """Packs an image onto the atlas.
+
+        Args:
+            key: Unique name of the image.
+            image: Image to pack.
+
+        Returns:
+            Subsurface of the sheet holding the packed image.
+        """
+        index, area = self._allocate(*image.get_size())
+        sheet = self.sheets[index]
+        sheet.blit(image, area)
+        region = sheet.subsurface(area)
+        self._regions[key] = region
+        self._areas[key] = index, area
+        return region
+
+    def fetch(self, key: str, draw: Callable[[], Surface]) -> Surface:
+        """Returns a packed image, drawing and packing it on first use.
+
+        Args:
+            key: Unique name of the image.
+            draw: Function creating the image.
+
+        Returns:
+            Subsurface of the sheet holding the image.
+        """
+        try:
+            return self._regions[key]
+        except KeyError:
+            with RENDER_LOCK:
+                if key in self._regions:
+                    return self._regions[key]
+                return self.add(key, draw())
+
+    def switch(self, name: str) -> None:
+        """Sets the images in use aside, and continues with the images set
+        aside under the given name, or with no images if there are none.
+        Only the set put aside is kept, and any other is dropped.
+
+        Args:
+            name: Name of the set of images to use.
+        """
+        with RENDER_LOCK:
+            stored = self._stored.pop(name, ([], {}, {}, (0, 0, 0)))
+            self._stored = {self.name: (
+                self.sheets, self._regions, self._areas,
+                (self._x, self._y, self._row_height))}
+            self.sheets, self._regions, self._areas, cursor = stored
+            self._x, self._y, self._row_height = cursor
+            self.name = name
+
+    def save(self, directory: str) -> None:
+        """Writes the sheets as image files, along with an index of the packed
+        images.
+
+        The index is written last, so an interrupted save is never loaded.
+
+        Args:
+            directory: Directory to write the files to.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for i, sheet in enumerate(self.sheets):
+            pygame.image.save(sheet, os.path.join(directory, f'{i}.png'))
+        index = {
+            'sheets': len(self.sheets),
+            'cursor': (self._x, self._y, self._row_height),
+            'areas': {key: (i, tuple(area))
+                      for key, (i, area) in self._areas.items()},
+        }
+        temp = os.path.join(directory, f'{INDEX}.tmp')
+        with open(temp, 'w', encoding='utf-8') as file_handler:
+            json.dump(index, file_handler)
+        os.replace(temp, os.path.join(directory, INDEX))
+
+    def load(self, directory: str) -> bool:
+        """Replaces the atlas' content with sheets written by `save`.
+
+        Args:
+            directory: Directory to read the files from.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            with open(os.path.join(directory, INDEX), 'r',
+                      encoding='utf-8') as file_handler:
+                index = json.load(file_handler)
+            sheets = [pygame.image.load(
+                          os.path.join(directory, f'{i}.png')).convert()
+                      for i in range(index['sheets'])]
+        except (OSError, ValueError, pygame.error):
+            return False
+
+        self.sheets = sheets
+        self._x, self._y, self._row_height = index['cursor']
+        self._areas = {key: (i, Rect(area))
+                       for key, (i, area) in index['areas'].items()}
+        self._regions = {key: sheets[i].subsurface(area)
+                         for key, (i, area) in self._areas.items()}
+        return True
+
+
+ATLAS = Atlas(name=str(LAYOUT.scale))
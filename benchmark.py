@@ -0,0 +1,235 @@
+import argparse
+import json
+import os
+from collections import deque
+from random import Random
+from statistics import mean, quantiles
+from time import perf_counter
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import pygame
+from pygame.rect import Rect
+
+from periodical.bots import greedy
+from periodical.catalog import get_catalog
+from periodical.config import (Action, Board, END_TURN, ENERGY, HAND, LAB,
+                               MARKET, PATH, TABLE, Zone)
+from periodical.game import Game
+from periodical.simulate import MAX_ACTIONS
+
+
+EVENT = Tuple[str, Dict[str, Any]]
+SCRIPT = List[List[EVENT]]
+DISCARD_SIZES = 10, 100, 500
+FRAMES = 600
+WARMUP = 30
+DRAG_FRAMES = 20
+IDLE_FRAMES = 5
+TARGETS = {Action.HARVEST: MARKET, Action.SYNTHESIZE: LAB, Action.BUY: HAND,
+           Action.PLAY: TABLE}
+
+
+def _click(pos: Tuple[int, int]) -> SCRIPT:
+    """Returns the frames of a left click.
+
+    Args:
+        pos: Position to click.
+
+    Returns:
+        Events of each frame.
+    """
+    return [[('MOUSEBUTTONDOWN', {'pos': pos, 'button': 1})],
+            [('MOUSEBUTTONUP', {'pos': pos, 'button': 1})]]
+
+
+def _drag(start: Tuple[int, int], end: Tuple[int, int]) -> SCRIPT:
+    """Returns the frames of a left button drag, moving once per frame.
+
+    Args:
+        start: Position to press the button at.
+        end: Position to release the button at.
+
+    Returns:
+        Events of each frame.
+    """
+    frames: SCRIPT = [[('MOUSEBUTTONDOWN', {'pos': start, 'button': 1})]]
+    previous = start
+    for step in range(1, DRAG_FRAMES + 1):
+        pos = (start[0] + (end[0] - start[0]) * step // DRAG_FRAMES,
+               start[1] + (end[1] - start[1]) * step // DRAG_FRAMES)
+        frames.append([('MOUSEMOTION', {
+            'pos': pos, 'rel': (pos[0] - previous[0], pos[1] - previous[1]),
+            'buttons': (1, 0, 0)})])
+        previous = pos
+    frames.append([('MOUSEBUTTONUP', {'pos': end, 'button': 1})])
+    return frames
+
+
+def _center(board: Board) -> Tuple[int, int]:
+    """Returns the center of a board."""
+    return Rect(board.pos, board.size).center
+
+
+class ScriptedInput:
+    """A class for playing the board by posting events to the queue once per
+    frame, and timing each frame.
+
+    Events are taken from `script` if given, or else generated by playing
+    the greedy strategy through the interface: cards are dragged from hand
+    to market and lab, from market to hand, and the buttons are clicked.
+    Every step is followed by a few idle frames.
+
+    Attributes:
+        frames: Amount of frames to play before quitting.
+        recorded: Events posted each frame, replayable as a script.
+        times: Duration of each frame in seconds.
+        discards: Size of the current player's discard pile each frame.
+    """
+    def __init__(self, game: Game, frames: int = FRAMES,
+                 script: Optional[SCRIPT] = None, seed: int = 0) -> None:
+        self.frames = frames if script is None else min(frames, len(script))
+        self.recorded: SCRIPT = []
+        self.times: List[float] = []
+        self.discards: List[int] = []
+        self._game = game
+        self._script = script
+        self._pending: Deque[List[EVENT]] = deque()
+        self._random = Random(seed)
+        self._actions = 0
+        self._last: Optional[float] = None
+
+    def _plan(self) -> SCRIPT:
+        """Returns the frames of the strategy's next move.
+
+        Returns:
+            Events of each frame.
+        """
+        game = self._game
+        action, number = greedy(game, self._random)
+        self._actions += 1
+        if self._actions >= MAX_ACTIONS:
+            action = Action.END_TURN
+        if action is Action.END_TURN:
+            self._actions = 0
+            frames = _click(END_TURN.pos)  # type: ignore
+        elif action is Action.MULLIGAN:
+            frames = _click(ENERGY.pos)  # type: ignore
+        else:
+            cards = (game.get_market() if action is Action.BUY
+                     else game.current_player.get_hand())
+            card = next(card for card in cards if card.number == number)
+            frames = _drag(card.rect.center, _center(TARGETS[action]))
+        return frames + [[] for _ in range(IDLE_FRAMES)]
+
+    def __call__(self) -> None:
+        """Times the frame just displayed and posts the next frame's events.
+        Passed to `Game.show_board`."""
+        now = perf_counter()
+        if self._last is not None:
+            self.times.append(now - self._last)
+        self.discards.append(len(self._game.current_player.get_discard()))
+        frame = len(self.recorded)
+        if frame >= self.frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+            return
+        if self._script is not None:
+            events = self._script[frame]
+        else:
+            if not self._pending:
+                self._pending.extend(self._plan())
+            events = self._pending.popleft()
+        self.recorded.append(events)
+        for name, attributes in events:
+            attributes = {key: tuple(value) if isinstance(value, list)
+                          else value for key, value in attributes.items()}
+            pygame.event.post(pygame.event.Event(getattr(pygame, name),
+                                                 attributes))
+        self._last = perf_counter()
+
+
+def _percentile(times: List[float], percent: int) -> float:
+    """Returns a percentile of frame times in milliseconds."""
+    if len(times) < 2:
+        return 1000 * times[0] if times else 0.0
+    return 1000 * quantiles(times, n=100)[percent - 1]
+
+
+def run(discard: int, frames: int = FRAMES, script: Optional[SCRIPT] = None,
+        seed: int = 0) -> ScriptedInput:
+    """Plays the board with scripted input, starting with the current
+    player's discard pile holding the given amount of cards.
+
+    Args:
+        discard: Amount of cards to add to the discard pile.
+        frames: Amount of frames to play.
+        script: Events of each frame, generated if not given.
+        seed: Seed of the game and of the generated input.
+
+    Returns:
+        The input, holding the timing of each frame.
+    """
+    game = Game('benchmark', seed=seed)
+    game.setup()
+    catalog = get_catalog(PATH)
+    numbers = catalog.numbers()
+    for i in range(discard):
+        game.current_player.interact_with_discard(
+            catalog.create_card(numbers[i % len(numbers)], Zone.DISCARD),
+            True)
+    scripted = ScriptedInput(game, frames, script, seed)
+    game.show_board(scripted)
+    return scripted
+
+
+def report(results: Dict[int, ScriptedInput], warmup: int = WARMUP) -> str:
+    """Returns a summary of frame times of each run.
+
+    Args:
+        results: Input of each run, by starting discard pile size.
+        warmup: Amount of frames to ignore at the start of each run.
+
+    Returns:
+        Human readable table of frame times.
+    """
+    lines = [f'{"discard":>8} {"mean":>6} {"frames":>7} {"fps":>7} '
+             f'{"p50 ms":>7} {"p90 ms":>7} {"p99 ms":>7} {"max ms":>7}']
+    for discard, scripted in results.items():
+        times = scripted.times[warmup:]
+        fps = len(times) / sum(times) if times else 0.0
+        lines.append(
+            f'{discard:>8} {mean(scripted.discards or [0]):>6.0f} '
+            f'{len(times):>7} {fps:>7.1f} {_percentile(times, 50):>7.2f} '
+            f'{_percentile(times, 90):>7.2f} {_percentile(times, 99):>7.2f} '
+            f'{1000 * max(times, default=0):>7.2f}')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measures frame times of the board under scripted input.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DISCARD_SIZES,
+                        help='discard pile sizes to measure')
+    parser.add_argument('--frames', type=int, default=FRAMES)
+    parser.add_argument('--warmup', type=int, default=WARMUP,
+                        help='frames to ignore at the start of each run')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--script', help='json file of events to replay')
+    parser.add_argument('--record',
+                        help='json file to save the generated events to')
+    args = parser.parse_args()
+
+    # importing the package initialized the display with the default
+    # driver, so it is restarted with the dummy one
+    pygame.display.quit()
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    script = None
+    if args.script:
+        with open(args.script, 'r', encoding='utf-8') as file_handler:
+            script = json.load(file_handler)
+    results = {size: run(size, args.frames, script, args.seed)
+               for size in args.sizes}
+    if args.record:
+        with open(args.record, 'w', encoding='utf-8') as file_handler:
+            json.dump(next(iter(results.values())).recorded, file_handler)
+    print(report(results, args.warmup))
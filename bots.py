@@ -0,0 +1,134 @@
+from collections import deque
+from random import Random
+from typing import Callable, Deque, Dict, List
+from weakref import WeakKeyDictionary
+
+from periodical.card import Card
+from periodical.config import Action, MOVE, OPENINGS_PATH
+from periodical.game import Game
+from periodical.openings import get_book, is_opening
+
+
+STRATEGY = Callable[[Game, Random], MOVE]
+_PLANS: 'WeakKeyDictionary[Game, Deque[MOVE]]' = WeakKeyDictionary()
+
+
+def _get_new_elements(game: Game) -> List[Card]:
+    """Returns cards in the current player's hand depicting elements which
+    aren't in their lab.
+
+    Args:
+        game: Game to inspect.
+
+    Returns:
+        List of cards in hand depicting elements new to the lab.
+    """
+    player = game.current_player
+    lab = {card.number for card in player.get_lab()}
+    return [card for card in player.get_hand() if card.number not in lab]
+
+
+def _buy_or_end(game: Game, choose: Callable[[List[Card]], Card]) -> MOVE:
+    """Returns a move buying a card chosen from the affordable ones, or ending
+    the turn if none is affordable.
+
+    Args:
+        game: Game to inspect.
+        choose: Function choosing a card out of the affordable cards.
+
+    Returns:
+        Move to perform.
+    """
+    affordable = game.get_affordable()
+    if affordable:
+        return Action.BUY, choose(affordable).number
+    return Action.END_TURN, 0
+
+
+def random_strategy(game: Game, rng: Random) -> MOVE:
+    """Chooses a random legal move.
+
+    Args:
+        game: Game to inspect.
+        rng: Random number generator to use.
+
+    Returns:
+        Move to perform.
+    """
+    return rng.choice(game.get_moves())
+
+
+def greedy(game: Game, rng: Random) -> MOVE:
+    """Synthesizes the heaviest element new to the lab, harvests the rest of
+    the hand and buys the heaviest affordable card.
+
+    Args:
+        game: Game to inspect.
+        rng: Random number generator to use.
+
+    Returns:
+        Move to perform.
+    """
+    player = game.current_player
+    new = _get_new_elements(game)
+    if player.can_synthesize() and new:
+        return Action.SYNTHESIZE, max(new).number
+    hand = player.get_hand()
+    if hand:
+        return Action.HARVEST, hand[0].number
+    return _buy_or_end(game, lambda cards: max(cards, key=lambda x: x.mass))
+
+
+def collector(game: Game, rng: Random) -> MOVE:
+    """Synthesizes the lightest element new to the lab, harvests the rest of
+    the hand and buys the heaviest affordable element new to the lab, or any
+    heaviest affordable card if there is none.
+
+    Args:
+        game: Game to inspect.
+        rng: Random number generator to use.
+
+    Returns:
+        Move to perform.
+    """
+    player = game.current_player
+    new = _get_new_elements(game)
+    if player.can_synthesize() and new:
+        return Action.SYNTHESIZE, min(new).number
+    hand = player.get_hand()
+    if hand:
+        return Action.HARVEST, hand[0].number
+    owned = {card.number for card in player.get_lab()}
+    return _buy_or_end(game, lambda cards: max(
+        cards, key=lambda x: (x.number not in owned, x.mass)))
+
+
+def book(game: Game, rng: Random) -> MOVE:
+    """Follows the opening book's line in the first turn, and plays like the
+    greedy strategy otherwise, or if there is no opening book.
+
+    Args:
+        game: Game to inspect.
+        rng: Random number generator to use.
+
+    Returns:
+        Move to perform.
+    """
+    opening = get_book(OPENINGS_PATH)
+    if opening and is_opening(game.current_player):
+        _PLANS[game] = deque(opening.suggest(game) or ())
+    plan = _PLANS.get(game)
+    while plan:
+        move = plan.popleft()
+        if move in game.get_moves():
+            return move
+        plan.clear()
+    return greedy(game, rng)
+
+
+STRATEGIES: Dict[str, STRATEGY] = {
+    'random': random_strategy,
+    'greedy': greedy,
+    'collector': collector,
+    'book': book,
+}
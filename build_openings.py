@@ -0,0 +1,222 @@
+import argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from periodical.card import Card
+from periodical.catalog import get_catalog
+from periodical.config import (Action, LIGHT_END, LIGHT_START,
+                               OPENINGS_PATH, PATH, STARTING_END)
+from periodical.game import Game
+from periodical.openings import (enumerate_hands, enumerate_markets, LINE,
+                                 OpeningBook)
+
+
+LAB_WEIGHT = 100
+MAX_SEEDS = 1 << 20
+RESULT = Tuple[int, LINE]
+KEY = Tuple[Tuple[int, ...], int, bool, Tuple[int, ...], Tuple[int, ...]]
+
+
+def _buyable(game: Game, revealed: Set[int]) -> List[Card]:
+    """Returns the market cards which may be bought in the first turn: the
+    general market, which is always the same, and the light market cards
+    revealed before the turn.
+
+    Cards refilling the light market during the turn are left out, even if
+    equal to a revealed card. They are appended after the revealed cards,
+    and buying an element takes its first card, so a revealed card is
+    bought as long as one is left.
+
+    Args:
+        game: Game in the position.
+        revealed: Ids of the light market cards revealed before the turn.
+
+    Returns:
+        Cards which may be bought.
+    """
+    return list(game.general_market) + [card for card in game.light_market
+                                        if id(card) in revealed]
+
+
+def _key(game: Game, buyable: List[Card]) -> KEY:
+    """Returns the parts of a first turn position which affect its value.
+
+    Market cards costing more than the hand can still harvest are left out,
+    so positions differing only by them share their value.
+
+    Args:
+        game: Game in the position.
+        buyable: Market cards which may be bought.
+
+    Returns:
+        Hand, energy, syntheses left, lab and buyable market.
+    """
+    player = game.current_player
+    hand = tuple(sorted(card.number for card in player.get_hand()))
+    energy = player.effects.energy
+    reach = player.get_energy() + sum(max(number, energy[number])
+                                      for number in hand)
+    return (hand, player.get_energy(), player.get_syntheses(),
+            tuple(sorted(card.number for card in player.get_lab())),
+            tuple(sorted(card.number for card in buyable
+                         if card.mass <= reach)))
+
+
+def search(game: Game, revealed: Set[int],
+           memo: Dict[KEY, RESULT]) -> RESULT:
+    """Returns the best rest of a first turn, found by exhausting the moves
+    with `Game.make` and `Game.unmake`.
+
+    Each element new to the lab is worth `LAB_WEIGHT`, and each card bought
+    its atomic number, the energy it harvests in later turns. Moves whose
+    outcome depends on unrevealed cards aren't considered: buying elements
+    revealed during the turn, or playing cards which draw.
+
+    Args:
+        game: Game in the position to search from.
+        revealed: Ids of the light market cards revealed before the turn,
+                  kept alive by the caller.
+        memo: Results of positions already searched, by `_key`.
+
+    Returns:
+        Value of the best line, and its moves, ending the turn.
+    """
+    cards = _buyable(game, revealed)
+    key = _key(game, cards)
+    if key in memo:
+        return memo[key]
+    buyable = {card.number for card in cards}
+    player = game.current_player
+    lab = {card.number for card in player.get_lab()}
+    best: RESULT = (0, ((Action.END_TURN, 0),))
+    for action, number in game.get_moves():
+        if (action is Action.END_TURN or action is Action.MULLIGAN
+                or action is Action.BUY and number not in buyable
+                or action is Action.PLAY
+                and player.effects.get_draws(number)):
+            continue
+        if action is Action.SYNTHESIZE:
+            gain = LAB_WEIGHT if number not in lab else 0
+        else:
+            gain = number if action is Action.BUY else 0
+        undo = game.make(action, number)
+        if undo is None:
+            continue
+        value, line = search(game, revealed, memo)
+        game.unmake(undo)
+        if gain + value > best[0]:
+            best = (gain + value, ((action, number),) + line)
+    memo[key] = best
+    return best
+
+
+def find_seeds(hands: List[Tuple[int, ...]]) -> Dict[Tuple[int, ...], int]:
+    """Returns a seed dealing each opening hand.
+
+    Args:
+        hands: Sorted atomic numbers of each hand.
+
+    Returns:
+        Seed of a game opening with each hand.
+
+    Raises:
+        ValueError: If some hand wasn't dealt within `MAX_SEEDS` games.
+    """
+    seeds: Dict[Tuple[int, ...], int] = {}
+    missing = set(hands)
+    for seed in range(MAX_SEEDS):
+        if not missing:
+            return seeds
+        game = Game('book', seed=seed)
+        game.setup()
+        hand = tuple(sorted(card.number
+                            for card in game.current_player.get_hand()))
+        if hand in missing:
+            missing.remove(hand)
+            seeds[hand] = seed
+    raise ValueError(f'{len(missing)} hands were never dealt')
+
+
+def evaluate_hand(seed: int,
+                  markets: List[Tuple[int, ...]]) -> List[RESULT]:
+    """Returns the best first turn, without a mulligan, of a hand against
+    each light market.
+
+    Args:
+        seed: Seed of a game opening with the hand.
+        markets: Sorted atomic numbers of each light market.
+
+    Returns:
+        Value and line of each market.
+    """
+    game = Game('book', seed=seed)
+    game.setup()
+    snapshot = game.get_snapshot()
+    # the cards dealt to the light market and the deck, in dealing order
+    light = snapshot['light_market'] + snapshot['light_deck']
+    memo: Dict[KEY, RESULT] = {}
+    results = []
+    for market in markets:
+        deck = list(light)
+        for number in market:
+            deck.remove(number)
+        snapshot['light_market'] = list(market)
+        snapshot['light_deck'] = deck
+        game.load_snapshot(snapshot)
+        dealt = list(game.light_market)
+        revealed = {id(card) for card in dealt}
+        results.append(search(game, revealed, memo))
+    return results
+
+
+def build(workers: Optional[int] = None) -> OpeningBook:
+    """Evaluates every opening and returns the resulting book.
+
+    The best line of a hand is compared with that of the hand a mulligan
+    deals, the rest of the starting deck, against the same market.
+
+    Args:
+        workers: Amount of processes to use, defaults to the CPU count.
+
+    Returns:
+        The book.
+    """
+    catalog = get_catalog(PATH)
+    starting = catalog.numbers(last=STARTING_END)
+    light = catalog.numbers(LIGHT_START, LIGHT_END)
+    hands = enumerate_hands(starting)
+    markets = enumerate_markets(light)
+    seeds = find_seeds(hands)
+    with ProcessPoolExecutor(workers) as pool:
+        results = list(pool.map(evaluate_hand,
+                                [seeds[hand] for hand in hands],
+                                [markets] * len(hands)))
+
+    index = {hand: i for i, hand in enumerate(hands)}
+    lines: List[LINE] = []
+    line_index: Dict[LINE, int] = {}
+    table = array('H')
+    for i, hand in enumerate(hands):
+        rest = results[index[tuple(sorted(set(starting) - set(hand)))]]
+        for j in range(len(markets)):
+            value, line = results[i][j]
+            if rest[j][0] > value:
+                line = ((Action.MULLIGAN, 0),) + rest[j][1]
+            if line not in line_index:
+                line_index[line] = len(lines)
+                lines.append(line)
+            table.append(line_index[line])
+    return OpeningBook(starting, light, lines, table)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Evaluates every opening and writes the opening book.')
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--out', default=OPENINGS_PATH)
+    args = parser.parse_args()
+
+    book = build(args.workers)
+    book.save(args.out)
+    print(f'{len(book.lines)} distinct lines written to {args.out}')
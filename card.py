@@ -2,9 +2,9 @@ from typing import List
 from pygame.rect import Rect
 from pygame.surface import Surface
 
-from periodical.config import (BLACK_FONT, CARD, CARD_BORDER, COLORS, FONT,
-                               MEGA_CARD, Size, SMALL_FONT, SMALLER_FONT,
-                               SMALLEST_FONT, WHITE_FONT, Zone)
+from periodical.atlas import ATLAS
+from periodical.config import (BLACK_FONT, CARD, COLORS, LAYOUT, MEGA_CARD,
+                               Size, WHITE_FONT, Zone)
 
 
 class Card:
@@ -27,6 +27,7 @@ class Card:
         self.category = category.title()
         self.shells = shells
         self.zone = zone
+        self.rect = Rect((0, 0), CARD.size)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Card):
@@ -41,20 +42,51 @@ class Card:
     def __gt__(self, other: 'Card') -> bool:
         return self.number > other.number
 
+    def _key(self, kind: str) -> str:
+        """Returns the name of one of the card's images in the atlas.
+
+        Args:
+            kind: Kind of image.
+
+        Returns:
+            Unique name of the image.
+        """
+        return f'{kind}/{self.number}/{self.symbol}'
+
     def render(self) -> None:
-        """Creates an image of the card for pygame visualization."""
-        self.rect = Rect((0, 0), CARD.size)
-        card = border_and_fill(CARD, self.category, CARD_BORDER)
+        """Sets an image of the card for pygame visualization."""
+        self.rect.size = CARD.size
+        self.img = ATLAS.fetch(self._key('card'), self._draw)
+
+    def mega_render(self) -> None:
+        """Sets a large image of the card for pygame visualization, including
+        extra information."""
+        self.rect.size = MEGA_CARD.size
+        self.img = ATLAS.fetch(self._key('mega_card'), self._draw_mega)
+
+    def prerender(self) -> None:
+        """Draws both images of the card into the atlas in advance, without
+        changing the card itself."""
+        ATLAS.fetch(self._key('card'), self._draw)
+        ATLAS.fetch(self._key('mega_card'), self._draw_mega)
+
+    def _draw(self) -> Surface:
+        """Creates an image of the card.
+
+        Returns:
+            Image of the card.
+        """
+        card = border_and_fill(CARD, self.category, LAYOUT.card_border)
 
         center = card.get_rect().center
         centerx = card.get_rect().centerx
 
-        symbol = FONT.render(self.symbol, *BLACK_FONT)
+        symbol = LAYOUT.font.render(self.symbol, *BLACK_FONT)
         symbol_pos = symbol.get_rect(center=center)
-        number = FONT.render(str(self.number), *BLACK_FONT)
+        number = LAYOUT.font.render(str(self.number), *BLACK_FONT)
         number_pos = number.get_rect(
             centerx=centerx, centery=symbol_pos.top / 1.5)
-        mass = FONT.render(str(self.mass), *WHITE_FONT)
+        mass = LAYOUT.font.render(str(self.mass), *WHITE_FONT)
         mass_pos = mass.get_rect(
             centerx=centerx, centery=(CARD.height - symbol_pos.bottom) * 2)
 
@@ -62,27 +94,31 @@ class Card:
                          (symbol, symbol_pos)):
             card.blit(obj, pos)
 
-        self.img = card
+        return card
 
-    def mega_render(self) -> None:
-        """Creates a large image of the card for pygame visualization,
-        including extra information."""
-        self.rect = Rect((0, 0), MEGA_CARD.size)
-        card = border_and_fill(MEGA_CARD, self.category, CARD_BORDER)
+    def _draw_mega(self) -> Surface:
+        """Creates a large image of the card, including extra information.
+
+        Returns:
+            Large image of the card.
+        """
+        card = border_and_fill(MEGA_CARD, self.category, LAYOUT.card_border)
 
         rect = card.get_rect()
         row = {i: (rect.height / 6) * i for i in range(1, 7)}
 
-        names_font = SMALLER_FONT if len(self.name) >= 11 else SMALL_FONT
-        shells_font = SMALLEST_FONT if len(self.shells) >= 6 else SMALL_FONT
+        names_font = (LAYOUT.smaller_font if len(self.name) >= 11
+                      else LAYOUT.small_font)
+        shells_font = (LAYOUT.smallest_font if len(self.shells) >= 6
+                       else LAYOUT.small_font)
 
-        number = FONT.render(str(self.number), *BLACK_FONT)
+        number = LAYOUT.font.render(str(self.number), *BLACK_FONT)
         number_pos = number.get_rect(centerx=rect.centerx, centery=row[1])
-        symbol = FONT.render(self.symbol, *BLACK_FONT)
+        symbol = LAYOUT.font.render(self.symbol, *BLACK_FONT)
         symbol_pos = symbol.get_rect(centerx=rect.centerx, centery=row[2])
         name = names_font.render(self.name, *BLACK_FONT)
         name_pos = name.get_rect(centerx=rect.centerx, centery=row[3])
-        mass = SMALL_FONT.render(str(self.mass), *WHITE_FONT)
+        mass = LAYOUT.small_font.render(str(self.mass), *WHITE_FONT)
         mass_pos = mass.get_rect(centerx=rect.centerx, centery=row[4])
         shells = shells_font.render(
             '-'.join([str(shell) for shell in self.shells]), *WHITE_FONT)
@@ -93,7 +129,7 @@ class Card:
                          (shells, shells_pos)):
             card.blit(obj, pos)
 
-        self.img = card
+        return card
 
 
 def border_and_fill(size: Size, category: str, width: int = 0) -> Surface:
@@ -0,0 +1,210 @@
+import json
+import re
+import warnings
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from periodical.card import Card
+from periodical.config import Zone
+
+
+CHUNK = 1 << 16
+MAX_RECORD = 1 << 20
+SEPARATOR = re.compile(r'[\s,]*')
+FIELDS = {
+    'name': str,
+    'symbol': str,
+    'number': int,
+    'atomic_mass': (int, float),
+    'category': str,
+    'shells': list,
+    'xpos': int,
+    'ypos': int,
+}
+RECORD = Tuple[str, str, int, float, str, Tuple[int, ...]]
+# the real elements file ends with a predicted element, laid out on the row
+# left empty between the periodic table and its f-block
+EXTRA_NUMBER = 119
+EXTRA_ROW = 8
+
+
+def validate_element(element: Any, index: int) -> Dict[str, Any]:
+    """Checks that an element record matches the catalog's schema.
+
+    Args:
+        element: Record to check.
+        index: Record's position in the catalog, for error messages.
+
+    Returns:
+        The record, if valid.
+
+    Raises:
+        ValueError: If a field is missing or of the wrong type.
+    """
+    if not isinstance(element, dict):
+        raise ValueError(f'element #{index} is not an object')
+    for field, kind in FIELDS.items():
+        value = element.get(field)
+        if not isinstance(value, kind) or isinstance(value, bool):
+            raise ValueError(f'element #{index} has invalid field {field!r}')
+    if not all(isinstance(shell, int) for shell in element['shells']):
+        raise ValueError(f'element #{index} has invalid field \'shells\'')
+    return element
+
+
+def iter_elements(path: str) -> Iterator[Dict[str, Any]]:
+    """Yields validated element records one at a time from a json file shaped
+    `{"elements": [...]}`, without reading the entire file into memory.
+
+    Args:
+        path: Path to json file.
+
+    Yields:
+        Complete details of each element.
+
+    Raises:
+        ValueError: If the file is malformed or a record is invalid.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as file_handler:
+        buffer = ''
+        start = -1
+        while start == -1 or '[' not in buffer[start:]:
+            chunk = file_handler.read(CHUNK)
+            if not chunk:
+                raise ValueError(f'{path} has no element list')
+            buffer += chunk
+            start = buffer.find('"elements"')
+        position = buffer.index('[', start) + 1
+
+        index = 0
+        eof = False
+        while True:
+            position = SEPARATOR.match(buffer, position).end()
+            if buffer.startswith(']', position):
+                return
+            try:
+                element, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # the record may be cut off at the end of the chunk
+                buffer = buffer[position:]
+                position = 0
+                if eof or len(buffer) > MAX_RECORD:
+                    raise ValueError(
+                        f'{path} has a malformed element #{index}')
+                chunk = file_handler.read(CHUNK)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield validate_element(element, index)
+            index += 1
+
+
+def is_extra_element(element: Dict[str, Any]) -> bool:
+    """Returns whether or not a record is the real elements file's extra
+    entry, which isn't played nor shown in the periodic table.
+
+    Args:
+        element: Validated record.
+
+    Returns:
+        True if the record is the extra entry, False otherwise.
+    """
+    return element['number'] == EXTRA_NUMBER and element['ypos'] == EXTRA_ROW
+
+
+class Catalog:
+    """A class for representing all elements cards can depict.
+
+    Only the details needed for cards are kept, keyed by atomic number.
+    The real elements file's extra entry is left out, as are elements
+    numbered above `limit`, if given, with a warning.
+
+    Attributes:
+        first: Smallest atomic number in the catalog.
+        last: Largest atomic number in the catalog.
+    """
+    def __init__(self, path: str, limit: Optional[int] = None) -> None:
+        self._records: Dict[int, RECORD] = {}
+        dropped = 0
+        for element in iter_elements(path):
+            if is_extra_element(element):
+                continue
+            if limit is not None and element['number'] > limit:
+                dropped += 1
+                continue
+            self._records[element['number']] = (
+                element['name'], element['symbol'], element['number'],
+                element['atomic_mass'], element['category'],
+                tuple(element['shells']))
+        if dropped:
+            warnings.warn(f'{path} has {dropped} elements numbered above '
+                          f'{limit}, left out')
+        if not self._records:
+            raise ValueError(f'{path} has no elements')
+        self._numbers = sorted(self._records)
+        self.first = self._numbers[0]
+        self.last = self._numbers[-1]
+
+    def __contains__(self, number: object) -> bool:
+        return number in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def numbers(self, first: Optional[int] = None,
+                last: Optional[int] = None) -> List[int]:
+        """Returns the atomic numbers within the range, in ascending order.
+
+        Args:
+            first: Smallest number to include, defaults to the catalog's.
+            last: Largest number to include, defaults to the catalog's.
+
+        Returns:
+            List of atomic numbers.
+        """
+        start = 0 if first is None else bisect_left(self._numbers, first)
+        end = (len(self._numbers) if last is None
+               else bisect_right(self._numbers, last))
+        return self._numbers[start:end]
+
+    def create_card(self, number: int, zone: Zone = Zone.LIMBO) -> Card:
+        """Returns a new card depicting the element.
+
+        Args:
+            number: Element's atomic number.
+            zone: Card's zone.
+
+        Returns:
+            Card depicting the element.
+        """
+        name, symbol, number, mass, category, shells = self._records[number]
+        return Card(name, symbol, number, mass, category, list(shells), zone)
+
+    def create_cards(self, first: Optional[int] = None,
+                     last: Optional[int] = None) -> List[Card]:
+        """Returns list of cards based on the given range.
+
+        Args:
+            first: Number of first element to create a card for.
+            last: Number of last element to create a card for.
+
+        Returns:
+            List of cards each depicting a unique element.
+        """
+        return [self.create_card(number)
+                for number in self.numbers(first, last)]
+
+
+@lru_cache(maxsize=None)
+def get_catalog(path: str) -> Catalog:
+    """Returns the catalog stored in the json file, loading it only once.
+
+    Args:
+        path: Path to json file.
+
+    Returns:
+        Catalog of the elements in the file.
+    """
+    return Catalog(path)
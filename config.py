@@ -1,5 +1,6 @@
+import os
 from enum import Enum
-from typing import Any, List, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import pygame
 from pygame.font import Font
@@ -10,17 +11,28 @@ pygame.init()
 
 NUM = Union[int, float]
 CARD_IMG = List[Tuple[Surface, Rect]]
+MOVE = Tuple['Action', int]
+UNDO = Tuple[Any, ...]
 
 MIN_PLAYER_AMOUNT = 1
-ELEMENTS_AMOUNT = 118
+SYNTHESES_PER_TURN = 1
 LIGHT_AMOUNT = 4
 HEAVY_AMOUNT = 2
 LIGHT_START = 3
 LIGHT_END = 18
 GENERAL_END = 2
+STARTING_END = 10
 LIGHT_DECK_LIMIT = 3
 HEAVY_DECK_LIMIT = 5
 PATH = 'D:\\Yuval\\Game Design\\Periodical\\Source Material\\elements.json'
+EFFECTS_PATH = os.path.join(os.path.dirname(PATH), 'effects.json')
+OPENINGS_PATH = os.path.join(os.path.dirname(PATH), 'openings.book')
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.periodical', 'cache')
+# render caches kept on disk, one for each scale and look of the images
+CACHE_LIMIT = 8
+TRACK_ALLOCATIONS = bool(os.environ.get('PERIODICAL_TRACK_ALLOCATIONS'))
+RESIZABLE = bool(os.environ.get('PERIODICAL_RESIZABLE'))
+TELEMETRY_PATH = os.environ.get('PERIODICAL_TELEMETRY')
 COLORS = {
     'Reactive Nonmetal': (8, 163, 21),
     'Noble Gas': (255, 115, 201),
@@ -41,6 +53,7 @@ COLORS = {
     'end_turn': (150, 0, 20),
     'mulligan': (76, 189, 237),
     'energy': (49, 224, 142),
+    'affordable': (255, 215, 0),
 }
 
 
@@ -55,6 +68,16 @@ class Size:
     def __init__(self, width: Union[int, float], height: Union[int, float],
                  **kwargs: Any) -> None:
         super().__init__(**kwargs)  # type: ignore
+        self.resize(width, height)
+
+    def resize(self, width: Union[int, float],
+               height: Union[int, float]) -> None:
+        """Changes the rectangle's size in place.
+
+        Args:
+            width: Rectangle's new width.
+            height: Rectangle's new height.
+        """
         self.width = width
         self.height = height
         self.size = width, height
@@ -71,6 +94,15 @@ class Pos:
     def __init__(self, x: Union[int, float], y: Union[int, float],
                  **kwargs: Any) -> None:
         super().__init__(**kwargs)  # type: ignore
+        self.move(x, y)
+
+    def move(self, x: Union[int, float], y: Union[int, float]) -> None:
+        """Changes the rectangle's position in place.
+
+        Args:
+            x: Rectangle's new x position.
+            y: Rectangle's new y position.
+        """
         self.x = x
         self.y = y
         self.pos = x, y
@@ -82,42 +114,148 @@ class Board(Size, Pos):
     pass
 
 
-CARD = Size(width=75, height=100)
-MEGA_CARD = Size(width=CARD.width * 1.35, height=CARD.height * 1.35)
-SPACE = CARD.width / 5
-main_width = int(CARD.width * 5 + SPACE * 6)
-main_height = int(CARD.height * 2 + SPACE * 3)
-side_width = int(CARD.height + SPACE * 2)
-button_area_height = CARD.height
-SCREEN = Size(width=main_width + side_width * 3,
-              height=main_height * 2 + button_area_height)
-LAB = Board(width=side_width, height=SCREEN.height, x=0, y=0)
-MARKET = Board(width=main_width, height=main_height,
-               x=side_width, y=0)
-HAND = Board(width=main_width, height=main_height,
-             x=side_width, y=main_height)
-TABLE = Board(width=side_width, height=SCREEN.height,
-              x=main_width + side_width, y=0)
-DISCARD = Board(width=side_width, height=SCREEN.height,
-                x=main_width + side_width * 2, y=0)
-BUTTON_AREA = Board(width=main_width, height=button_area_height,
-                    x=side_width, y=SCREEN.height - button_area_height)
-
-BUTTON = Size(width=CARD.width * 2.5, height=CARD.height / 2)
-button_height = SCREEN.height - BUTTON.height
-button_space = (main_width - BUTTON.width * 2) / 3
-ENERGY = Pos(x=side_width + main_width - BUTTON.width / 2 - button_space,
-             y=button_height)
-END_TURN = Pos(x=side_width + BUTTON.width / 2 + button_space,
-               y=button_height)
-
-BUTTON_BORDER = 5
-CARD_BORDER = 3
-
-FONT = Font(None, 36)
-SMALL_FONT = Font(None, 22)
-SMALLER_FONT = Font(None, 20)
-SMALLEST_FONT = Font(None, 17)
+class Layout:
+    """A class for representing the lengths and fonts of the current scale.
+
+    Attributes:
+        scale: Factor all lengths are scaled by.
+        space: Space between cards.
+        card_border: Width of a card's border.
+        button_border: Width of a button's border.
+        highlight_width: Width of the frame of highlighted cards.
+        font: Font of card titles.
+        small_font: Font of card details.
+        smaller_font: Font of long card details.
+        smallest_font: Font of the longest card details.
+        cell_font: Font of periodic table cells.
+        mode_font: Font of the periodic table's mode button.
+    """
+    def __init__(self) -> None:
+        self.scale = 0.0
+
+
+FONT_SIZE = 36
+SMALL_FONT_SIZE = 22
+SMALLER_FONT_SIZE = 20
+SMALLEST_FONT_SIZE = 17
+CELL_FONT_SIZE = 24
+MODE_FONT_SIZE = 18
+# path of the font file, or None for pygame's default font
+FONT_FACE: Optional[str] = None
+BASE_CARD_BORDER = 3
+BASE_BUTTON_BORDER = 5
+TABLE_BORDER = 1
+BASE_CARD = Size(width=75, height=100)
+BASE_CELL = Size(width=40, height=50)
+BASE_SHELL_HEIGHT = 80
+SCALE_STEP = 0.05
+MIN_SCALE = 0.5
+
+LAYOUT = Layout()
+CARD = Size(0, 0)
+MEGA_CARD = Size(0, 0)
+HIGHLIGHT = Size(0, 0)
+SCREEN = Size(0, 0)
+LAB = Board(width=0, height=0, x=0, y=0)
+MARKET = Board(width=0, height=0, x=0, y=0)
+HAND = Board(width=0, height=0, x=0, y=0)
+TABLE = Board(width=0, height=0, x=0, y=0)
+DISCARD = Board(width=0, height=0, x=0, y=0)
+BUTTON_AREA = Board(width=0, height=0, x=0, y=0)
+BUTTON = Size(0, 0)
+ENERGY = Pos(0, 0)
+END_TURN = Pos(0, 0)
+CELL = Size(0, 0)
+SHELL = Size(0, 0)
+
+
+def _scaled(length: NUM, scale: float) -> int:
+    """Returns a length scaled and rounded, but no shorter than 1."""
+    return max(round(length * scale), 1)
+
+
+def set_scale(scale: float) -> None:
+    """Lays out the screen for a scale factor. All sizes and positions are
+    changed in place, so modules importing them see the new layout.
+
+    Images rendered at the previous scale aren't affected, see
+    `periodical.utils.apply_scale`.
+
+    Args:
+        scale: Factor to scale all lengths by, 1 being the original layout.
+    """
+    LAYOUT.scale = scale
+    CARD.resize(_scaled(BASE_CARD.width, scale),
+                _scaled(BASE_CARD.height, scale))
+    MEGA_CARD.resize(CARD.width * 1.35, CARD.height * 1.35)
+    LAYOUT.highlight_width = _scaled(4, scale)
+    HIGHLIGHT.resize(CARD.width + LAYOUT.highlight_width * 2,
+                     CARD.height + LAYOUT.highlight_width * 2)
+    LAYOUT.space = space = CARD.width / 5
+    main_width = int(CARD.width * 5 + space * 6)
+    main_height = int(CARD.height * 2 + space * 3)
+    side_width = int(CARD.height + space * 2)
+    button_area_height = CARD.height
+    SCREEN.resize(main_width + side_width * 3,
+                  main_height * 2 + button_area_height)
+    LAB.resize(side_width, SCREEN.height)
+    MARKET.resize(main_width, main_height)
+    MARKET.move(side_width, 0)
+    HAND.resize(main_width, main_height)
+    HAND.move(side_width, main_height)
+    TABLE.resize(side_width, SCREEN.height)
+    TABLE.move(main_width + side_width, 0)
+    DISCARD.resize(side_width, SCREEN.height)
+    DISCARD.move(main_width + side_width * 2, 0)
+    BUTTON_AREA.resize(main_width, button_area_height)
+    BUTTON_AREA.move(side_width, SCREEN.height - button_area_height)
+
+    BUTTON.resize(CARD.width * 2.5, CARD.height / 2)
+    button_height = SCREEN.height - BUTTON.height
+    button_space = (main_width - BUTTON.width * 2) / 3
+    ENERGY.move(side_width + main_width - BUTTON.width / 2 - button_space,
+                button_height)
+    END_TURN.move(side_width + BUTTON.width / 2 + button_space,
+                  button_height)
+    LAYOUT.button_border = _scaled(BASE_BUTTON_BORDER, scale)
+    LAYOUT.card_border = _scaled(BASE_CARD_BORDER, scale)
+
+    CELL.resize(_scaled(BASE_CELL.width, scale),
+                _scaled(BASE_CELL.height, scale))
+    SHELL.resize(CELL.width, _scaled(BASE_SHELL_HEIGHT, scale))
+
+    for name, size in (('font', FONT_SIZE), ('small_font', SMALL_FONT_SIZE),
+                       ('smaller_font', SMALLER_FONT_SIZE),
+                       ('smallest_font', SMALLEST_FONT_SIZE),
+                       ('cell_font', CELL_FONT_SIZE),
+                       ('mode_font', MODE_FONT_SIZE)):
+        setattr(LAYOUT, name, Font(FONT_FACE, _scaled(size, scale)))
+
+
+def get_scale(width: int, height: int) -> float:
+    """Returns the largest scale at which the screen fits in a window,
+    rounded down to a multiple of `SCALE_STEP` so that only a few scales
+    are ever rendered.
+
+    Args:
+        width: Window's width.
+        height: Window's height.
+
+    Returns:
+        Scale factor, at least `MIN_SCALE`.
+    """
+    scale = min(width / BASE_SCREEN.width, height / BASE_SCREEN.height)
+    steps = int(scale / SCALE_STEP + 1e-9)
+    return max(round(steps * SCALE_STEP, 2), MIN_SCALE)
+
+
+set_scale(1.0)
+BASE_SCREEN = Size(*SCREEN.size)
+
+BUTTONS = 'end_turn', 'mulligan', 'energy'
+BUTTON_CACHE_SIZE = 32
+TEXT_CACHE_SIZE = 256
+
 BLACK_FONT = (True, (10, 10, 10))
 WHITE_FONT = (True, (245, 245, 245))
 
@@ -135,3 +273,31 @@ class Zone(Enum):
     HEAVY_DECK = 8
     LIGHT_MARKET = 9
     HEAVY_MARKET = 10
+
+
+class Action(Enum):
+    """A class for indicating the actions a player can take."""
+    END_TURN = 0
+    MULLIGAN = 1
+    HARVEST = 2
+    SYNTHESIZE = 3
+    BUY = 4
+    PLAY = 5
+
+
+class Metric(Enum):
+    """A class for indicating the kinds of gameplay events recorded.
+
+    The value recorded with each event is the energy spent for `BUY`, the
+    energy harvested for `HARVEST` (negative when the card is returned to
+    hand), 1 for `SYNTHESIS` (-1 when returned), the market's zone value for
+    `REFILL`, the turn's duration in seconds for `TURN` and the energy after
+    the card's effect for `PLAY`.
+    """
+    BUY = 0
+    HARVEST = 1
+    SYNTHESIS = 2
+    MULLIGAN = 3
+    REFILL = 4
+    TURN = 5
+    PLAY = 6
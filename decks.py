@@ -1,17 +1,25 @@
 from abc import ABC
-from random import shuffle
-from typing import Any, Optional
+from random import Random, shuffle
+from typing import Any, List, Optional
 
 from periodical.card import Card
-from periodical.config import ELEMENTS_AMOUNT, Zone
+from periodical.catalog import get_catalog
+from periodical.config import PATH, STARTING_END, Zone
 from periodical.utils import generate_cards, move_zone
 
 
 class Deck(ABC):
-    """A class for representing a deck of cards."""
+    """A class for representing a deck of cards.
+
+    Cards drawn are only recorded while a mark is outstanding, and forgotten
+    once every mark is rewound to, so the record never outgrows the moves
+    being undone.
+    """
     def __init__(self, zone: Zone, *cards: Card,  **kwargs: Any) -> None:
         super().__init__(**kwargs)  # type: ignore
         self._cards = list(cards)
+        self._drawn: List[Card] = []
+        self._marks = 0
         move_zone(self._cards, zone)
 
     def __bool__(self) -> bool:
@@ -28,27 +36,161 @@ class Deck(ABC):
     def draw(self) -> Optional[Card]:
         """Draws a card from the deck, if possible."""
         try:
-            return self._cards.pop(0)
+            card = self._cards.pop(0)
         except IndexError:
             return None
+        if self._marks:
+            self._drawn.append(card)
+        return card
+
+    def mark(self) -> int:
+        """Returns the amount of cards recorded as drawn so far, to rewind
+        to. Every mark must be rewound to, most recent first."""
+        self._marks += 1
+        return len(self._drawn)
+
+    def _release(self) -> None:
+        """Releases the most recent mark, forgetting the cards drawn once no
+        mark is outstanding."""
+        self._marks -= 1
+        if not self._marks:
+            self._drawn.clear()
+
+    def rewind(self, mark: int) -> None:
+        """Puts the cards drawn since the mark back on top of the deck, in
+        their original order.
+
+        Args:
+            mark: Amount of cards drawn at the time, returned by `mark`.
+        """
+        while len(self._drawn) > mark:
+            card = self._drawn.pop()
+            card.zone = Zone.PLAYER_DECK
+            self._cards.insert(0, card)
+        self._release()
+
+    def peek(self, amount: Optional[int] = None) -> List[Card]:
+        """Returns the next cards to be drawn, without drawing them.
+
+        Args:
+            amount: Amount of cards to return, defaults to the entire deck.
+
+        Returns:
+            List of cards in drawing order.
+        """
+        return self._cards[:amount]
+
+    def shuffle(self, rng: Optional[Random] = None) -> None:
+        """Randomizes the order of cards in the deck.
 
-    def shuffle(self) -> None:
-        """Randomizes the order of cards in the deck."""
-        shuffle(self._cards)
+        Args:
+            rng: Random number generator to use, defaults to the global one.
+        """
+        if rng:
+            rng.shuffle(self._cards)
+        else:
+            shuffle(self._cards)
 
 
 class StartingDeck(Deck):
     """A class for representing a player's starting deck of cards."""
     def __init__(self, **kwargs: Any) -> None:
-        super().__init__(Zone.PLAYER_DECK, *generate_cards(last=10), **kwargs)
+        super().__init__(Zone.PLAYER_DECK,
+                         *generate_cards(last=STARTING_END), **kwargs)
 
 
 class MarketDeck(Deck):
-    """A class for representing a communal market deck of cards."""
+    """A class for representing a communal market deck of cards.
+
+    Only the atomic numbers of the cards are kept, and each card is created
+    from the element catalog once drawn.
+    """
     def __init__(self, amount: int, zone: Zone, *,
-                 first: int = 1, last: int = ELEMENTS_AMOUNT,
+                 first: Optional[int] = None, last: Optional[int] = None,
                  **kwargs: Any) -> None:
-        cards = []
-        for _ in range(amount):
-            cards.extend(generate_cards(first=first, last=last))
-        super().__init__(zone, *cards, **kwargs)
+        super().__init__(zone, **kwargs)
+        self._zone = zone
+        self._catalog = get_catalog(PATH)
+        self._numbers = self._catalog.numbers(first, last) * amount
+        self._drawn_numbers: List[int] = []
+
+    def __bool__(self) -> bool:
+        return len(self._numbers) != 0
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MarketDeck):
+            return super().__eq__(other)
+        return sorted(self._numbers) == sorted(other._numbers)
+
+    def draw(self) -> Optional[Card]:
+        """Draws a card from the deck, if possible."""
+        try:
+            number = self._numbers.pop(0)
+        except IndexError:
+            return None
+        if self._marks:
+            self._drawn_numbers.append(number)
+        return self._catalog.create_card(number, self._zone)
+
+    def mark(self) -> int:
+        """Returns the amount of cards recorded as drawn so far, to rewind
+        to. Every mark must be rewound to, most recent first."""
+        self._marks += 1
+        return len(self._drawn_numbers)
+
+    def _release(self) -> None:
+        """Releases the most recent mark, forgetting the numbers drawn as
+        well once no mark is outstanding."""
+        super()._release()
+        if not self._marks:
+            self._drawn_numbers.clear()
+
+    def rewind(self, mark: int) -> None:
+        """Puts the cards drawn since the mark back on top of the deck, in
+        their original order. Cards drawn are created anew when drawn again.
+
+        Args:
+            mark: Amount of cards drawn at the time, returned by `mark`.
+        """
+        while len(self._drawn_numbers) > mark:
+            self._numbers.insert(0, self._drawn_numbers.pop())
+        self._release()
+
+    def peek(self, amount: Optional[int] = None) -> List[Card]:
+        """Returns the next cards to be drawn, without drawing them.
+
+        Args:
+            amount: Amount of cards to return, defaults to the entire deck.
+
+        Returns:
+            List of cards in drawing order.
+        """
+        return [self._catalog.create_card(number, self._zone)
+                for number in self._numbers[:amount]]
+
+    def get_numbers(self) -> List[int]:
+        """Returns the atomic numbers of the cards in drawing order."""
+        return list(self._numbers)
+
+    def set_numbers(self, numbers: List[int]) -> None:
+        """Replaces the cards of the deck.
+
+        Args:
+            numbers: Atomic numbers of the new cards in drawing order.
+        """
+        self._numbers = list(numbers)
+        self._drawn_numbers = []
+
+    def shuffle(self, rng: Optional[Random] = None) -> None:
+        """Randomizes the order of cards in the deck.
+
+        Args:
+            rng: Random number generator to use, defaults to the global one.
+        """
+        if rng:
+            rng.shuffle(self._numbers)
+        else:
+            shuffle(self._numbers)
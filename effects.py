@@ -0,0 +1,191 @@
+import json
+import os
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from periodical.catalog import Catalog, get_catalog
+
+
+EFFECT = Callable[[Any], None]
+SPEC = Dict[str, int]
+# sample specs, which may be copied next to the catalog as effects.json
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'effects.sample.json')
+
+
+def _energy(amount: int, player: Any) -> None:
+    """Gives the player energy."""
+    player.gain_energy(amount)
+
+
+def _draw(amount: int, player: Any) -> None:
+    """Draws cards to the player's hand."""
+    player.draw(amount)
+
+
+def _synthesis(amount: int, player: Any) -> None:
+    """Allows the player more syntheses this turn."""
+    player.allow_synthesis(amount)
+
+
+OPERATIONS: Dict[str, Callable[[int, Any], None]] = {
+    'energy': _energy,
+    'draw': _draw,
+    'synthesis': _synthesis,
+}
+
+
+def validate_spec(spec: Any, name: str) -> SPEC:
+    """Checks that an effect spec maps known operations to amounts.
+
+    Args:
+        spec: Spec to check.
+        name: Category or element the spec belongs to, for error messages.
+
+    Returns:
+        The spec, if valid.
+
+    Raises:
+        ValueError: If an operation is unknown or its amount isn't a
+                    non-negative integer.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError(f'effect of {name} is not an object')
+    for operation, amount in spec.items():
+        if operation not in OPERATIONS:
+            raise ValueError(f'effect of {name} has unknown operation '
+                             f'{operation!r}')
+        if (not isinstance(amount, int) or isinstance(amount, bool)
+                or amount < 0):
+            raise ValueError(f'effect of {name} has invalid amount for '
+                             f'{operation!r}')
+    return spec
+
+
+def load_specs(path: str) -> Dict[str, Dict[str, SPEC]]:
+    """Returns the effect specs stored in a json file shaped
+    `{"categories": {...}, "elements": {...}}`, or empty specs if there is
+    no such file, so cards have no effects unless configured.
+
+    Categories are keyed by name and elements by atomic number, and each
+    spec maps operations (see `OPERATIONS`) to amounts. An element's spec
+    replaces its category's.
+
+    Args:
+        path: Path to json file.
+
+    Returns:
+        Effect specs of categories and elements.
+
+    Raises:
+        ValueError: If the file is malformed or a spec is invalid.
+    """
+    if not os.path.exists(path):
+        return {'categories': {}, 'elements': {}}
+    with open(path, 'r', encoding='utf-8') as file_handler:
+        try:
+            specs = json.load(file_handler)
+        except json.JSONDecodeError:
+            raise ValueError(f'{path} is malformed')
+    if not isinstance(specs, dict):
+        raise ValueError(f'{path} is not an object')
+    for group in ('categories', 'elements'):
+        if not isinstance(specs.setdefault(group, {}), dict):
+            raise ValueError(f'{path} has invalid field {group!r}')
+        for name, spec in specs[group].items():
+            if group == 'elements' and not name.isdigit():
+                raise ValueError(f'{path} has invalid element {name!r}')
+            validate_spec(spec, name)
+    return specs
+
+
+def compile_effect(spec: SPEC) -> Optional[EFFECT]:
+    """Returns a function applying an effect spec to a player.
+
+    Each operation is bound to its amount once, so applying the effect
+    involves no lookups.
+
+    Args:
+        spec: Operations of the effect and their amounts.
+
+    Returns:
+        Function receiving the player who played the card, or None if the
+        effect does nothing.
+    """
+    steps = [partial(OPERATIONS[operation], amount)
+             for operation, amount in spec.items() if amount]
+    if not steps:
+        return None
+    if len(steps) == 1:
+        return steps[0]
+
+    def effect(player: Any) -> None:
+        for step in steps:
+            step(player)
+    return effect
+
+
+class Effects:
+    """A class for representing the effects of playing each element's card.
+
+    Specs are compiled once into a dispatch table indexed by atomic number,
+    and elements sharing a spec share its compiled function.
+
+    Attributes:
+        dispatch: Effect of each element by atomic number, None for elements
+                  without one.
+        draws: Amount of cards each element's effect draws, by atomic
+               number.
+        energy: Energy each element's effect gives, by atomic number.
+        syntheses: Amount of extra syntheses each element's effect allows,
+                   by atomic number.
+    """
+    def __init__(self, specs: Dict[str, Dict[str, SPEC]],
+                 catalog: Catalog) -> None:
+        categories = {name.title(): spec
+                      for name, spec in specs['categories'].items()}
+        elements = {int(number): spec
+                    for number, spec in specs['elements'].items()}
+        compiled: Dict[Tuple[Tuple[str, int], ...], Optional[EFFECT]] = {}
+        self.dispatch: List[Optional[EFFECT]] = [None] * (catalog.last + 1)
+        self.draws = [0] * (catalog.last + 1)
+        self.energy = [0] * (catalog.last + 1)
+        self.syntheses = [0] * (catalog.last + 1)
+        for number in catalog.numbers():
+            spec = elements.get(number)
+            if spec is None:
+                spec = categories.get(
+                    catalog.create_card(number).category, {})
+            key = tuple(spec.items())
+            if key not in compiled:
+                compiled[key] = compile_effect(spec)
+            self.dispatch[number] = compiled[key]
+            self.draws[number] = spec.get('draw', 0)
+            self.energy[number] = spec.get('energy', 0)
+            self.syntheses[number] = spec.get('synthesis', 0)
+
+    def get_draws(self, number: int) -> int:
+        """Returns the amount of cards an element's effect draws.
+
+        Args:
+            number: Element's atomic number.
+
+        Returns:
+            Amount of cards drawn, 0 for unknown elements.
+        """
+        return self.draws[number] if 0 <= number < len(self.draws) else 0
+
+
+@lru_cache(maxsize=None)
+def get_effects(path: str, effects_path: str) -> Effects:
+    """Returns the effects of the catalog's elements, compiling them only
+    once.
+
+    Args:
+        path: Path to the element catalog's json file.
+        effects_path: Path to the effect specs' json file.
+
+    Returns:
+        Compiled effects.
+    """
+    return Effects(load_specs(effects_path), get_catalog(path))
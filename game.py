@@ -1,22 +1,33 @@
-from config import ENERGY
-from random import choice
-from typing import Callable, Dict, List, Optional, Tuple
+from random import Random
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pygame
-from pygame.constants import KEYDOWN, K_ESCAPE, QUIT
+from pygame.constants import (KEYDOWN, K_c, K_ESCAPE, K_h, QUIT,
+                              VIDEORESIZE)
 from pygame.rect import Rect
 from pygame.surface import Surface
 
-from periodical.card import Card
-from periodical.config import (BUTTON, BUTTON_AREA, Board, CARD, CARD_IMG,
-                               COLORS, DISCARD, END_TURN, GENERAL_END, HAND,
-                               HEAVY_AMOUNT, HEAVY_DECK_LIMIT, LAB,
+from periodical.allocations import AllocationTracker
+from periodical.atlas import ATLAS
+from periodical.card import border_and_fill, Card
+from periodical.catalog import get_catalog
+from periodical.config import (Action, BUTTON, BUTTON_AREA, Board, CARD,
+                               CARD_IMG, COLORS, DISCARD, END_TURN, ENERGY,
+                               GENERAL_END, get_scale, HAND, HEAVY_AMOUNT,
+                               HEAVY_DECK_LIMIT, HIGHLIGHT, LAB, LAYOUT,
                                LIGHT_AMOUNT, LIGHT_DECK_LIMIT, LIGHT_END,
-                               LIGHT_START, MARKET, MIN_PLAYER_AMOUNT, NUM,
-                               SCREEN, SPACE, TABLE, Zone)
+                               LIGHT_START, MARKET, Metric, MIN_PLAYER_AMOUNT,
+                               MOVE, NUM, OPENINGS_PATH, PATH, RESIZABLE,
+                               SCREEN, TABLE, TRACK_ALLOCATIONS, UNDO, Zone)
 from periodical.decks import Deck, MarketDeck
+from periodical.market import Market
+from periodical.openings import describe, get_book
 from periodical.player import Player
-from periodical.utils import (calc_surface_heights, generate_cards,
+from periodical.prewarm import Prewarmer
+from periodical.telemetry import Telemetry
+from periodical.utils import (apply_scale, calc_surface_heights,
+                              generate_cards, get_cache_directory,
                               interact_with, move_zone)
 
 
@@ -25,10 +36,45 @@ class Game:
 
     Attributes:
         names: Names of participating players.
+        seed: Seed for all of the game's randomness, random if None.
+        telemetry: Recorder of gameplay events, if any. Moves made with
+                   `make` are recorded as well, so searches should use
+                   games without one.
+        history: Moves made with `perform`, if set to a list.
     """
-    def __init__(self, *names: str) -> None:
+    def __init__(self, *names: str, seed: Optional[int] = None,
+                 telemetry: Optional[Telemetry] = None) -> None:
         self.names = list(names)
+        self.seed = seed
+        self.telemetry = telemetry
+        self.history: Optional[List[MOVE]] = None
+        self._turn_started = 0.0
+        self._random = Random(seed)
         self._status = False
+        self._listeners: List[Callable[['Game'], None]] = []
+
+    def add_listener(self, listener: Callable[['Game'], None]) -> None:
+        """Registers a function to be called after every change made by a
+        player's action. Listeners run on the thread performing the action,
+        so they should return quickly.
+
+        Args:
+            listener: Function receiving the changed game.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[['Game'], None]) -> None:
+        """Unregisters a function added by `add_listener`.
+
+        Args:
+            listener: Function to remove.
+        """
+        self._listeners.remove(listener)
+
+    def _notify(self) -> None:
+        """Calls all listeners with the game."""
+        for listener in self._listeners:
+            listener(self)
 
     def add_player(self, name: str) -> bool:
         """Adds a new player to names. Works only if the game hasn't started.
@@ -64,10 +110,11 @@ class Game:
 
     def _set_players(self) -> None:
         """Creates a Player instance for each name in names."""
-        self.players = [Player(name) for name in self.names]
+        self.players = [Player(name, self._random, self.telemetry, seat)
+                        for seat, name in enumerate(self.names)]
         for player in self.players:
             player.shuffle_deck()
-            player.end_turn()
+            player.deal()
 
     def _set_decks(self) -> None:
         """Initiates the communal market decks."""
@@ -76,9 +123,9 @@ class Game:
         self._heavy_deck = MarketDeck(HEAVY_AMOUNT, Zone.HEAVY_DECK,
                                       first=LIGHT_END + 1)
         for deck in (self._light_deck, self._heavy_deck):
-            deck.shuffle()
+            deck.shuffle(self._random)
 
-    def _fill_market(self, market: List[Card], limit: int, zone: Zone,
+    def _fill_market(self, market: Market, limit: int, zone: Zone,
                      deck: Deck) -> None:
         """Reveals new cards to the market from the given Deck.
 
@@ -93,10 +140,14 @@ class Game:
             if card:
                 card.zone = zone
                 market.append(card)
+                if self.telemetry:
+                    self.telemetry.record(
+                        Metric.REFILL, self.current_player.seat,
+                        card.number, card.mass, zone.value)
 
     def _reset_general_market(self) -> None:
         """Refills the general market."""
-        self.general_market = generate_cards(last=GENERAL_END)
+        self.general_market = Market(generate_cards(last=GENERAL_END))
         move_zone(self.general_market, Zone.GENERAL_MARKET)
 
     def _fill_all_markets(self) -> None:
@@ -111,8 +162,9 @@ class Game:
 
     def _set_board(self) -> None:
         """Creates market attributes and fill all markets."""
-        self.light_market: List[Card] = []
-        self.heavy_market: List[Card] = []
+        self.light_market = Market()
+        self.heavy_market = Market()
+        self._highlights: List[Rect] = []
         self._fill_all_markets()
 
     def update_zones(self) -> None:
@@ -134,9 +186,9 @@ class Game:
                 interact_with(self.general_market, card, add),
             }
 
-    def start(self) -> bool:
-        """Starts the game. Works only if the game hasn't started and
-        there are enough players.
+    def setup(self) -> bool:
+        """Deals the game without displaying it. Works only if the game hasn't
+        started and there are enough players.
 
         Returns:
             True if successfull, False otherwise.
@@ -144,16 +196,33 @@ class Game:
         if len(self.names) <= MIN_PLAYER_AMOUNT and not self._status:
             self._set_players()
             self._set_decks()
+            self.current_player = self._random.choice(self.players)
             self._set_board()
-            self.current_player = choice(self.players)
             self.update_zones()
+            self._turn_started = monotonic()
             self._status = True
+            return True
+        return False
+
+    def start(self) -> bool:
+        """Starts the game. Works only if the game hasn't started and
+        there are enough players.
+
+        Returns:
+            True if successfull, False otherwise.
+        """
+        if self.setup():
             self.show_board()
             return True
         return False
 
     def end_turn(self) -> None:
         """Ends the current player's turn."""
+        if self.telemetry:
+            now = monotonic()
+            self.telemetry.record(Metric.TURN, self.current_player.seat,
+                                  value=now - self._turn_started)
+            self._turn_started = now
         self.current_player.end_turn()
         self.current_player = self.players[
             self.players.index(self.current_player) - 1]
@@ -173,10 +242,256 @@ class Game:
             return True
         return False
 
+    def get_market(self) -> List[Card]:
+        """Returns a list of all cards available for purchase.
+
+        Returns:
+            List of cards in all markets.
+        """
+        return self.general_market + self.light_market + self.heavy_market
+
+    def get_affordable(self, energy: Optional[int] = None) -> List[Card]:
+        """Returns all cards available for purchase with the given energy.
+
+        Args:
+            energy: Energy available, defaults to the current player's.
+
+        Returns:
+            List of affordable cards in all markets.
+        """
+        if energy is None:
+            energy = self.current_player.get_energy()
+        return (self.general_market.affordable(energy)
+                + self.light_market.affordable(energy)
+                + self.heavy_market.affordable(energy))
+
+    def get_state(self) -> Dict[str, Any]:
+        """Returns the game's state, with cards as atomic numbers. The order
+        of the decks is left out.
+
+        Returns:
+            Serializable state of the game.
+        """
+        light, heavy = self.get_deck_sizes()
+        return {
+            'current': self.players.index(self.current_player),
+            'players': [player.get_state() for player in self.players],
+            'general_market': [card.number for card in self.general_market],
+            'light_market': [card.number for card in self.light_market],
+            'heavy_market': [card.number for card in self.heavy_market],
+            'light_deck': light,
+            'heavy_deck': heavy,
+        }
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Returns the game's complete state, with cards as atomic numbers,
+        from which `load_snapshot` recreates it. Unlike `get_state`, the
+        order of the decks and the random state are included, so the game
+        continues exactly as it would have.
+
+        Returns:
+            Serializable snapshot of the game.
+        """
+        version, state, gauss = self._random.getstate()
+        return {
+            'current': self.players.index(self.current_player),
+            'players': [player.get_snapshot() for player in self.players],
+            'general_market': [card.number for card in self.general_market],
+            'light_market': [card.number for card in self.light_market],
+            'heavy_market': [card.number for card in self.heavy_market],
+            'light_deck': self._light_deck.get_numbers(),
+            'heavy_deck': self._heavy_deck.get_numbers(),
+            'random': [version, list(state), gauss],
+        }
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Recreates the game's state from a snapshot returned by
+        `get_snapshot`. The game must be set up with the same players.
+
+        Args:
+            snapshot: Snapshot of the game.
+        """
+        catalog = get_catalog(PATH)
+        for player, player_snapshot in zip(self.players,
+                                           snapshot['players']):
+            player.load_snapshot(player_snapshot)
+        self.current_player = self.players[snapshot['current']]
+        for name, zone in (('general_market', Zone.GENERAL_MARKET),
+                           ('light_market', Zone.LIGHT_MARKET),
+                           ('heavy_market', Zone.HEAVY_MARKET)):
+            setattr(self, name, Market(catalog.create_card(number, zone)
+                                       for number in snapshot[name]))
+        self._light_deck.set_numbers(snapshot['light_deck'])
+        self._heavy_deck.set_numbers(snapshot['heavy_deck'])
+        version, state, gauss = snapshot['random']
+        self._random.setstate((version, tuple(state), gauss))
+        self.update_zones()
+
+    def get_deck_sizes(self) -> Tuple[int, int]:
+        """Returns the amount of cards left in the market decks.
+
+        Returns:
+            Amount of cards in the light deck and in the heavy deck.
+        """
+        return len(self._light_deck), len(self._heavy_deck)
+
+    def get_moves(self) -> List[MOVE]:
+        """Returns all legal moves of the current player.
+
+        Each move is an action and the atomic number of the card it applies
+        to, or 0 for actions involving no card.
+
+        Returns:
+            List of legal moves.
+        """
+        player = self.current_player
+        moves = [(Action.END_TURN, 0)]
+        if player.can_mulligan():
+            moves.append((Action.MULLIGAN, 0))
+        hand = sorted({card.number for card in player.get_hand()})
+        moves.extend((Action.HARVEST, number) for number in hand)
+        moves.extend((Action.PLAY, number) for number in hand
+                     if player.effects.dispatch[number])
+        if player.can_synthesize():
+            moves.extend((Action.SYNTHESIZE, number) for number in hand)
+        market = sorted({card.number for card in self.get_affordable()})
+        moves.extend((Action.BUY, number) for number in market)
+        return moves
+
+    def _take(self, cards: List[Card], number: int,
+              action: Callable[[Card], bool]) -> bool:
+        """Takes a card from its zone and performs an action with it. The
+        card is returned to its zone if the action fails.
+
+        Args:
+            cards: Cards to choose from.
+            number: Atomic number of card to take.
+            action: Action to perform with the card.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        for card in cards:
+            if card.number == number:
+                zone = card.zone
+                self._zones_interaction[zone](card, False)
+                if action(card):
+                    return True
+                self._zones_interaction[zone](card, True)
+                return False
+        return False
+
+    def perform(self, action: Action, number: int = 0) -> bool:
+        """Performs a move of the current player without the board.
+
+        Args:
+            action: Action to perform.
+            number: Atomic number of the card the action applies to.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        done = self._perform(action, number)
+        if done:
+            if self.history is not None:
+                self.history.append((action, number))
+            self._notify()
+        return done
+
+    def _perform(self, action: Action, number: int = 0) -> bool:
+        """Performs a move of the current player, without notifying
+        listeners.
+
+        Args:
+            action: Action to perform.
+            number: Atomic number of the card the action applies to.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        player = self.current_player
+        done = False
+        if action is Action.END_TURN:
+            self.end_turn()
+            done = True
+        elif action is Action.MULLIGAN:
+            done = player.mulligan()
+        elif action is Action.HARVEST:
+            done = self._take(player.get_hand(), number, player.harvest_card)
+        elif action is Action.SYNTHESIZE:
+            done = self._take(player.get_hand(), number, player.synthesize)
+        elif action is Action.BUY:
+            done = self._take(self.get_market(), number, self.buy_card)
+        elif action is Action.PLAY:
+            done = self._take(player.get_hand(), number, player.play_card)
+        return done
+
+    def make(self, action: Action, number: int = 0) -> Optional[UNDO]:
+        """Performs a move of the current player, returning a record from
+        which `unmake` restores the exact prior state, including the order of
+        all decks and the random state. Listeners aren't notified.
+
+        Args:
+            action: Action to perform.
+            number: Atomic number of the card the action applies to.
+
+        Returns:
+            Record of the prior state if successful, None otherwise.
+        """
+        player = self.current_player
+        turn = action in (Action.END_TURN, Action.MULLIGAN)
+        markets = None
+        if turn or action is Action.BUY:
+            markets = (self.general_market, list(self.general_market),
+                       list(self.light_market), list(self.heavy_market),
+                       self._light_deck.mark(), self._heavy_deck.mark())
+        if turn:
+            draws = 5
+        elif action is Action.PLAY:
+            draws = player.effects.get_draws(number)
+        else:
+            draws = 0
+        undo = (player, player.save(draws), markets)
+        if self._perform(action, number):
+            return undo
+        self.unmake(undo)
+        return None
+
+    def unmake(self, undo: UNDO) -> None:
+        """Restores the state prior to a move.
+
+        Moves must be unmade in the reverse order they were made.
+
+        Args:
+            undo: Record returned by `make`.
+        """
+        self.current_player, record, markets = undo
+        self.current_player.restore(record)
+        if markets:
+            (self.general_market, general, light, heavy, light_mark,
+             heavy_mark) = markets
+            for market, cards, zone in (
+                    (self.general_market, general, Zone.GENERAL_MARKET),
+                    (self.light_market, light, Zone.LIGHT_MARKET),
+                    (self.heavy_market, heavy, Zone.HEAVY_MARKET)):
+                market[:] = cards
+                move_zone(market, zone)
+            self._light_deck.rewind(light_mark)
+            self._heavy_deck.rewind(heavy_mark)
+
     def show_market(self) -> CARD_IMG:
-        """Creates an image of the market to be displayed on the screen."""
+        """Creates an image of the market to be displayed on the screen.
+
+        Cards the current player can afford are highlighted.
+        """
         cards = []
-        location: NUM = SPACE
+        location: NUM = LAYOUT.space
+        affordable = {id(card) for card in self.get_affordable()}
+        highlight = ATLAS.fetch('highlight', lambda: border_and_fill(
+            HIGHLIGHT, 'affordable'))
+        while len(self._highlights) < len(affordable):
+            self._highlights.append(Rect((0, 0), HIGHLIGHT.size))
+        highlights = iter(self._highlights)
 
         top = sorted(self.general_market + self.light_market)
         bottom = sorted(self.heavy_market)
@@ -186,9 +501,15 @@ class Game:
                 card.render()
                 card.rect.update((MARKET.x + location,
                                   MARKET.y + height), CARD.size)
+                if id(card) in affordable:
+                    rect = next(highlights)
+                    rect.update((card.rect.x - LAYOUT.highlight_width,
+                                 card.rect.y - LAYOUT.highlight_width),
+                                HIGHLIGHT.size)
+                    cards.append((highlight, rect))
                 cards.append((card.img, card.rect))
-                location += CARD.width + SPACE
-            location = SPACE
+                location += CARD.width + LAYOUT.space
+            location = LAYOUT.space
 
         return cards
 
@@ -221,34 +542,56 @@ class Game:
                 return card
         return None
 
-    def _check_button_collision(self, pos: Tuple[NUM, NUM]) -> None:
+    def _check_button_collision(self, pos: Tuple[NUM, NUM]) -> bool:
         """Checks for mouse collision with buttons, and performs action if
         necessary.
 
         Args:
             pos: Mouse position.
+
+        Returns:
+            True if an action was performed, False otherwise.
         """
         rect = Rect((0, 0), BUTTON.size)
         rect.center = ENERGY.pos  # type: ignore
         if self.current_player.can_mulligan() and rect.collidepoint(*pos):
-            self.current_player.mulligan()
-        else:
-            rect.center = END_TURN.pos  # type: ignore
-            if rect.collidepoint(*pos):
-                self.end_turn()
+            return self.current_player.mulligan()
+        rect.center = END_TURN.pos  # type: ignore
+        if rect.collidepoint(*pos):
+            self.end_turn()
+            return True
+        return False
 
     def _set_surface(self, screen: Surface, board: Board,
                      color: Tuple[int, int, int]) -> None:
-        """Creates a color filled surface and pastes it on the screen.
+        """Fills the board's area on the surface with a color.
 
         Args:
-            screen: Surface object onto which to paste images.
+            screen: Surface object onto which to paint the board.
             board: Board size and position on the screen.
             color: RGB color to fill board.
         """
-        surface = Surface(board.size)
-        surface.fill(color)
-        screen.blit(surface, board.pos)
+        screen.fill(color, Rect(board.pos, board.size))
+
+    def _set_background(self, screen: Surface) -> None:
+        """Composes all boards into a single background layer matching the
+        screen's size.
+
+        Args:
+            screen: Surface object the background will be pasted on.
+        """
+        self._background = Surface(screen.get_size()).convert()
+        # version, images and area of each layer, laid out anew
+        self._layers: Dict[str, Tuple[Tuple[Any, ...], CARD_IMG, Rect]] = {}
+        for board, color in [
+            (DISCARD, COLORS['discard']),
+            (MARKET, COLORS['market']),
+            (TABLE, COLORS['table']),
+            (HAND, COLORS['hand']),
+            (LAB, COLORS['lab']),
+            (BUTTON_AREA, COLORS['button_area']),
+                ]:
+            self._set_surface(self._background, board, color)
 
     def _validate_collide(self, board: Board, pos: Tuple[int, int]) -> bool:
         """Checks if mouse position is inside given board.
@@ -262,6 +605,18 @@ class Game:
         """
         return bool(Rect(board.pos, board.size).collidepoint(*pos))
 
+    def _scroll(self, pos: Tuple[int, int], amount: int) -> None:
+        """Scrolls the vertical board under the mouse, if there is one.
+
+        Args:
+            pos: Mouse position.
+            amount: Amount of cards to scroll by, negative values scroll up.
+        """
+        for board, zone in ((DISCARD, Zone.DISCARD), (TABLE, Zone.TABLE),
+                            (LAB, Zone.LAB)):
+            if self._validate_collide(board, pos):
+                self.current_player.scroll(zone, amount)
+
     def _validate_drag(self, pos: Tuple[int, int], card: Card) -> bool:
         """Checks for collision with valid game zones, based on original zone
         of card and current mouse positioned area, and acts accordingly.
@@ -280,10 +635,8 @@ class Game:
                 if self.buy_card(card):
                     return True
         elif card.zone is Zone.HAND:
-            # irrelevant with no card effects
-            # if self._validate_collide(TABLE, pos):
-            #     self.current_player.play_card(card)
-            #     return True
+            if self._validate_collide(TABLE, pos):
+                return self.current_player.play_card(card)
             if self._validate_collide(MARKET, pos):
                 self.current_player.harvest_card(card)
                 return True
@@ -302,20 +655,110 @@ class Game:
         self._zones_interaction[card.zone](card, True)
         return False
 
-    def show_board(self) -> None:
-        """Creates a visualization of the game and display it."""
+    def _get_upcoming_cards(self) -> List[Card]:
+        """Returns cards in the order they are expected to be displayed.
+
+        Returns:
+            Cards of both market decks in drawing order, followed by the
+            rest of the cards.
+        """
+        cards = []
+        light, heavy = self._light_deck.peek(), self._heavy_deck.peek()
+        for i in range(max(len(light), len(heavy))):
+            cards.extend(deck[i] for deck in (light, heavy) if i < len(deck))
+        cards.extend(generate_cards())
+        return cards
+
+    def _prewarm(self) -> None:
+        """Loads the atlas from the disk cache and starts rendering the
+        missing card images on a background thread."""
+        directory = get_cache_directory()
+        if not len(ATLAS):
+            ATLAS.load(directory)
+        self._prewarmer = Prewarmer(self._get_upcoming_cards(), directory,
+                                    len(ATLAS))
+        self._prewarmer.start()
+        self._loading = True
+
+    def _resize(self, size: Tuple[int, int]) -> None:
+        """Lays the board out to fit the window, rendering images at the new
+        scale in the background.
+
+        Args:
+            size: Window's width and height.
+        """
+        scale = get_scale(*size)
+        if scale != LAYOUT.scale:
+            # cancelled before the atlas switches, so the old scale's
+            # images are never written to the new scale's cache, or back
+            self._prewarmer.cancel()
+            apply_scale(scale)
+            self._prewarm()
+
+    def _show_progress(self) -> None:
+        """Displays the progress of background rendering in the caption."""
+        if self._prewarmer.is_alive():
+            pygame.display.set_caption(
+                f'Periodical (loading {self._prewarmer.progress:.0%})')
+        elif self._loading:
+            pygame.display.set_caption('Periodical')
+            self._loading = False
+
+    def _show_hint(self) -> None:
+        """Displays the opening book's line for the current player in the
+        caption, if they have yet to act in their first turn."""
+        opening = get_book(OPENINGS_PATH)
+        line = opening.suggest(self) if opening else None
+        if line:
+            pygame.display.set_caption(f'Periodical (hint: {describe(line)})')
+        else:
+            pygame.display.set_caption('Periodical (no hint)')
+
+    def show_board(self,
+                   on_frame: Optional[Callable[[], None]] = None) -> None:
+        """Creates a visualization of the game and display it.
+
+        The board is driven by events alone, so it can be played by posting
+        events to the queue.
+
+        If the `PERIODICAL_RESIZABLE` environment variable is set, the
+        window can be resized, and the board is scaled to fit it.
+
+        Allocations of the render loop are reported to stderr if the
+        `PERIODICAL_TRACK_ALLOCATIONS` environment variable is set.
+
+        Pressing H in the first turn shows the opening book's line in the
+        caption, if there is an opening book.
+
+        Args:
+            on_frame: Function called after each frame is displayed.
+        """
         self.update_zones()
-        screen = pygame.display.set_mode(SCREEN.size)  # type: ignore
+        screen = pygame.display.set_mode(  # type: ignore
+            SCREEN.size, pygame.RESIZABLE if RESIZABLE else 0)
         pygame.display.set_caption('Periodical')
+        self._set_background(screen)
+        self._prewarm()
+        tracker = AllocationTracker() if TRACK_ALLOCATIONS else None
+        if tracker:
+            tracker.start()
 
         card = None
+        pointer = 0, 0
+        redraw = True
+        snapshot: Optional[Surface] = None
+        previous = Rect(0, 0, 0, 0)
         while True:
             for event in pygame.event.get():
                 if (event.type == QUIT or event.type == KEYDOWN
                         and event.key == K_ESCAPE):
+                    self._prewarmer.cancel()
+                    if tracker:
+                        tracker.stop()
                     return
 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
+                    pointer = event.pos
                     if event.button == 1:
                         card = self._get_card_collision(event.pos)
                         if card:
@@ -324,41 +767,147 @@ class Game:
                             offset_y = card.rect.y - mouse_y
                             if card.zone in self._zones_interaction:
                                 self._zones_interaction[card.zone](card, False)
-                        self._check_button_collision(event.pos)
+                        if self._check_button_collision(event.pos):
+                            self._notify()
+                        snapshot = None
 
                 elif event.type == pygame.MOUSEBUTTONUP:
+                    pointer = event.pos
                     if event.button == 1:
-                        if card:
-                            self._validate_drag(pygame.mouse.get_pos(), card)
+                        if card and self._validate_drag(event.pos, card):
+                            self._notify()
+                        card = snapshot = None
 
                 elif event.type == pygame.MOUSEMOTION:
+                    pointer = event.pos
                     if card:
                         mouse_x, mouse_y = event.pos
                         card.rect.x = mouse_x + offset_x
                         card.rect.y = mouse_y + offset_y
 
-            for board, color in [
-                (DISCARD, COLORS['discard']),
-                (MARKET, COLORS['market']),
-                (TABLE, COLORS['table']),
-                (HAND, COLORS['hand']),
-                (LAB, COLORS['lab']),
-                (BUTTON_AREA, COLORS['button_area']),
-                    ]:
-                self._set_surface(screen, board, color)
+                elif event.type == pygame.MOUSEWHEEL and not card:
+                    self._scroll(pointer, -event.y)
+
+                elif event.type == KEYDOWN and event.key == K_c:
+                    self.current_player.toggle_stacks()
+
+                elif event.type == KEYDOWN and event.key == K_h:
+                    self._show_hint()
 
-            discard = self.current_player.show_discard()
-            hand = self.current_player.show_hand()
-            lab = self.current_player.show_lab()
-            market = self.show_market()
-            table = self.current_player.show_table()
+                elif event.type == VIDEORESIZE and RESIZABLE:
+                    if card:
+                        self._zones_interaction[card.zone](card, True)
+                    card = snapshot = None
+                    redraw = True
+                    self._resize(event.size)
+                    screen = pygame.display.get_surface()
+
+            self._show_progress()
+            if not card:
+                # only changed layers are drawn, unless a card was dragged
+                dirty = self._draw_board(screen, redraw)
+                redraw = False
+                if dirty:
+                    pygame.display.update(dirty)
+            elif not snapshot:
+                # the board doesn't change mid-drag, so it is drawn once
+                self._draw_board(screen)
+                snapshot = screen.copy()
+                previous.update(card.rect)
+                screen.blit(card.img, card.rect)
+                pygame.display.flip()
+                redraw = True
+            else:
+                screen.blit(snapshot, previous, previous)
+                screen.blit(card.img, card.rect)
+                pygame.display.update([previous, card.rect])
+                previous.update(card.rect)
+            if tracker:
+                tracker.frame()
+            if on_frame:
+                on_frame()
+
+    def _get_layers(self) -> List[Tuple[str, Tuple[Any, ...],
+                                        Callable[[], CARD_IMG]]]:
+        """Returns the layers of the board, in drawing order.
+
+        Returns:
+            Name, version and visualization function of each layer. The
+            version changes whenever the layer's visualization does.
+        """
+        player = self.current_player
+        energy = player.get_energy()
+        markets = (self.general_market.version, self.light_market.version,
+                   self.heavy_market.version, energy)
+        return [
+            ('discard', player.get_version(Zone.DISCARD), player.show_discard),
+            ('hand', player.get_version(Zone.HAND), player.show_hand),
+            ('lab', player.get_version(Zone.LAB), player.show_lab),
+            ('market', markets, self.show_market),
+            ('table', player.get_version(Zone.TABLE), player.show_table),
+            ('buttons', (player.can_mulligan(), energy), player.show_buttons),
+        ]
+
+    def _draw_board(self, screen: Surface, full: bool = True) -> List[Rect]:
+        """Draws the board, all cards in their zones and the buttons.
+
+        Each zone and the buttons are kept as a layer of images, laid out
+        again only once the layer's version changes. Unless drawing in full,
+        only the areas of the screen covered by changed layers, before and
+        after the change, are drawn again, so the screen must still hold
+        the board as it was last drawn.
 
-            for seq in (discard, hand, lab, market, table):
-                screen.blits(seq)  # type: ignore
+        Args:
+            screen: Surface object onto which to paste images.
+            full: Whether or not to draw the entire board.
 
-            self.current_player.show_buttons(screen)
+        Returns:
+            Areas of the screen drawn over.
+        """
+        if self._background.get_size() != screen.get_size():
+            self._set_background(screen)
+            full = True
+
+        layers = self._get_layers()
+        dirty = []
+        for name, version, show in layers:
+            layer = self._layers.get(name)
+            if layer and layer[0] == version:
+                continue
+            images = show()
+            area = (images[0][1].unionall([rect for _, rect in images])
+                    if images else Rect(0, 0, 0, 0))
+            if layer:
+                dirty.append(layer[2])
+            dirty.append(area)
+            self._layers[name] = version, images, area
+        if full:
+            dirty = [screen.get_rect()]
+
+        for area in dirty:
+            screen.set_clip(area)
+            screen.blit(self._background, area, area)
+            for name, _, _ in layers:
+                _, images, bounds = self._layers[name]
+                if bounds.colliderect(area):
+                    screen.blits(images)  # type: ignore
+        screen.set_clip(None)
+        return dirty
+
+    def render(self, surface: Optional[Surface] = None) -> Surface:
+        """Draws the board offscreen, as it is displayed when no card is
+        being dragged. The display must be initialized, though a hidden or
+        dummy one will do.
 
-            if card and pygame.mouse.get_pressed(num_buttons=3)[0]:
-                screen.blit(card.img, (card.rect.x, card.rect.y))
+        Args:
+            surface: Surface of the screen's size to draw onto, created if
+                     not given.
 
-            pygame.display.flip()
+        Returns:
+            The surface holding the board.
+        """
+        if surface is None:
+            surface = Surface(SCREEN.size).convert()
+        self._set_background(surface)
+        self._draw_board(surface)
+        return surface
@@ -1,7 +1,83 @@
+import argparse
+import cProfile
+import json
+import pstats
+from time import perf_counter
+
+from periodical.benchmark import FRAMES, ScriptedInput
+from periodical.bots import STRATEGIES
+from periodical.config import TELEMETRY_PATH
 from periodical.game import Game
+from periodical.profiling import breakdown, Sampler
+from periodical.simulate import play_game
+from periodical.telemetry import Telemetry
+
 
+PROFILERS = 'sample', 'cprofile'
+COLLAPSED_PATH = 'profile.folded'
+PSTATS_PATH = 'profile.prof'
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Plays the game.')
+    parser.add_argument('--profile', choices=PROFILERS,
+                        help='profile the session, by sampling the stack '
+                             'into collapsed stacks for flame graph tools, '
+                             'or with cProfile into a pstats file')
+    parser.add_argument('--output', help='file to write the profile to')
+    parser.add_argument('--script', nargs='?', const='',
+                        help='play the board with scripted input, replayed '
+                             'from a json file of events or else generated')
+    parser.add_argument('--frames', type=int, default=FRAMES,
+                        help='frames of scripted input to play')
+    parser.add_argument('--simulate', type=int, default=0, metavar='GAMES',
+                        help='play games headless and print the time spent '
+                             'in the rules')
+    parser.add_argument('--strategy', default='greedy',
+                        choices=list(STRATEGIES))
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the first simulated or scripted game')
+    args = parser.parse_args()
+
+    telemetry = Telemetry(TELEMETRY_PATH) if TELEMETRY_PATH else None
+    if telemetry:
+        telemetry.start()
+    profiler = (cProfile.Profile()
+                if args.profile == 'cprofile' or args.simulate else None)
+    sampler = Sampler() if args.profile == 'sample' else None
+    if sampler:
+        sampler.start()
+    if profiler:
+        profiler.enable()
+    start = perf_counter()
+    try:
+        if args.simulate:
+            for seed in range(args.seed, args.seed + args.simulate):
+                play_game(STRATEGIES[args.strategy], seed)
+        elif args.script is not None:
+            script = None
+            if args.script:
+                with open(args.script, 'r', encoding='utf-8') as file_handler:
+                    script = json.load(file_handler)
+            game = Game('player', seed=args.seed, telemetry=telemetry)
+            game.setup()
+            game.show_board(ScriptedInput(game, args.frames, script,
+                                          args.seed))
+        else:
+            game = Game('player', telemetry=telemetry)
+            game.start()
+    finally:
+        elapsed = perf_counter() - start
+        if profiler:
+            profiler.disable()
+        if sampler:
+            sampler.stop()
+        if telemetry:
+            telemetry.stop()
 
-    game = Game('player')
-    game.start()
+    if sampler:
+        sampler.write(args.output or COLLAPSED_PATH)
+    if profiler and args.profile == 'cprofile':
+        profiler.dump_stats(args.output or PSTATS_PATH)
+    if profiler and args.simulate:
+        print(f'{args.simulate} games in {elapsed:.2f} s')
+        print(breakdown(pstats.Stats(profiler)))
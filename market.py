@@ -0,0 +1,111 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, List, SupportsIndex, Union
+
+from periodical.card import Card
+from periodical.pile import Pile
+
+
+class Market(Pile):
+    """A class for representing cards available for purchase.
+
+    Behaves as a pile of cards, while keeping an index of the cards sorted by
+    mass, updated with every change, so affordable cards are found with a
+    single bisection.
+    """
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        super().__init__()
+        self._masses: List[float] = []
+        self._cards: List[Card] = []
+        self.extend(cards)
+
+    def _index(self, card: Card) -> None:
+        """Adds a card to the mass index.
+
+        Args:
+            card: Card to add.
+        """
+        i = bisect_right(self._masses, card.mass)
+        self._masses.insert(i, card.mass)
+        self._cards.insert(i, card)
+
+    def _unindex(self, card: Card) -> None:
+        """Removes a card from the mass index.
+
+        Identity comparison is used to ensure removal of the desired card and
+        not one with equal values.
+
+        Args:
+            card: Card to remove.
+        """
+        i = bisect_left(self._masses, card.mass)
+        while self._cards[i] is not card:
+            i += 1
+        del self._masses[i]
+        del self._cards[i]
+
+    def append(self, card: Card) -> None:
+        """Adds a card to the market and to the mass index."""
+        super().append(card)
+        self._index(card)
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        """Adds cards to the market and to the mass index."""
+        for card in cards:
+            self.append(card)
+
+    def __iadd__(self, cards: Iterable[Card]) -> 'Market':  # type: ignore
+        """Adds cards to the market and to the mass index."""
+        self.extend(cards)
+        return self
+
+    def insert(self, index: SupportsIndex, card: Card) -> None:
+        """Inserts a card into the market and adds it to the mass index."""
+        super().insert(index, card)
+        self._index(card)
+
+    def pop(self, index: SupportsIndex = -1) -> Card:
+        """Removes a card from the market and from the mass index, and
+        returns it."""
+        card = super().pop(index)
+        self._unindex(card)
+        return card
+
+    def remove(self, card: Card) -> None:
+        """Removes a card equal to the given one from the market and from
+        the mass index."""
+        self.pop(self.index(card))
+
+    def clear(self) -> None:
+        """Removes all cards from the market and empties the mass index."""
+        super().clear()
+        self._masses.clear()
+        self._cards.clear()
+
+    def __delitem__(self, index: Union[SupportsIndex, slice]) -> None:
+        """Removes cards from the market and from the mass index."""
+        removed = self[index]
+        super().__delitem__(index)
+        for card in removed if isinstance(index, slice) else [removed]:
+            self._unindex(card)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replaces cards of the market, in the mass index as well."""
+        if isinstance(index, slice):
+            value = list(value)
+        removed = self[index]
+        super().__setitem__(index, value)
+        for card in removed if isinstance(index, slice) else [removed]:
+            self._unindex(card)
+        for card in value if isinstance(index, slice) else [value]:
+            self._index(card)
+
+    def affordable(self, energy: float) -> List[Card]:
+        """Returns the cards whose mass is at most the given energy.
+
+        Args:
+            energy: Energy available for purchase.
+
+        Returns:
+            List of affordable cards, lightest first.
+        """
+        return self._cards[:bisect_right(self._masses, energy)]
@@ -0,0 +1,190 @@
+import json
+import os
+import zlib
+from array import array
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from periodical.config import Action, LIGHT_DECK_LIMIT, MOVE
+
+
+HAND_SIZE = 5
+LINE = Tuple[MOVE, ...]
+
+
+def enumerate_hands(numbers: Sequence[int]) -> List[Tuple[int, ...]]:
+    """Returns every opening hand the starting deck can deal, in book order.
+
+    Args:
+        numbers: Atomic numbers of the starting deck.
+
+    Returns:
+        Sorted atomic numbers of each hand.
+    """
+    return list(combinations(sorted(numbers), HAND_SIZE))
+
+
+def enumerate_markets(numbers: Sequence[int]) -> List[Tuple[int, ...]]:
+    """Returns every opening light market, in book order.
+
+    Args:
+        numbers: Atomic numbers of the light deck's elements.
+
+    Returns:
+        Sorted atomic numbers of each market.
+    """
+    return list(combinations_with_replacement(sorted(set(numbers)),
+                                              LIGHT_DECK_LIMIT))
+
+
+def describe(line: Iterable[MOVE]) -> str:
+    """Returns a line of moves as human readable text.
+
+    Args:
+        line: Moves to describe.
+
+    Returns:
+        Comma separated moves.
+    """
+    return ', '.join(action.name.lower().replace('_', ' ')
+                     + (f' {number}' if number else '')
+                     for action, number in line)
+
+
+def is_opening(player: Any) -> bool:
+    """Returns whether or not a player has yet to act in their first turn.
+
+    A player who emptied their hand in every turn may still take a
+    mulligan in later turns, so the turns they ended are checked as well.
+
+    Args:
+        player: Player to inspect.
+
+    Returns:
+        True if the player's position is an opening, False otherwise.
+    """
+    return not player.get_turns() and player.can_mulligan()
+
+
+class OpeningBook:
+    """A class for representing the best first turn of every opening.
+
+    An opening is the hand dealt from the starting deck and the light
+    market revealed. The heavy market is left out, as its cards cost more
+    than any opening hand harvests, and so is the general market, which is
+    always the same. Each opening maps to an index into the book's distinct
+    lines, so looking one up takes two dictionary lookups.
+
+    Attributes:
+        starting: Atomic numbers of the starting deck.
+        light: Atomic numbers of the light deck's elements.
+        lines: Distinct lines of the book, each a sequence of moves starting
+               from the opening and ending the turn.
+    """
+    def __init__(self, starting: Sequence[int], light: Sequence[int],
+                 lines: List[LINE], table: 'array[int]') -> None:
+        self.starting = list(starting)
+        self.light = list(light)
+        self.lines = lines
+        self._hands = {hand: i for i, hand in
+                       enumerate(enumerate_hands(starting))}
+        self._markets = {market: i for i, market in
+                         enumerate(enumerate_markets(light))}
+        if len(table) != len(self._hands) * len(self._markets):
+            raise ValueError('opening book table has the wrong size')
+        self._table = table
+
+    def lookup(self, hand: Iterable[int],
+               market: Iterable[int]) -> Optional[LINE]:
+        """Returns the best line of an opening.
+
+        Args:
+            hand: Atomic numbers of the cards in hand.
+            market: Atomic numbers of the cards in the light market.
+
+        Returns:
+            Moves of the line, or None if the opening isn't in the book.
+        """
+        i = self._hands.get(tuple(sorted(hand)))
+        j = self._markets.get(tuple(sorted(market)))
+        if i is None or j is None:
+            return None
+        return self.lines[self._table[i * len(self._markets) + j]]
+
+    def suggest(self, game: Any) -> Optional[LINE]:
+        """Returns the best line of the current player, if they have yet to
+        act in their first turn.
+
+        Args:
+            game: Game to inspect.
+
+        Returns:
+            Moves of the line, or None if the position isn't an opening.
+        """
+        player = game.current_player
+        if not is_opening(player):
+            return None
+        return self.lookup((card.number for card in player.get_hand()),
+                           (card.number for card in game.light_market))
+
+    def save(self, path: str) -> None:
+        """Writes the book to a file: a json header line, followed by the
+        compressed table of line indices.
+
+        Args:
+            path: Path of the file.
+        """
+        header = {
+            'starting': self.starting,
+            'light': self.light,
+            'lines': [[[action.value, number] for action, number in line]
+                      for line in self.lines],
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'wb') as file_handler:
+            file_handler.write(json.dumps(header).encode() + b'\n')
+            file_handler.write(zlib.compress(self._table.tobytes(), 9))
+
+    @classmethod
+    def load(cls, path: str) -> 'OpeningBook':
+        """Reads a book written by `save`.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            The book.
+
+        Raises:
+            ValueError: If the file is malformed.
+        """
+        with open(path, 'rb') as file_handler:
+            data = file_handler.read()
+        try:
+            header_line, compressed = data.split(b'\n', 1)
+            header: Dict[str, Any] = json.loads(header_line)
+            lines = [tuple((Action(action), number) for action, number in line)
+                     for line in header['lines']]
+            table = array('H')
+            table.frombytes(zlib.decompress(compressed))
+        except (ValueError, KeyError, TypeError, zlib.error):
+            raise ValueError(f'{path} is not an opening book')
+        return cls(header['starting'], header['light'], lines, table)
+
+
+@lru_cache(maxsize=None)
+def get_book(path: str) -> Optional[OpeningBook]:
+    """Returns the opening book stored in the file, loading it only once.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        The book, or None if there is no such file.
+    """
+    if not os.path.exists(path):
+        return None
+    return OpeningBook.load(path)
@@ -0,0 +1,91 @@
+from itertools import count
+from typing import Any, Iterable, List, SupportsIndex, Tuple, Union
+
+from periodical.card import Card
+
+
+# shared by all piles, so versions of different piles never coincide
+_VERSIONS = count()
+
+
+class Pile(List[Card]):
+    """A class for representing the cards of a zone.
+
+    Behaves as a list of cards, while keeping a version number, replaced by
+    a new one with every change, so drawing a zone can be skipped until it
+    changes. Versions are unique across piles, so a zone replaced by another
+    pile is noticed as well.
+
+    Attributes:
+        version: Version of the pile's contents.
+    """
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        super().__init__(cards)
+        self.version = next(_VERSIONS)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickles the pile by its cards, so an unpickled pile gets a new
+        version, unique in its process."""
+        return type(self), (list(self),)
+
+    def _change(self) -> None:
+        """Gives the pile a new version."""
+        self.version = next(_VERSIONS)
+
+    def append(self, card: Card) -> None:
+        """Adds a card to the pile and gives it a new version."""
+        super().append(card)
+        self._change()
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        """Adds cards to the pile and gives it a new version."""
+        super().extend(cards)
+        self._change()
+
+    def __iadd__(self, cards: Iterable[Card]) -> 'Pile':  # type: ignore
+        """Adds cards to the pile and gives it a new version."""
+        self.extend(cards)
+        return self
+
+    def insert(self, index: SupportsIndex, card: Card) -> None:
+        """Inserts a card into the pile and gives it a new version."""
+        super().insert(index, card)
+        self._change()
+
+    def pop(self, index: SupportsIndex = -1) -> Card:
+        """Removes a card from the pile, gives it a new version and returns
+        the card."""
+        card = super().pop(index)
+        self._change()
+        return card
+
+    def remove(self, card: Card) -> None:
+        """Removes a card equal to the given one from the pile and gives it
+        a new version."""
+        super().remove(card)
+        self._change()
+
+    def clear(self) -> None:
+        """Removes all cards from the pile and gives it a new version."""
+        super().clear()
+        self._change()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        """Sorts the pile and gives it a new version."""
+        super().sort(*args, **kwargs)
+        self._change()
+
+    def reverse(self) -> None:
+        """Reverses the pile and gives it a new version."""
+        super().reverse()
+        self._change()
+
+    def __delitem__(self, index: Union[SupportsIndex, slice]) -> None:
+        """Removes cards from the pile and gives it a new version."""
+        super().__delitem__(index)
+        self._change()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replaces cards of the pile and gives it a new version."""
+        super().__setitem__(index, value)
+        self._change()
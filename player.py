@@ -1,13 +1,19 @@
-from typing import List, Optional
-from utils import calc_surface_heights
-
-from pygame.surface import Surface
+from random import Random
+from typing import Any, Dict, List, Optional, Tuple
 
 from periodical.card import Card
-from periodical.config import (Board, CARD, CARD_IMG, DISCARD, END_TURN,
-                               ENERGY, HAND, LAB, NUM, SPACE, TABLE, Zone)
+from periodical.catalog import get_catalog
+from periodical.config import (Board, CARD, CARD_IMG, DISCARD,
+                               EFFECTS_PATH, END_TURN, ENERGY, HAND, LAB,
+                               LAYOUT, Metric, NUM, PATH, SYNTHESES_PER_TURN,
+                               TABLE, UNDO, WHITE_FONT, Zone)
 from periodical.decks import Deck, StartingDeck
-from periodical.utils import interact_with, move_zone, show_button
+from periodical.effects import get_effects
+from periodical.pile import Pile
+from periodical.telemetry import Telemetry
+from periodical.text import render_text
+from periodical.utils import (calc_surface_heights, interact_with, move_zone,
+                              show_button)
 
 
 class Player:
@@ -15,15 +21,27 @@ class Player:
 
     Attributs:
         name: Player's name.
+        seat: Player's index in the game, identifying them in telemetry.
+        effects: Effects of playing each element's card.
+        stacked: Whether or not equal elements are shown as a single stack in
+                 vertical zones.
     """
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, rng: Optional[Random] = None,
+                 telemetry: Optional[Telemetry] = None, seat: int = 0) -> None:
         self.name = name
+        self.seat = seat
+        self._telemetry = telemetry
+        self.effects = get_effects(PATH, EFFECTS_PATH)
+        self._random = rng if rng else Random()
         self._deck: Deck = StartingDeck()
-        self._discard: List[Card] = []
-        self._lab: List[Card] = []
+        self._discard = Pile()
+        self._lab = Pile()
         self._reset_zones()
         self._energy = 0
         self._played = False
+        self._turns = 0
+        self._scroll: Dict[Zone, int] = {}
+        self.stacked = False
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Player):
@@ -72,14 +90,127 @@ class Player:
         """
         return self._get(self._table)
 
+    def get_discard(self) -> List[Card]:
+        """Returns a list of cards in player's discard pile.
+
+        Returns:
+            List of cards in player's discard pile.
+        """
+        return self._get(self._discard)
+
+    def get_deck(self) -> List[Card]:
+        """Returns a list of cards in player's deck, in drawing order.
+
+        Returns:
+            List of cards in player's deck.
+        """
+        return self._deck.peek()
+
+    def get_state(self) -> Dict[str, Any]:
+        """Returns the player's state, with cards as atomic numbers. The order
+        of the deck is left out.
+
+        Returns:
+            Serializable state of the player.
+        """
+        return {
+            'name': self.name,
+            'hand': [card.number for card in self._hand],
+            'table': [card.number for card in self._table],
+            'lab': [card.number for card in self._lab],
+            'discard': [card.number for card in self._discard],
+            'deck': len(self._deck),
+            'energy': self._energy,
+            'can_mulligan': self.can_mulligan(),
+            'can_synthesize': self.can_synthesize(),
+        }
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Returns the player's complete state, with cards as atomic numbers,
+        from which `load_snapshot` recreates it. Unlike `get_state`, the
+        order of the deck is included.
+
+        Returns:
+            Serializable snapshot of the player.
+        """
+        unused = {id(card) for card in self._unused}
+        return {
+            'hand': [card.number for card in self._hand],
+            'table': [card.number for card in self._table],
+            'unused': [i for i, card in enumerate(self._table)
+                       if id(card) in unused],
+            'lab': [card.number for card in self._lab],
+            'discard': [card.number for card in self._discard],
+            'deck': [card.number for card in self._deck.peek()],
+            'energy': self._energy,
+            'played': self._played,
+            'turns': self._turns,
+            'synthesis': next((i for i, card in enumerate(self._lab)
+                               if card is self._last_synthesis), None),
+            'syntheses': self._syntheses,
+        }
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Recreates the player's state from a snapshot returned by
+        `get_snapshot`.
+
+        Args:
+            snapshot: Snapshot of the player.
+        """
+        catalog = get_catalog(PATH)
+        self._hand, self._table, self._lab, self._discard, deck = (
+            Pile(catalog.create_card(number, zone)
+                 for number in snapshot[name])
+            for name, zone in (('hand', Zone.HAND), ('table', Zone.TABLE),
+                               ('lab', Zone.LAB), ('discard', Zone.DISCARD),
+                               ('deck', Zone.PLAYER_DECK)))
+        self._deck = Deck(Zone.PLAYER_DECK, *deck)
+        self._unused = [self._table[i] for i in snapshot['unused']]
+        self._energy = snapshot['energy']
+        self._played = snapshot['played']
+        # snapshots taken before turns were counted, in which a player who
+        # has played has ended a turn at least
+        self._turns = snapshot.get('turns', int(snapshot['played']))
+        synthesis = snapshot['synthesis']
+        self._last_synthesis = (self._lab[synthesis] if synthesis is not None
+                                else None)
+        # snapshots taken before effects could allow more syntheses
+        self._syntheses = snapshot.get(
+            'syntheses', SYNTHESES_PER_TURN if synthesis is None else 0)
+
+    def get_energy(self) -> int:
+        """Returns the energy harvested by the player during the current turn.
+
+        Returns:
+            Player's unspent energy.
+        """
+        return self._energy
+
+    def can_synthesize(self) -> bool:
+        """Returns whether or not the player may still synthesize this turn.
+
+        Returns:
+            True if the player can synthesize, False otherwise.
+        """
+        return self._syntheses > 0
+
+    def get_syntheses(self) -> int:
+        """Returns the amount of syntheses the player may still perform this
+        turn.
+
+        Returns:
+            Amount of syntheses left.
+        """
+        return self._syntheses
+
     def _draw(self) -> None:
         """Adds a card from the player's deck to their hand. Shuffles deck if
         necessary.
         """
         if not self._deck:
             self._deck = Deck(Zone.PLAYER_DECK, *self._discard)
-            self._discard = []
-            self._deck.shuffle()
+            self._discard = Pile()
+            self._deck.shuffle(self._random)
         card = self._deck.draw()
         if card:
             card.zone = Zone.HAND
@@ -87,13 +218,31 @@ class Player:
 
     def _reset_zones(self) -> None:
         """Removes all cards from player's turn dependant zones."""
-        self._table: List[Card] = []
-        self._hand: List[Card] = []
+        self._table = Pile()
+        self._hand = Pile()
         self._unused: List[Card] = []
         self._last_synthesis: Optional[Card] = None
+        self._syntheses = SYNTHESES_PER_TURN
+
+    def deal(self) -> None:
+        """Draws the player's first hand."""
+        self._redraw()
 
     def end_turn(self) -> None:
         """Ends the player's turn."""
+        self._redraw()
+        self._turns += 1
+
+    def get_turns(self) -> int:
+        """Returns the amount of turns the player has ended.
+
+        Returns:
+            Amount of turns ended, 0 during the player's first turn.
+        """
+        return self._turns
+
+    def _redraw(self) -> None:
+        """Discards the player's hand and table, and draws a new hand."""
         if self._hand:
             self._played = True
         for zone in (self._hand, self._table):
@@ -102,12 +251,57 @@ class Player:
         self._reset_zones()
         for _ in range(5):
             self._draw()
-        self._last_synthesis = None
         self._energy = 0
 
+    def save(self, draws: int = 0) -> UNDO:
+        """Returns a compact record of the player's state, from which
+        `restore` recovers it after any single action.
+
+        Zones only appended to during an action are recorded by length, and
+        the deck by the amount of cards drawn from it.
+
+        Args:
+            draws: Most cards the action may draw, such as a new hand when
+                   ending the turn. The deck is reshuffled if it runs out
+                   while drawing, which requires the random state.
+
+        Returns:
+            Record of the player's state.
+        """
+        state = (self._random.getstate() if len(self._deck) < draws
+                 else None)
+        return (self._hand, list(self._hand), self._table, len(self._table),
+                self._unused, len(self._unused), self._lab, len(self._lab),
+                self._discard, len(self._discard), self._deck,
+                self._deck.mark(), self._energy, self._played, self._turns,
+                self._last_synthesis, self._syntheses, state)
+
+    def restore(self, record: UNDO) -> None:
+        """Restores the player's state from a record returned by `save`.
+
+        Args:
+            record: Record of the player's state.
+        """
+        (self._hand, hand, self._table, table, self._unused, unused,
+         self._lab, lab, self._discard, discard, self._deck, mark,
+         self._energy, self._played, self._turns, self._last_synthesis,
+         self._syntheses,
+         state) = record
+        self._hand[:] = hand
+        for zone, length in ((self._table, table), (self._unused, unused),
+                             (self._lab, lab), (self._discard, discard)):
+            del zone[length:]
+        self._deck.rewind(mark)
+        if state:
+            self._random.setstate(state)
+        for cards, name in ((self._hand, Zone.HAND), (self._table, Zone.TABLE),
+                            (self._lab, Zone.LAB),
+                            (self._discard, Zone.DISCARD)):
+            move_zone(cards, name)
+
     def shuffle_deck(self) -> None:
         """Shuffles player's deck."""
-        self._deck.shuffle()
+        self._deck.shuffle(self._random)
 
     def can_mulligan(self) -> bool:
         """Returns wether or not the player can perform a mulligan.
@@ -130,7 +324,9 @@ class Player:
             True if successful, False otherwise.
         """
         if self.can_mulligan():
-            self.end_turn()
+            if self._telemetry:
+                self._telemetry.record(Metric.MULLIGAN, self.seat)
+            self._redraw()
             return True
         return False
 
@@ -164,14 +360,50 @@ class Player:
         board.append(card)
         card.zone = zone
 
-    # irrelevant with no card effects
-    # def play_card(self, card: Card) -> None:
-    #     """Play card to the table and activate its effect.
+    def play_card(self, card: Card) -> bool:
+        """Play card to the table and activate its effect. Cards without an
+        effect can't be played, as playing them would do nothing.
+
+        Args:
+            card: Card to be played.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        effect = self.effects.dispatch[card.number]
+        if not effect:
+            return False
+        self._play(self._table, card, Zone.TABLE)
+        effect(self)
+        if self._telemetry:
+            self._telemetry.record(Metric.PLAY, self.seat, card.number,
+                                   card.mass, self._energy)
+        return True
+
+    def gain_energy(self, amount: int) -> None:
+        """Adds energy to spend this turn, as an effect.
+
+        Args:
+            amount: Energy to add.
+        """
+        self._energy += amount
+
+    def draw(self, amount: int) -> None:
+        """Draws cards to the player's hand, as an effect.
+
+        Args:
+            amount: Amount of cards to draw.
+        """
+        for _ in range(amount):
+            self._draw()
 
-    #     Args:
-    #         card: Card to be played.
-    #     """
-    #     self._play(self._table, card, Zone.TABLE)
+    def allow_synthesis(self, amount: int = 1) -> None:
+        """Allows more syntheses this turn, as an effect.
+
+        Args:
+            amount: Amount of extra syntheses.
+        """
+        self._syntheses += amount
 
     def harvest_card(self, card: Card, reverse: bool = False) -> bool:
         """Plays card for its energy value, or returns previously harvested
@@ -192,18 +424,26 @@ class Player:
                 self.interact_with_table(card)
                 self._hand.append(card)
                 card.zone = Zone.HAND
+                if self._telemetry:
+                    self._telemetry.record(Metric.HARVEST, self.seat,
+                                           card.number, card.mass,
+                                           -card.number)
                 return True
             return False
 
         self._play(self._table, card, Zone.TABLE)
         self._energy += card.number
         self._unused.append(card)
+        if self._telemetry:
+            self._telemetry.record(Metric.HARVEST, self.seat, card.number,
+                                   card.mass, card.number)
         return True
 
     def synthesize(self, card: Card, reverse: bool = False) -> bool:
         """Adds card to the lab.
 
-        Only one synthesis is allowed each turn.
+        `SYNTHESES_PER_TURN` syntheses are allowed each turn, and more if
+        allowed by effects. Only the last one can be reversed.
 
         Args:
             card: card to be synthesized.
@@ -215,14 +455,22 @@ class Player:
         if reverse:
             if card == self._last_synthesis:
                 self._last_synthesis = None
+                self._syntheses += 1
                 self._hand.append(card)
                 card.zone = Zone.HAND
+                if self._telemetry:
+                    self._telemetry.record(Metric.SYNTHESIS, self.seat,
+                                           card.number, card.mass, -1)
                 return True
             return False
 
-        if not self._last_synthesis and card:
+        if self._syntheses > 0 and card:
+            self._syntheses -= 1
             self._last_synthesis = card
             self._play(self._lab, card, Zone.LAB)
+            if self._telemetry:
+                self._telemetry.record(Metric.SYNTHESIS, self.seat,
+                                       card.number, card.mass, 1)
             return True
         return False
 
@@ -237,22 +485,29 @@ class Player:
         """
         if card.mass > self._energy:
             return False
+        if self._telemetry:
+            self._telemetry.record(Metric.BUY, self.seat, card.number,
+                                   card.mass, self._energy)
         self._energy = 0
         self._unused = []
         self._table.append(card)
         card.zone = Zone.TABLE
         return True
 
-    def _show_vertical(self, zone: List[Card],
-                       board: Board) -> CARD_IMG:
+    def _show_vertical(self, zone: List[Card], board: Board,
+                       name: Zone) -> CARD_IMG:
         """Returns list of card image and location tuples to be printed to the
         screen.
 
-        Used for vertical boards.
+        Used for vertical boards. Only cards within the board's visible
+        window are rendered, starting from the zone's scroll position. If
+        stacking is on, equal elements are shown as a single card with a
+        count.
 
         Args:
             zone: Game zone to be printed.
             board: Board the cards will be printed on.
+            name: Zone's name, for keeping its scroll position.
 
         Returns:
             List of card image and location tuples to be printed.
@@ -260,6 +515,7 @@ class Player:
         cards = []
         location = 12.5
         top = 15
+        step = CARD.height / 4 + top
 
         width = (board.width - CARD.width) / 2
 
@@ -267,15 +523,75 @@ class Player:
         if zone is self._lab:
             seq = sorted(sorted(zone), key=lambda x: x.category)
 
+        stacks: List[List[Card]] = []
         for card in seq:
+            if (self.stacked and stacks
+                    and stacks[-1][-1].number == card.number):
+                stacks[-1].append(card)
+            else:
+                stacks.append([card])
+
+        visible = int((board.height - location) // step) + 1
+        first = min(self._scroll.get(name, 0), max(0, len(stacks) - visible))
+        self._scroll[name] = first
+
+        for i, stack in enumerate(stacks):
+            # hidden cards get no area, so they can't be picked up
+            *hidden, card = stack
+            for other in hidden:
+                other.rect.size = 0, 0
+            if not first <= i < first + visible:
+                card.rect.size = 0, 0
+                continue
             card.render()
             card.rect.update((board.x + width,
                               board.y + location), CARD.size)
             cards.append((card.img, card.rect))
-            location += CARD.height / 4 + top
+            if hidden:
+                count = render_text(LAYOUT.small_font, f'x{len(stack)}',
+                                    *WHITE_FONT)
+                cards.append((count, count.get_rect(
+                    topright=(card.rect.right - LAYOUT.card_border * 2,
+                              card.rect.top + LAYOUT.card_border * 2))))
+            location += step
 
         return cards
 
+    def scroll(self, name: Zone, amount: int) -> None:
+        """Scrolls a vertical zone.
+
+        Args:
+            name: Zone to scroll.
+            amount: Amount of cards to scroll by, negative values scroll up.
+        """
+        self._scroll[name] = max(0, self._scroll.get(name, 0) + amount)
+
+    def get_version(self, name: Zone) -> Tuple[int, ...]:
+        """Returns the version of a zone's visualization, which changes
+        whenever the zone's cards do, and for vertical zones whenever their
+        scroll position or stacking does.
+
+        Args:
+            name: Hand, table, discard or lab.
+
+        Returns:
+            Version of the zone's visualization.
+        """
+        if name is Zone.HAND:
+            return self._hand.version,
+        if name is Zone.TABLE:
+            zone = self._table
+        elif name is Zone.DISCARD:
+            zone = self._discard
+        else:
+            zone = self._lab
+        return zone.version, self._scroll.get(name, 0), self.stacked
+
+    def toggle_stacks(self) -> None:
+        """Switches between showing equal elements as a single stack in
+        vertical zones and showing every card."""
+        self.stacked = not self.stacked
+
     def show_hand(self) -> CARD_IMG:
         """Returns visualization of cards played during the current turn to be
         printed to the screen.
@@ -284,7 +600,7 @@ class Player:
             Visualization of cards to be printed.
         """
         cards = []
-        location: NUM = SPACE
+        location: NUM = LAYOUT.space
 
         height = HAND.height / 2 - CARD.height / 2
         if len(self._hand) > 5:
@@ -297,7 +613,7 @@ class Player:
             card.rect.update((HAND.x + location,
                               HAND.y + height), CARD.size)
             cards.append((card.img, card.rect))
-            location += CARD.width + SPACE
+            location += CARD.width + LAYOUT.space
 
         return cards
 
@@ -308,7 +624,7 @@ class Player:
         Returns:
             Visualization of cards to be printed.
         """
-        return self._show_vertical(self._table, TABLE)
+        return self._show_vertical(self._table, TABLE, Zone.TABLE)
 
     def show_discard(self) -> CARD_IMG:
         """Returns visualization of cards in player's discard to be printed to
@@ -317,7 +633,7 @@ class Player:
         Returns:
             Visualization of cards to be printed.
         """
-        return self._show_vertical(self._discard, DISCARD)
+        return self._show_vertical(self._discard, DISCARD, Zone.DISCARD)
 
     def show_lab(self) -> CARD_IMG:
         """Returns visualization of cards in player's lab to be printed to the
@@ -326,20 +642,22 @@ class Player:
         Returns:
             Visualization of cards to be printed.
         """
-        return self._show_vertical(self._lab, LAB)
+        return self._show_vertical(self._lab, LAB, Zone.LAB)
 
-    def show_buttons(self, screen: Surface) -> None:
-        """Displays relevant button on the screen.
+    def show_buttons(self) -> CARD_IMG:
+        """Returns visualization of relevant buttons to be printed to the
+        screen.
 
-        Args:
-            screen: Surface object onto which to paste images.
+        Returns:
+            Visualization of buttons to be printed.
         """
-        show_button(screen, 'End Turn', END_TURN, 'end_turn')
+        buttons = [show_button('End Turn', END_TURN, 'end_turn')]
         if self.can_mulligan():
-            show_button(screen, 'Mulligan', ENERGY, 'mulligan')
+            buttons.append(show_button('Mulligan', ENERGY, 'mulligan'))
         else:
-            show_button(screen, f'Energy: {self._energy}',
-                                ENERGY, 'energy')
+            buttons.append(show_button(f'Energy: {self._energy}',
+                                       ENERGY, 'energy'))
+        return buttons
 
     def interact_with_hand(self, card: Card, add: bool = False) -> None:
         """Adds or removes card from hand.
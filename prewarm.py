@@ -0,0 +1,57 @@
+from threading import Event, Thread
+from typing import Iterable, List, Optional, Set
+
+from periodical.card import Card
+from periodical.utils import update_cached_atlas
+
+
+class Prewarmer(Thread):
+    """A class for rendering card images into the atlas on a background
+    thread, ahead of their first appearance.
+
+    Cards are rendered in the order given, most urgent first, skipping
+    repeated elements. Once done, the atlas is written to the disk cache
+    `directory`, if given, unless nothing was added since it held `cached`
+    images.
+
+    Attributes:
+        total: Amount of unique cards to render.
+        done: Amount of cards rendered so far.
+    """
+    def __init__(self, cards: Iterable[Card], directory: Optional[str] = None,
+                 cached: int = 0) -> None:
+        super().__init__(name='prewarmer', daemon=True)
+        self._cards: List[Card] = []
+        numbers: Set[int] = set()
+        for card in cards:
+            if card.number not in numbers:
+                numbers.add(card.number)
+                self._cards.append(card)
+        self._directory = directory
+        self._cached = cached
+        self._cancelled = Event()
+        self.total = len(self._cards)
+        self.done = 0
+
+    @property
+    def progress(self) -> float:
+        """Returns the rendered fraction of the cards."""
+        if not self.total:
+            return 1.0
+        return self.done / self.total
+
+    def cancel(self) -> None:
+        """Stops rendering after the current card."""
+        self._cancelled.set()
+
+    def run(self) -> None:
+        """Renders the cards, then writes the atlas to the disk cache if a
+        directory was given and the thread wasn't cancelled."""
+        for card in self._cards:
+            if self._cancelled.is_set():
+                return
+            card.prerender()
+            self.done += 1
+        if self._directory:
+            update_cached_atlas(self._directory, self._cached,
+                                self._cancelled)
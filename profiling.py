@@ -0,0 +1,135 @@
+import os
+import pstats
+import signal
+import sys
+from collections import Counter
+from threading import Event, main_thread, Thread
+from types import FrameType
+from typing import Any, Iterable, List, Optional
+
+
+SAMPLE_INTERVAL = 0.001
+RULES_FUNCTIONS = ('perform', 'get_moves', 'buy_card', 'end_turn',
+                   '_fill_all_markets', 'generate_cards')
+PACKAGE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _label(frame: FrameType) -> str:
+    """Returns a frame's function as a flame graph frame name."""
+    code = frame.f_code
+    return (f'{code.co_name} ({os.path.basename(code.co_filename)}:'
+            f'{code.co_firstlineno})')
+
+
+class Sampler:
+    """A class for sampling the call stack of the main thread at a fixed
+    interval of CPU time.
+
+    Where available, a profiling timer signal interrupts the main thread, so
+    samples land wherever it spends its time. Elsewhere a background thread
+    samples instead, which only runs when the main thread releases the GIL,
+    so samples gather where it blocks.
+
+    Stacks are counted in the collapsed format read by flame graph tools,
+    such as flamegraph.pl and speedscope: one line per distinct stack, its
+    frames from the outermost separated by semicolons, followed by the
+    amount of samples.
+
+    Attributes:
+        interval: Seconds between samples.
+        samples: Amount of samples of each stack.
+    """
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._target = main_thread().ident
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+        self._previous: Any = None
+
+    def _sample(self, frame: Optional[FrameType]) -> None:
+        """Counts the stack ending in the frame."""
+        stack: List[str] = []
+        while frame is not None:
+            stack.append(_label(frame))
+            frame = frame.f_back
+        if stack:
+            self.samples[';'.join(reversed(stack))] += 1
+
+    def _handle(self, signum: int, frame: Optional[FrameType]) -> None:
+        """Samples the interrupted frame. Installed as the signal handler."""
+        self._sample(frame)
+
+    def _run(self) -> None:
+        """Samples the main thread's stack until stopped."""
+        while not self._stopped.wait(self.interval):
+            self._sample(sys._current_frames().get(
+                self._target))  # type: ignore
+
+    def start(self) -> None:
+        """Starts sampling. Must be called from the main thread."""
+        self._stopped.clear()
+        if hasattr(signal, 'setitimer'):
+            self._previous = signal.signal(signal.SIGPROF, self._handle)
+            signal.setitimer(signal.ITIMER_PROF, self.interval,
+                             self.interval)
+        else:
+            self._thread = Thread(target=self._run, name='sampler',
+                                  daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        elif hasattr(signal, 'setitimer'):
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            if self._previous is not None:
+                signal.signal(signal.SIGPROF, self._previous)
+                self._previous = None
+
+    def collapsed(self) -> str:
+        """Returns the samples in the collapsed stack format."""
+        return ''.join(f'{stack} {count}\n'
+                       for stack, count in self.samples.most_common())
+
+    def write(self, path: str) -> None:
+        """Writes the samples to a file in the collapsed stack format.
+
+        Args:
+            path: Path of the file.
+        """
+        with open(path, 'w', encoding='utf-8') as file_handler:
+            file_handler.write(self.collapsed())
+
+
+def breakdown(stats: pstats.Stats,
+              functions: Iterable[str] = RULES_FUNCTIONS) -> str:
+    """Returns the time spent in each of the package's functions with the
+    given names. Methods sharing a name are listed separately, by module.
+
+    Args:
+        stats: Profile to summarize.
+        functions: Names of functions to include.
+
+    Returns:
+        Human readable table of calls and cumulative times.
+    """
+    names = set(functions)
+    total = stats.total_tt  # type: ignore
+    rows = []
+    for (path, _, name), (_, calls, _, cumulative, _) in (
+            stats.stats.items()):  # type: ignore
+        if name in names and os.path.dirname(os.path.abspath(path)) == PACKAGE:
+            module = os.path.splitext(os.path.basename(path))[0]
+            rows.append((cumulative, f'{module}.{name}', calls))
+    lines = [f'{"function":<26} {"calls":>9} {"total s":>9} '
+             f'{"per call us":>12} {"share":>6}']
+    for cumulative, label, calls in sorted(rows, reverse=True):
+        lines.append(f'{label:<26} {calls:>9} {cumulative:>9.3f} '
+                     f'{1e6 * cumulative / calls:>12.1f} '
+                     f'{cumulative / total if total else 0:>6.1%}')
+    lines.append(f'{"total":<26} {"":>9} {total:>9.3f}')
+    return '\n'.join(lines)
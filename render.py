@@ -0,0 +1,269 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+import pygame
+from pygame.surface import Surface
+
+from periodical.atlas import ATLAS
+from periodical.config import LAYOUT, SCREEN
+from periodical.game import Game
+from periodical.replay import ReplayArchive
+from periodical.utils import apply_scale, get_cache_directory
+
+
+CHUNKSIZE = 8
+IMAGE_FORMAT = 'png'
+CHANNELS = 3
+POSITION = Dict[str, Any]
+TASK = Tuple[int, POSITION]
+
+# state of each worker process, set by _init_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def snapshot_position(game: Game) -> POSITION:
+    """Returns a position to render, holding the game's current state.
+
+    Args:
+        game: Game to take a snapshot of.
+
+    Returns:
+        Names of the game's players and its snapshot.
+    """
+    return {'names': list(game.names), 'snapshot': game.get_snapshot()}
+
+
+def replay_position(path: str, game_id: int, turn: int) -> POSITION:
+    """Returns a position to render, pointing into a replay archive.
+
+    Args:
+        path: Path of the archive.
+        game_id: Id of the archived game.
+        turn: Turn to render the start of, 1 being the first.
+
+    Returns:
+        Location of the position in the archive.
+    """
+    return {'archive': path, 'game': game_id, 'turn': turn}
+
+
+def load_position(position: POSITION,
+                  archives: Optional[Dict[str, ReplayArchive]] = None
+                  ) -> Game:
+    """Returns the game in a position.
+
+    Args:
+        position: Snapshot or replay position.
+        archives: Replay archives opened so far, by path, reused and added
+                  to if given.
+
+    Returns:
+        The game.
+    """
+    if 'archive' in position:
+        path = position['archive']
+        if archives is None:
+            archives = {}
+        if path not in archives:
+            archives[path] = ReplayArchive(path)
+        return archives[path].open(position['game'], position['turn'])
+    game = Game(*position['names'])
+    game.setup()
+    game.load_snapshot(position['snapshot'])
+    return game
+
+
+def get_frame_size(scale: float = 1.0) -> Tuple[int, int]:
+    """Returns the width and height of boards rendered at a scale.
+
+    Args:
+        scale: Factor to scale all lengths by.
+
+    Returns:
+        Width and height in pixels.
+    """
+    previous = LAYOUT.scale
+    apply_scale(scale)
+    size = SCREEN.size
+    apply_scale(previous)
+    return int(size[0]), int(size[1])
+
+
+def _init_worker(scale: float, directory: Optional[str],
+                 frames: Optional[str]) -> None:
+    """Prepares a worker process for offscreen rendering.
+
+    The display is restarted with the dummy driver, as the one inherited
+    from the parent may be a window, or not be usable after forking.
+
+    Args:
+        scale: Factor to scale all lengths by.
+        directory: Directory to write image files to, if any.
+        frames: Path of the NumPy array of frames to write to, if any.
+    """
+    pygame.display.quit()
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    apply_scale(scale)
+    ATLAS.load(get_cache_directory())
+    _WORKER.clear()
+    _WORKER.update(
+        directory=directory, archives={},
+        surface=Surface(SCREEN.size).convert(),
+        frames=np.load(frames, mmap_mode='r+') if frames else None)
+
+
+def _render(task: TASK) -> Optional[str]:
+    """Renders a position in a worker process.
+
+    Args:
+        task: Index of the position and the position.
+
+    Returns:
+        Path of the image file written, or None if written to the frames.
+    """
+    index, position = task
+    game = load_position(position, _WORKER['archives'])
+    surface = game.render(_WORKER['surface'])
+    frames = _WORKER['frames']
+    if frames is not None:
+        frames[index] = np.frombuffer(
+            pygame.image.tobytes(surface, 'RGB'),
+            dtype=np.uint8).reshape(frames.shape[1:])
+        return None
+    path = os.path.join(_WORKER['directory'], f'{index:06d}.{IMAGE_FORMAT}')
+    pygame.image.save(surface, path)
+    return path
+
+
+def _run(positions: Iterable[POSITION], workers: Optional[int],
+         chunksize: int, *initargs: Any) -> Iterator[Optional[str]]:
+    """Renders positions across a pool of worker processes.
+
+    Args:
+        positions: Positions to render.
+        workers: Amount of processes to use, defaults to the CPU count.
+        chunksize: Amount of positions sent to a worker at once.
+        initargs: Arguments of `_init_worker`.
+
+    Returns:
+        Result of each position, in order.
+    """
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=initargs) as pool:
+        yield from pool.map(_render, enumerate(positions),
+                            chunksize=chunksize)
+
+
+def render_images(positions: Iterable[POSITION], directory: str,
+                  scale: float = 1.0, workers: Optional[int] = None,
+                  chunksize: int = CHUNKSIZE) -> List[str]:
+    """Renders the board of each position into an image file, named by the
+    position's index.
+
+    Args:
+        positions: Snapshot or replay positions.
+        directory: Directory to write the files to.
+        scale: Factor to scale all lengths by, lower for thumbnails.
+        workers: Amount of processes to use, defaults to the CPU count.
+        chunksize: Amount of positions sent to a worker at once.
+
+    Returns:
+        Paths of the files, in the order of the positions.
+    """
+    os.makedirs(directory, exist_ok=True)
+    return [path for path in _run(positions, workers, chunksize, scale,
+                                  directory, None) if path]
+
+
+def render_frames(positions: List[POSITION], path: str, scale: float = 1.0,
+                  workers: Optional[int] = None,
+                  chunksize: int = CHUNKSIZE) -> 'np.memmap':
+    """Renders the board of each position into a memory mapped NumPy array
+    file, of shape (positions, height, width, 3) and RGB pixels. Workers
+    write their frames into the file directly.
+
+    Args:
+        positions: Snapshot or replay positions.
+        path: Path of the .npy file.
+        scale: Factor to scale all lengths by, lower for thumbnails.
+        workers: Amount of processes to use, defaults to the CPU count.
+        chunksize: Amount of positions sent to a worker at once.
+
+    Returns:
+        The frames, mapped read-only.
+
+    Raises:
+        ImportError: If NumPy isn't installed.
+    """
+    if np is None:
+        raise ImportError('NumPy is required for frame arrays')
+    width, height = get_frame_size(scale)
+    frames = np.lib.format.open_memmap(
+        path, mode='w+', dtype=np.uint8,
+        shape=(len(positions), height, width, CHANNELS))
+    del frames
+    for _ in _run(positions, workers, chunksize, scale, None, path):
+        pass
+    return np.load(path, mmap_mode='r')
+
+
+def read_positions(path: str) -> List[POSITION]:
+    """Reads positions from a newline delimited json file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Position of each line.
+    """
+    with open(path, 'r', encoding='utf-8') as file_handler:
+        return [json.loads(line) for line in file_handler if line.strip()]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Renders boards of game snapshots or replay positions '
+                    'offscreen, across worker processes.')
+    parser.add_argument('out', help='directory of image files, or .npy file '
+                                    'of frames')
+    parser.add_argument('--positions',
+                        help='json lines file of snapshot or replay '
+                             'positions')
+    parser.add_argument('--archive', help='replay archive to render turns of')
+    parser.add_argument('--games', type=int, nargs='+', default=[],
+                        help='archived games to render, defaults to all')
+    parser.add_argument('--turns', type=int, nargs='+', default=[1],
+                        help='turns of each archived game to render')
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    args = parser.parse_args()
+
+    positions: List[POSITION] = []
+    if args.positions:
+        positions.extend(read_positions(args.positions))
+    if args.archive:
+        archive = ReplayArchive(args.archive)
+        for game_id in args.games or archive.games():
+            positions.extend(replay_position(args.archive, game_id, turn)
+                             for turn in args.turns)
+        archive.close()
+    if args.out.endswith('.npy'):
+        shape = render_frames(positions, args.out, args.scale, args.workers,
+                              args.chunksize).shape
+        print(f'{shape[0]} frames of {shape[2]}x{shape[1]} written to '
+              f'{args.out}')
+    else:
+        paths = render_images(positions, args.out, args.scale, args.workers,
+                              args.chunksize)
+        print(f'{len(paths)} images written to {args.out}')
@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+import struct
+import zlib
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Tuple
+
+from periodical.bots import STRATEGIES
+from periodical.config import Action, MOVE
+from periodical.game import Game
+from periodical.simulate import play_game
+
+
+KEYFRAME_INTERVAL = 16
+INDEX_SUFFIX = '.idx'
+NAMES = 'bot',
+FRAME = struct.Struct('<I')
+ENTRY = struct.Struct('<QIQ')
+MOVE_RECORD = struct.Struct('<BH')
+
+
+class ReplayArchive:
+    """A class for storing replays in an append-only file, with random access
+    to the start of any turn of any game.
+
+    Each game is split into segments of `interval` turns, each compressed as
+    a single block. A segment starts with a keyframe, the snapshot of the
+    game at the start of its first turn, followed by the moves of its turns,
+    three bytes each. The first segment's keyframe is the seed instead, from
+    which the game is dealt anew.
+
+    An index file next to the archive maps each game and the first turn of
+    each of its segments to the segment's offset. Opening a turn reads a
+    single segment and replays fewer than `interval` turns.
+
+    Attributes:
+        path: Path of the archive file.
+        interval: Amount of turns between keyframes of added games.
+    """
+    def __init__(self, path: str, interval: int = KEYFRAME_INTERVAL) -> None:
+        self.path = path
+        self.interval = interval
+        self._index: Dict[int, Tuple[List[int], List[int]]] = {}
+        self._archive = open(path, 'a+b')
+        self._load_index()
+        self._entries = open(path + INDEX_SUFFIX, 'ab')
+
+    def __contains__(self, game_id: object) -> bool:
+        return game_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _load_index(self) -> None:
+        """Reads the index file, ignoring entries of segments missing from
+        the archive, left by an interrupted write."""
+        path = self.path + INDEX_SUFFIX
+        if not os.path.exists(path):
+            return
+        size = os.path.getsize(self.path)
+        with open(path, 'rb') as file_handler:
+            data = file_handler.read()
+        data = data[:len(data) - len(data) % ENTRY.size]
+        for game_id, turn, offset in ENTRY.iter_unpack(data):
+            if offset < size:
+                turns, offsets = self._index.setdefault(game_id, ([], []))
+                turns.append(turn)
+                offsets.append(offset)
+
+    def games(self) -> List[int]:
+        """Returns the ids of the archived games."""
+        return list(self._index)
+
+    def _encode(self, header: Dict[str, Any], moves: bytes) -> bytes:
+        """Returns a compressed segment.
+
+        Args:
+            header: Game's id, players and seed, the segment's first turn
+                    and its keyframe.
+            moves: Encoded moves of the segment's turns.
+
+        Returns:
+            Segment, prefixed by its length.
+        """
+        data = zlib.compress(json.dumps(header, separators=(',', ':')).encode()
+                             + b'\n' + moves)
+        return FRAME.pack(len(data)) + data
+
+    def add(self, game_id: int, seed: int, moves: Iterable[MOVE],
+            names: Iterable[str] = NAMES) -> None:
+        """Appends a game to the archive.
+
+        The game is replayed to take the keyframes.
+
+        Args:
+            game_id: Unique id of the game.
+            seed: Seed the game was played with.
+            moves: Successful moves of the game, as recorded by
+                   `Game.history`.
+            names: Names of the game's players.
+
+        Raises:
+            ValueError: If the game is already archived or a move is illegal.
+        """
+        if game_id in self._index:
+            raise ValueError(f'game {game_id} is already archived')
+        names = list(names)
+        game = Game(*names, seed=seed)
+        game.setup()
+        header: Dict[str, Any] = {'game': game_id, 'names': names,
+                                  'seed': seed, 'turn': 1}
+        buffer = bytearray()
+        segments: List[Tuple[int, bytes]] = []
+        turn = 1
+        for i, (action, number) in enumerate(moves):
+            if not game.perform(action, number):
+                raise ValueError(f'move #{i} of game {game_id} is illegal')
+            buffer += MOVE_RECORD.pack(action.value, number)
+            if action is Action.END_TURN:
+                turn += 1
+                if (turn - 1) % self.interval == 0:
+                    segments.append((header['turn'],
+                                     self._encode(header, bytes(buffer))))
+                    header = {'game': game_id, 'names': names, 'seed': seed,
+                              'turn': turn, 'snapshot': game.get_snapshot()}
+                    buffer.clear()
+        segments.append((header['turn'], self._encode(header, bytes(buffer))))
+
+        offset = self._archive.seek(0, os.SEEK_END)
+        turns: List[int] = []
+        offsets: List[int] = []
+        for first, segment in segments:
+            turns.append(first)
+            offsets.append(offset)
+            self._archive.write(segment)
+            offset += len(segment)
+        self._archive.flush()
+        self._entries.write(b''.join(
+            ENTRY.pack(game_id, first, start)
+            for first, start in zip(turns, offsets)))
+        self._entries.flush()
+        self._index[game_id] = turns, offsets
+
+    def _read(self, offset: int) -> Tuple[Dict[str, Any], bytes]:
+        """Reads a segment.
+
+        Args:
+            offset: Segment's offset in the archive.
+
+        Returns:
+            Segment's header and encoded moves.
+        """
+        self._archive.seek(offset)
+        size, = FRAME.unpack(self._archive.read(FRAME.size))
+        header, moves = zlib.decompress(self._archive.read(size)).split(
+            b'\n', 1)
+        return json.loads(header), moves
+
+    def open(self, game_id: int, turn: int = 1) -> Game:
+        """Returns an archived game at the start of one of its turns.
+
+        Args:
+            game_id: Id of the game.
+            turn: Turn to open, 1 being the first.
+
+        Returns:
+            The game, which may be continued.
+
+        Raises:
+            KeyError: If the game isn't archived.
+            ValueError: If the game has no such turn.
+        """
+        if game_id not in self._index:
+            raise KeyError(f'game {game_id} is not archived')
+        turns, offsets = self._index[game_id]
+        i = bisect_right(turns, turn) - 1
+        if i < 0:
+            raise ValueError(f'game {game_id} has no turn {turn}')
+        header, moves = self._read(offsets[i])
+        game = Game(*header['names'], seed=header['seed'])
+        game.setup()
+        if 'snapshot' in header:
+            game.load_snapshot(header['snapshot'])
+        current = header['turn']
+        for value, number in MOVE_RECORD.iter_unpack(moves):
+            if current == turn:
+                break
+            action = Action(value)
+            game.perform(action, number)
+            if action is Action.END_TURN:
+                current += 1
+        if current != turn:
+            raise ValueError(f'game {game_id} has no turn {turn}')
+        return game
+
+    def close(self) -> None:
+        """Closes the archive's files."""
+        self._archive.close()
+        self._entries.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Records simulated games into a replay archive, or shows '
+                    'a turn of an archived game.')
+    parser.add_argument('archive')
+    parser.add_argument('--simulate', type=int, default=0,
+                        help='amount of games to simulate and record')
+    parser.add_argument('--first-seed', type=int, default=0,
+                        help='seed of the first simulated game, also its id')
+    parser.add_argument('--strategy', default='greedy',
+                        choices=list(STRATEGIES))
+    parser.add_argument('--interval', type=int, default=KEYFRAME_INTERVAL,
+                        help='turns between keyframes')
+    parser.add_argument('--show', type=int, nargs=2,
+                        metavar=('GAME', 'TURN'),
+                        help='print the state at the start of a turn')
+    args = parser.parse_args()
+
+    archive = ReplayArchive(args.archive, args.interval)
+    for seed in range(args.first_seed, args.first_seed + args.simulate):
+        history: List[MOVE] = []
+        play_game(STRATEGIES[args.strategy], seed, history=history)
+        archive.add(seed, seed, history)
+    if args.show:
+        print(json.dumps(archive.open(*args.show).get_state()))
+    archive.close()
@@ -0,0 +1,127 @@
+from random import Random
+from typing import Any, Callable, Dict, List, Optional
+
+from periodical.bots import STRATEGY
+from periodical.config import Action, MOVE
+from periodical.game import Game
+from periodical.player import Player
+
+
+LAB_GOAL = 10
+MAX_TURNS = 200
+MAX_ACTIONS = 100
+RECORD = Dict[str, Any]
+
+
+def reached_goal(player: Player, goal: int = LAB_GOAL) -> bool:
+    """Returns whether or not the player's lab holds enough unique elements.
+
+    Args:
+        player: Player to inspect.
+        goal: Amount of unique elements required.
+
+    Returns:
+        True if the goal was reached, False otherwise.
+    """
+    return len({card.number for card in player.get_lab()}) >= goal
+
+
+def play_game(strategy: STRATEGY, seed: int, goal: int = LAB_GOAL,
+              max_turns: int = MAX_TURNS,
+              record: Optional[Callable[[RECORD], None]] = None,
+              history: Optional[List[MOVE]] = None) -> int:
+    """Plays a single-player game without displaying it.
+
+    The turn is ended for the strategy if it makes an illegal move, or too
+    many moves in a single turn.
+
+    If `record` is passed, it receives a record of each turn, and a final
+    record of the game. Turn records hold the market at the start of the
+    turn, the cards harvested, synthesized, bought and played, the energy
+    harvested and whether each market deck ran out during the turn.
+
+    Args:
+        strategy: Function choosing each move.
+        seed: Seed for both the game and the strategy.
+        goal: Amount of unique elements required in the lab.
+        max_turns: Amount of turns after which the game is abandoned.
+        record: Function receiving the game's records.
+        history: List to append the game's successful moves to, replayable
+                 with `Game.perform`.
+
+    Returns:
+        Amount of turns needed to reach the goal, or `max_turns` + 1 if it
+        wasn't reached.
+    """
+    game = Game('bot', seed=seed)
+    game.setup()
+    game.history = history
+    rng = Random(seed)
+    turns = actions = 1
+    turn = _start_turn(game, seed, turns) if record else {}
+    while not reached_goal(game.current_player, goal) and turns <= max_turns:
+        action, number = strategy(game, rng)
+        if actions >= MAX_ACTIONS or not game.perform(action, number):
+            action, number = Action.END_TURN, 0
+            game.perform(action)
+        actions += 1
+        if record:
+            _record_move(game, turn, action, number)
+        if action is Action.END_TURN:
+            if record:
+                record(turn)
+            turns += 1
+            actions = 1
+            if record:
+                turn = _start_turn(game, seed, turns)
+    if record:
+        if turns <= max_turns:
+            record(turn)
+        record({'game': seed, 'turns': turns,
+                'goal': reached_goal(game.current_player, goal)})
+    return turns
+
+
+def _start_turn(game: Game, seed: int, turn: int) -> RECORD:
+    """Returns an empty record of a turn.
+
+    Args:
+        game: Game being played.
+        seed: Game's seed.
+        turn: Turn's number.
+
+    Returns:
+        Record of the turn.
+    """
+    light, heavy = game.get_deck_sizes()
+    return {'game': seed, 'turn': turn,
+            'market': [card.number for card in game.get_market()],
+            'harvested': [], 'synthesized': [], 'bought': [], 'played': [],
+            'energy': 0,
+            'light_left': light, 'heavy_left': heavy,
+            'light_exhausted': False, 'heavy_exhausted': False}
+
+
+def _record_move(game: Game, turn: RECORD, action: Action,
+                 number: int) -> None:
+    """Adds a successful move to a turn's record.
+
+    Args:
+        game: Game being played.
+        turn: Record of the turn.
+        action: Action performed.
+        number: Atomic number of the card the action applied to.
+    """
+    moves: Dict[Action, List[int]] = {
+        Action.HARVEST: turn['harvested'],
+        Action.SYNTHESIZE: turn['synthesized'],
+        Action.BUY: turn['bought'],
+        Action.PLAY: turn['played'],
+    }
+    if action in moves:
+        moves[action].append(number)
+    if action is Action.HARVEST:
+        turn['energy'] += number
+    light, heavy = game.get_deck_sizes()
+    turn['light_exhausted'] |= turn['light_left'] > 0 and not light
+    turn['heavy_exhausted'] |= turn['heavy_left'] > 0 and not heavy
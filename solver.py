@@ -0,0 +1,738 @@
+import argparse
+from array import array
+from collections import Counter
+from itertools import combinations
+from random import Random
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from periodical.catalog import get_catalog
+from periodical.config import Action, MOVE, PATH, UNDO
+from periodical.game import Game
+from periodical.openings import describe, HAND_SIZE, LINE
+
+
+MAX_TURNS = 30
+TABLE_BITS = 20
+MAX_NODES = 200_000
+BEAM_WIDTH = 32
+ZOBRIST_SEED = 0x5EED
+MASK = (1 << 64) - 1
+# a bound beyond any amount of turns, for goals which can't be reached
+UNREACHABLE = 1 << 30
+FEATURE = Tuple[Any, ...]
+STEP = Tuple[MOVE, ...]
+END_TURN: MOVE = (Action.END_TURN, 0)
+MULLIGAN: STEP = ((Action.MULLIGAN, 0),)
+
+
+class Zobrist:
+    """A class for assigning random 64 bit keys to features of a position.
+
+    Zones are multisets, so a position's hash is the sum of the keys of its
+    features modulo 2 ** 64, rather than their exclusive or, under which two
+    copies of a card would cancel out. Moving a card between zones adds the
+    difference of two keys.
+    """
+    def __init__(self, seed: int = ZOBRIST_SEED) -> None:
+        self._random = Random(seed)
+        self._keys: Dict[FEATURE, int] = {}
+
+    def __call__(self, *feature: Any) -> int:
+        """Returns the key of a feature, drawn on first use.
+
+        Args:
+            feature: Hashable description of the feature.
+
+        Returns:
+            Key of the feature.
+        """
+        key = self._keys.get(feature)
+        if key is None:
+            key = self._keys[feature] = self._random.getrandbits(64)
+        return key
+
+
+class BudgetExceeded(Exception):
+    """Raised when a search visits more positions than it may."""
+
+
+class Solver:
+    """A class for finding the fewest turns in which a seeded single-player
+    deal can reach a lab composition.
+
+    Turns are searched by iterative deepening over the amount of turns
+    ended, with `Game.make` and `Game.unmake`, over every order of every
+    legal move, so that the first solution found takes the fewest turns.
+    Only moves which can't change the outcome are left out:
+
+    - a synthesis commutes with the other moves of its turn, so it is only
+      searched before them, or right after the move allowing it, such as
+      drawing the card or playing for an extra synthesis, and syntheses in
+      a row in ascending order;
+    - while the deck can't run out within the turns left, cards put on the
+      table are discarded and not drawn again in time, so only syntheses of
+      missing elements, plays which draw or allow syntheses, mulligans and
+      ending the turn are searched, and none but the first two in the last
+      turn.
+
+    Each position is hashed incrementally: moves within a turn move cards
+    and update the hash by key differences, while ending the turn, taking a
+    mulligan or drawing cards rehash the player's zones from their cards.
+    The random state is only drawn from by reshuffles once the game is
+    dealt, so it is hashed by the sizes of the piles reshuffled so far. The
+    order of the hand, table and discard pile decides the order of the deck
+    once the discard pile is reshuffled into it, so it is hashed, along
+    with the random state, only while a reshuffle is within reach.
+    Otherwise, the orders in which a turn's moves can be made transpose
+    into one position.
+
+    Positions proven to miss the goal within some amount of turns are kept
+    in a transposition table of `2 ** table_bits` entries, replaced on
+    collision, so transposed positions are searched once, and positions
+    which can't reach the goal in time by `_bound` are pruned.
+
+    After `max_nodes` positions, the search gives up and the best line of a
+    beam search over turns, played in a canonical order, is returned
+    instead, without proof that it takes the fewest turns.
+
+    Attributes:
+        seed: Seed of the deal.
+        target: Amount of each element the lab must hold.
+        nodes: Amount of positions visited.
+        hits: Amount of positions pruned by the transposition table.
+        minimum: Fewest turns a solution may take, as proven so far.
+        max_nodes: Amount of positions after which the search gives up.
+        beam_width: Amount of positions kept each turn by the beam search.
+    """
+    def __init__(self, seed: int, target: Iterable[int],
+                 table_bits: int = TABLE_BITS,
+                 max_nodes: int = MAX_NODES,
+                 beam_width: int = BEAM_WIDTH) -> None:
+        self.seed = seed
+        self.target = Counter(target)
+        self.max_nodes = max_nodes
+        self.beam_width = beam_width
+        self.nodes = 0
+        self.hits = 0
+        self.minimum = 1
+        self._key = Zobrist()
+        self._mask = (1 << table_bits) - 1
+        self._keys = array('Q', bytes(8 << table_bits))
+        self._depths = array('b', [-1]) * (1 << table_bits)
+        self._game = Game('solver', seed=seed)
+        self._game.setup()
+        snapshot = self._game.get_snapshot()
+        # positions of the target's elements in the market decks, which are
+        # only ever drawn from the top
+        self._market_decks = [
+            (len(numbers), {number: [i for i, other in enumerate(numbers)
+                                     if other == number]
+                            for number in self.target})
+            for numbers in (snapshot['light_deck'], snapshot['heavy_deck'])]
+        catalog = get_catalog(PATH)
+        self._masses = {number: catalog.create_card(number).mass
+                        for number in self.target if number in catalog}
+        player = self._game.current_player
+        self._effects = player.effects
+        self._drawing = any(self._effects.draws)
+        self._allowing = any(self._effects.syntheses)
+        self._lab = Counter(card.number for card in player.get_lab())
+        self._owned = Counter(
+            card.number for cards in (player.get_hand(), player.get_table(),
+                                      player.get_discard(), player.get_deck())
+            for card in cards)
+        self._missing = sum(max(amount - self._lab[number], 0)
+                            for number, amount in self.target.items())
+        self._shuffles: Tuple[int, ...] = ()
+        self._settled: FrozenSet[int] = frozenset()
+        self._last: Optional[int] = None
+        self._revealed: Tuple[int, ...] = ()
+        self._zones = self._hash_zones()
+
+    def _hash_zones(self) -> int:
+        """Returns the hash of the player's zones as multisets, and of the
+        order of their deck.
+
+        The hash of the order of the discard pile and of the random state,
+        which decide the order of the deck once the discard pile is
+        reshuffled into it, is kept aside, as are the size of the deck and
+        the positions of the target's elements in it.
+        """
+        player = self._game.current_player
+        key = self._key
+        total = sum(amount * key('lab', number)
+                    for number, amount in self._lab.items())
+        for zone, cards in (('hand', player.get_hand()),
+                            ('table', player.get_table()),
+                            ('discard', player.get_discard())):
+            for card in cards:
+                total += key(zone, card.number)
+        deck = [card.number for card in player.get_deck()]
+        for i, number in enumerate(deck):
+            total += key('deck', len(deck) - i, number)
+        reshuffle = key('random', self._shuffles)
+        for i, card in enumerate(player.get_discard()):
+            reshuffle += key('discard', i, card.number)
+        self._reshuffle = reshuffle & MASK
+        self._deck_size = len(deck)
+        self._deck_positions = {number: [i for i, other in enumerate(deck)
+                                         if other == number]
+                                for number in self.target}
+        return total & MASK
+
+    def _hash_order(self) -> int:
+        """Returns the hash of the order of the zones which are discarded,
+        and of the random state."""
+        player = self._game.current_player
+        key = self._key
+        total = self._reshuffle
+        for zone, cards in (('hand', player.get_hand()),
+                            ('table', player.get_table())):
+            for i, card in enumerate(cards):
+                total += key(zone, i, card.number)
+        return total & MASK
+
+    def _hash(self, turns: int) -> int:
+        """Returns the hash of the current position.
+
+        The order of the zones which are discarded only matters if the deck
+        may run out within the turns left, otherwise it is left out and
+        positions differing only by it share their hash. The elements which
+        may no longer be synthesized this turn are hashed as well, as they
+        decide which moves are searched.
+
+        Args:
+            turns: Amount of turns which may still be ended.
+
+        Returns:
+            The hash.
+        """
+        game = self._game
+        player = game.current_player
+        key = self._key
+        total = (self._zones + key('energy', player.get_energy())
+                 + key('decks', game.get_deck_sizes())
+                 + key('syntheses', player.get_syntheses()))
+        for card in game.light_market:
+            total += key('light', card.number)
+        for card in game.heavy_market:
+            total += key('heavy', card.number)
+        if player.can_mulligan():
+            total += key('mulligan')
+        if self._settled and player.can_synthesize():
+            for number in self._settled.intersection(
+                    card.number for card in player.get_hand()):
+                total += key('settled', number)
+        if self._reshuffles(turns):
+            total += self._hash_order()
+        return total & MASK
+
+    def _reshuffles(self, turns: int) -> bool:
+        """Returns whether or not the deck may run out, and the discard pile
+        be reshuffled into it, within the turns left.
+
+        Cards are drawn by effects only from cards owned until then, each
+        played at most once a turn.
+
+        Args:
+            turns: Amount of turns which may still be ended.
+
+        Returns:
+            True if a reshuffle is within reach, False otherwise.
+        """
+        free = self._game.current_player.can_mulligan()
+        reach = HAND_SIZE * (turns + free)
+        if self._drawing:
+            draws = self._effects.draws
+            reach += (turns + 1) * sum(draws[number] * amount for number,
+                                       amount in self._owned.items())
+        return reach > self._deck_size
+
+    def _count_purchases(self, number: int, bought: int) -> int:
+        """Returns the fewest purchases buying another copy of an element
+        takes, counting the purchases revealing it.
+
+        Args:
+            number: Atomic number of the element.
+            bought: Amount of copies of the element to buy before this one.
+
+        Returns:
+            Amount of purchases, or `UNREACHABLE` if no copy is left.
+        """
+        game = self._game
+        market = sum(card.number == number for card in game.get_market())
+        if bought < market:
+            return bought + 1
+        bought -= market
+        for (total, positions), left in zip(self._market_decks,
+                                            game.get_deck_sizes()):
+            drawn = total - left
+            positions = [i - drawn for i in positions[number] if i >= drawn]
+            if bought < len(positions):
+                # each purchase from the market reveals the next card
+                return positions[bought] + 2
+            bought -= len(positions)
+        return UNREACHABLE
+
+    def _bound(self) -> int:
+        """Returns a lower bound on the amount of turns yet to be ended.
+
+        Each missing copy of an element arrives in hand no sooner than the
+        turn its copy in the hand or deck could be drawn, and every other
+        copy, whether discarded, played or yet to be bought, only after the
+        deck is reshuffled. A copy is bought no sooner than the turn by which
+        enough cards were in hand to make every purchase revealing and
+        buying it, each taking a card, and in the current turn only if the
+        hand yields the energy it costs, unless a mulligan may replace the
+        hand, and it arrives a turn later at the soonest. Copies are then
+        synthesized one per turn, from the current turn if a synthesis is
+        still allowed.
+
+        If any effect draws cards, any copy may instead be drawn in the turn
+        after it was bought or played, as the deck may be reshuffled and
+        more cards drawn in any turn, and if any effect allows syntheses,
+        all copies may be synthesized in one turn, so that the bound holds
+        with effects.
+        """
+        game = self._game
+        player = game.current_player
+        free = player.can_mulligan()
+        hand = Counter(card.number for card in player.get_hand())
+        energy = player.get_energy() + sum(
+            max(number, self._effects.energy[number]) * amount
+            for number, amount in hand.items())
+        cards = sum(hand.values()) + (player.get_energy() > 0)
+        reshuffle = 0 if self._drawing else (
+            self._deck_size // HAND_SIZE + 1 - free)
+        arrivals: List[int] = []
+        for number, amount in self.target.items():
+            missing = amount - self._lab[number]
+            if missing <= 0:
+                continue
+            deck = self._deck_positions[number]
+            copies = [0] * hand[number]
+            if self._drawing:
+                copies.extend([0] * len(deck))
+            else:
+                copies.extend(max(i // HAND_SIZE + 1 - free, 0)
+                              for i in deck)
+            copies.extend([reshuffle] * (self._owned[number] - hand[number]
+                                         - len(deck)))
+            for bought in range(missing - len(copies)):
+                purchases = self._count_purchases(number, bought)
+                if purchases == UNREACHABLE:
+                    return UNREACHABLE
+                if self._drawing:
+                    copies.append(1)
+                    continue
+                turn = -(-max(purchases - cards, 0) // HAND_SIZE)
+                if (not turn and not free
+                        and self._masses[number] * (bought + 1) > energy):
+                    turn = 1
+                copies.append(max(reshuffle, turn + 1))
+            arrivals.extend(sorted(copies)[:missing])
+        if self._allowing:
+            return max(arrivals, default=0)
+        turn = -1 if player.can_synthesize() else 0
+        for arrival in sorted(arrivals):
+            turn = max(arrival, turn + 1)
+        return max(turn, 0)
+
+    def _get_moves(self, turns: int) -> List[MOVE]:
+        """Returns the moves to search, most promising first.
+
+        Args:
+            turns: Amount of turns which may still be ended.
+
+        Returns:
+            List of moves.
+        """
+        effects = self._effects
+        reshuffles = turns > 0 and self._reshuffles(turns)
+        moves = []
+        for action, number in self._game.get_moves():
+            if action is Action.SYNTHESIZE:
+                if number in self._settled or not reshuffles and (
+                        self._lab[number] >= self.target[number]):
+                    continue
+            elif action is Action.PLAY:
+                if not (reshuffles or effects.draws[number]
+                        or effects.syntheses[number]):
+                    continue
+            elif action in (Action.HARVEST, Action.BUY):
+                if not reshuffles:
+                    continue
+            elif action is Action.END_TURN and not turns:
+                continue
+            moves.append((action, number))
+        moves.sort(key=self._rank)
+        return moves
+
+    def _rank(self, move: MOVE) -> Tuple[int, int]:
+        """Returns the sorting key of a move, most promising first.
+
+        Args:
+            move: Move to rank.
+
+        Returns:
+            Sorting key.
+        """
+        action, number = move
+        if action is Action.SYNTHESIZE:
+            return (0 if self._lab[number] < self.target[number] else 7,
+                    -number)
+        if action is Action.BUY:
+            return 1 if number in self.target else 4, -number
+        return {Action.PLAY: 2, Action.HARVEST: 3, Action.END_TURN: 5,
+                Action.MULLIGAN: 6}[action], -number
+
+    def _get_markets(self) -> Counter:
+        """Returns the amount of each element in the light and heavy
+        markets."""
+        game = self._game
+        return Counter(card.number for market
+                       in (game.light_market, game.heavy_market)
+                       for card in market)
+
+    def _make(self, move: MOVE) -> Optional[UNDO]:
+        """Performs a move and updates the hash of the player's zones.
+
+        Args:
+            move: Move to perform.
+
+        Returns:
+            Record for `_unmake` if successful, None otherwise.
+        """
+        game = self._game
+        player = game.current_player
+        action, number = move
+        saved = (self._zones, self._reshuffle, self._deck_size,
+                 self._deck_positions, self._shuffles, self._settled,
+                 self._last, self._revealed)
+        hand = [card.number for card in player.get_hand()]
+        synthesizable = player.can_synthesize()
+        draws = 0
+        if action is Action.BUY:
+            markets = self._get_markets()
+            markets[number] -= 1
+        elif action in (Action.END_TURN, Action.MULLIGAN):
+            draws = HAND_SIZE
+            discarded = (len(player.get_discard()) + len(hand)
+                         + len(player.get_table()))
+        elif action is Action.PLAY:
+            draws = self._effects.draws[number]
+            discarded = len(player.get_discard())
+        undo = game.make(action, number)
+        if undo is None:
+            return None
+        if draws > self._deck_size:
+            # the deck runs out while drawing
+            self._shuffles += (discarded,)
+        key = self._key
+        if action is Action.SYNTHESIZE:
+            self._zones += key('lab', number) - key('hand', number)
+            self._settled = self._settled.union(
+                other for other in hand if other < number)
+            if self._lab[number] < self.target[number]:
+                self._missing -= 1
+            self._lab[number] += 1
+            self._owned[number] -= 1
+        elif action in (Action.END_TURN, Action.MULLIGAN):
+            self._settled = frozenset()
+            self._last = None
+            self._revealed = ()
+            self._zones = self._hash_zones()
+        else:
+            # the cards which could be synthesized before the move could
+            # still be synthesized before it instead
+            self._settled = frozenset(hand if synthesizable else ())
+            if action is Action.BUY:
+                self._zones += key('table', number)
+                self._owned[number] += 1
+                self._last = number
+                self._revealed = tuple(sorted(
+                    (self._get_markets() - markets).elements()))
+            elif draws:
+                self._zones = self._hash_zones()
+            else:
+                self._zones += key('table', number) - key('hand', number)
+        self._zones &= MASK
+        return undo, saved, move
+
+    def _unmake(self, record: UNDO) -> None:
+        """Restores the position prior to a move made with `_make`.
+
+        Args:
+            record: Record returned by `_make`.
+        """
+        undo, saved, (action, number) = record
+        (self._zones, self._reshuffle, self._deck_size,
+         self._deck_positions, self._shuffles, self._settled, self._last,
+         self._revealed) = saved
+        self._game.unmake(undo)
+        if action is Action.SYNTHESIZE:
+            self._lab[number] -= 1
+            self._owned[number] += 1
+            if self._lab[number] < self.target[number]:
+                self._missing += 1
+        elif action is Action.BUY:
+            self._owned[number] -= 1
+
+    def _search(self, turns: int) -> Optional[List[MOVE]]:
+        """Returns moves reaching the goal within the given amount of turns
+        ended, if there are any.
+
+        Args:
+            turns: Amount of turns which may still be ended.
+
+        Returns:
+            The moves, or None if the goal can't be reached in time.
+
+        Raises:
+            BudgetExceeded: If more than `max_nodes` positions were visited.
+        """
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise BudgetExceeded(f'gave up after {self.max_nodes} positions')
+        if not self._missing:
+            return []
+        if self._bound() > turns:
+            return None
+        position = self._hash(turns)
+        i = position & self._mask
+        if self._keys[i] == position and self._depths[i] >= turns:
+            self.hits += 1
+            return None
+        for move in self._get_moves(turns):
+            record = self._make(move)
+            if record is None:
+                continue
+            try:
+                line = self._search(turns - (move == END_TURN))
+            finally:
+                self._unmake(record)
+            if line is not None:
+                return [move] + line
+        self._keys[i] = position
+        self._depths[i] = turns
+        return None
+
+    def _get_purchases(self) -> List[STEP]:
+        """Returns the purchases which may follow the last one, in the
+        canonical order of the turn of the beam search.
+
+        Cards are harvested only to pay for a purchase, right before it.
+        Harvested and kept cards are all discarded at the end of the turn,
+        so a purchase is paid with the cards worth the least energy it
+        costs, fewest first, keeping the most energy in hand for the next
+        purchases. Purchases come in ascending order of the bought element,
+        unless the card was revealed by the previous purchase, and so
+        couldn't have been bought before it.
+
+        Returns:
+            List of steps, each harvesting the cards paying for a purchase
+            and buying it.
+        """
+        hand = sorted((card.number for card in
+                       self._game.current_player.get_hand()), reverse=True)
+        payments = sorted({cards for amount in range(1, len(hand) + 1)
+                           for cards in combinations(hand, amount)},
+                          key=lambda cards: (sum(cards), len(cards), cards))
+        steps = []
+        for number, mass in {(card.number, card.mass) for card in
+                             self._game.get_affordable(sum(hand))}:
+            if (self._last is not None and number < self._last
+                    and number not in self._revealed):
+                continue
+            cards = next(cards for cards in payments if sum(cards) >= mass)
+            steps.append(tuple((Action.HARVEST, other) for other in cards)
+                         + ((Action.BUY, number),))
+        return steps
+
+    def _get_steps(self, turns: int) -> List[STEP]:
+        """Returns the steps of a turn of the beam search: a mulligan, then
+        syntheses of missing elements, or else of the weakest card, then
+        purchases.
+
+        Args:
+            turns: Amount of turns which may still be ended.
+
+        Returns:
+            List of steps, each a sequence of moves.
+        """
+        player = self._game.current_player
+        steps = [MULLIGAN] if player.can_mulligan() else []
+        reshuffles = turns > 0 and self._reshuffles(turns)
+        if self._last is None and player.can_synthesize():
+            hand = sorted({card.number for card in player.get_hand()})
+            missing = [number for number in hand
+                       if self._lab[number] < self.target[number]]
+            if not missing and reshuffles:
+                # the weakest card is taken out of the deck for good
+                missing = hand[:1]
+            steps.extend(((Action.SYNTHESIZE, number),)
+                         for number in missing)
+        if reshuffles:
+            # bought cards are otherwise discarded, and won't be drawn in
+            # time
+            steps.extend(self._get_purchases())
+        return steps
+
+    def _score(self, bound: int) -> Tuple[int, float]:
+        """Returns the sorting key of a position kept by the beam search,
+        most promising first.
+
+        Positions are ranked by the purchases the missing copies still
+        take, counting those revealing them, plus two for each turn of the
+        lower bound, as about two purchases are made each turn, then by the
+        average energy of the player's cards.
+
+        Args:
+            bound: Lower bound on the amount of turns yet to be ended.
+
+        Returns:
+            Sorting key.
+        """
+        purchases = 0
+        for number, amount in self.target.items():
+            for bought in range(amount - self._lab[number]
+                                - self._owned[number]):
+                purchases += self._count_purchases(number, bought)
+        energy = sum(number * amount
+                     for number, amount in self._owned.items())
+        return purchases + 2 * bound, -energy / sum(self._owned.values())
+
+    def _expand(self, turns: int, line: List[MOVE],
+                children: Dict[int, Tuple[Tuple[int, float], LINE]]
+                ) -> Optional[List[MOVE]]:
+        """Searches the steps of the current turn for the beam search,
+        keeping the best line reaching each position of the next turn.
+
+        Args:
+            turns: Amount of turns which may still be ended.
+            line: Moves made since the start of the search.
+            children: Score and line of each position of the next turn, by
+                      hash.
+
+        Returns:
+            Moves reaching the goal within the turn, if any.
+        """
+        self.nodes += 1
+        if not self._missing:
+            return line
+        for step in self._get_steps(turns):
+            records = []
+            for move in step:
+                record = self._make(move)
+                if record is None:
+                    break
+                records.append(record)
+            else:
+                found = self._expand(turns, line + list(step), children)
+                if found is not None:
+                    return found
+            for record in reversed(records):
+                self._unmake(record)
+        if turns:
+            record = self._make(END_TURN)
+            position = self._hash(turns - 1)
+            bound = self._bound()
+            score = self._score(bound)
+            # positions which can't reach the goal in time are dropped
+            if bound < turns and (position not in children
+                                  or score < children[position][0]):
+                children[position] = score, tuple(line) + (END_TURN,)
+            self._unmake(record)
+        return None
+
+    def _beam(self, max_turns: int) -> Optional[LINE]:
+        """Returns a line reaching the goal found by a beam search over
+        turns, keeping the `beam_width` most promising positions each turn.
+
+        Args:
+            max_turns: Most turns the line may take.
+
+        Returns:
+            The moves, or None if no line was found within `max_turns`.
+        """
+        beam: List[LINE] = [()]
+        for turns in range(max_turns - 1, -1, -1):
+            children: Dict[int, Tuple[Tuple[int, float], LINE]] = {}
+            for line in beam:
+                records = [self._make(move) for move in line]
+                found = self._expand(turns, list(line), children)
+                for record in reversed(records):
+                    self._unmake(record)
+                if found is not None:
+                    return tuple(found)
+            ranked = sorted(children.values(), key=lambda child: child[0])
+            beam = [line for _, line in ranked[:self.beam_width]]
+        return None
+
+    def solve(self, max_turns: int = MAX_TURNS
+              ) -> Tuple[Optional[LINE], bool]:
+        """Returns a solution taking the fewest turns, and whether or not it
+        was proven to.
+
+        Args:
+            max_turns: Most turns a solution may take.
+
+        Returns:
+            Moves of the solution, the goal being reached in the turn after
+            the last turn ended, or None if there is none within
+            `max_turns`, and whether or not that is proven. If the search
+            gave up, the line of the beam search is returned instead, if it
+            found one, and is only proven to take the fewest turns if it
+            takes no more than `minimum`.
+        """
+        try:
+            for turns in range(max_turns):
+                line = self._search(turns)
+                if line is not None:
+                    return tuple(line), True
+                self.minimum = turns + 2
+        except BudgetExceeded:
+            line = self._beam(max_turns)
+            return line, (line is not None
+                          and count_turns(line) == self.minimum)
+        return None, True
+
+
+def count_turns(line: LINE) -> int:
+    """Returns the turn in which a line of moves ends, 1 being the first."""
+    return 1 + sum(action is Action.END_TURN for action, _ in line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Finds the fewest turns in which a seeded deal reaches '
+                    'a lab composition.')
+    parser.add_argument('seed', type=int)
+    parser.add_argument('target', type=int, nargs='+',
+                        help='atomic numbers the lab must hold, repeated '
+                             'for several copies')
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--table-bits', type=int, default=TABLE_BITS,
+                        help='log2 of the transposition table size')
+    parser.add_argument('--max-nodes', type=int, default=MAX_NODES,
+                        help='positions to search before falling back to a '
+                             'beam search')
+    parser.add_argument('--beam-width', type=int, default=BEAM_WIDTH,
+                        help='positions kept each turn by the beam search')
+    args = parser.parse_args()
+
+    solver = Solver(args.seed, args.target, args.table_bits, args.max_nodes,
+                    args.beam_width)
+    solution, optimal = solver.solve(args.max_turns)
+    if solution is None:
+        if optimal:
+            print(f'no solution within {args.max_turns} turns')
+        else:
+            print(f'no solution found, which takes at least '
+                  f'{solver.minimum} turns')
+    else:
+        proof = ('optimal' if optimal
+                 else f'best found, at least {solver.minimum} turns')
+        print(f'{count_turns(solution)} turns ({proof}): '
+              f'{describe(solution)}')
+    print(f'{solver.nodes} positions searched, {solver.hits} transpositions')
@@ -0,0 +1,262 @@
+import argparse
+import json
+import selectors
+import socket
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Dict, List, Optional
+
+from periodical.game import Game
+
+
+HOST = '127.0.0.1'
+PORT = 8765
+RATE = 10
+BACKLOG = 64
+CHUNK = 1 << 16
+
+
+class Spectator:
+    """A class for representing a connection receiving a game's updates.
+
+    Each update is a full state of the game, encoded once as a line of
+    json and shared by all spectators. A spectator is sent at most `rate`
+    updates per second. Updates arriving while it waits, or while it is
+    still receiving a previous update, replace each other, so only the
+    newest is sent.
+
+    Attributes:
+        rate: Maximal amount of updates sent per second.
+        sent: Amount of updates sent in full.
+    """
+    def __init__(self, connection: socket.socket, rate: float = RATE) -> None:
+        connection.setblocking(False)
+        self.rate = rate
+        self.sent = 0
+        self._connection = connection
+        self._sending: Optional[memoryview] = None
+        self._latest: Optional[bytes] = None
+        self._ready = 0.0
+
+    def fileno(self) -> int:
+        return self._connection.fileno()
+
+    @property
+    def sending(self) -> bool:
+        """Returns whether or not an update is partially sent."""
+        return self._sending is not None
+
+    def queue(self, update: bytes) -> None:
+        """Sets the update to send next, replacing any unsent one.
+
+        Args:
+            update: Encoded update.
+        """
+        self._latest = update
+
+    def wait(self, now: float) -> Optional[float]:
+        """Returns how long until the next update may be started.
+
+        Args:
+            now: Current time.
+
+        Returns:
+            Seconds to wait, or None if there's nothing to send.
+        """
+        if self._latest is None or self._sending is not None:
+            return None
+        return max(self._ready - now, 0.0)
+
+    def send(self, now: float) -> None:
+        """Starts sending the latest update if allowed, and sends as much of
+        the current update as the connection accepts without blocking.
+
+        Args:
+            now: Current time.
+
+        Raises:
+            OSError: If the connection failed.
+        """
+        if (self._sending is None and self._latest is not None
+                and now >= self._ready):
+            self._sending = memoryview(self._latest)
+            self._latest = None
+            self._ready = now + 1 / self.rate
+        if self._sending is None:
+            return
+        try:
+            amount = self._connection.send(self._sending[:CHUNK])
+        except BlockingIOError:
+            return
+        self._sending = self._sending[amount:]
+        if not self._sending:
+            self._sending = None
+            self.sent += 1
+
+    def close(self) -> None:
+        """Closes the connection."""
+        self._connection.close()
+
+
+class Broadcaster(Thread):
+    """A class for streaming a game's state to spectators over TCP, from a
+    background thread.
+
+    The game's listener only stores the new state and wakes the thread, so
+    the player's actions wait for neither encoding nor sending. The thread
+    encodes each state once and queues the same bytes to every spectator.
+    New spectators receive the latest state first.
+
+    Attributes:
+        address: Address spectators connect to.
+        rate: Maximal amount of updates sent to each spectator per second.
+        spectators: Connected spectators.
+    """
+    def __init__(self, game: Game, host: str = HOST, port: int = PORT,
+                 rate: float = RATE) -> None:
+        super().__init__(name='broadcaster', daemon=True)
+        self.rate = rate
+        self.spectators: List[Spectator] = []
+        self._game = game
+        self._lock = Lock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._update: Optional[bytes] = None
+        self._running = True
+        self._selector = selectors.DefaultSelector()
+        self._server = socket.create_server((host, port), backlog=BACKLOG)
+        self._server.setblocking(False)
+        self.address = self._server.getsockname()
+        self._selector.register(self._server, selectors.EVENT_READ)
+        self._wakeup, self._waker = socket.socketpair()
+        self._wakeup.setblocking(False)
+        self._waker.setblocking(False)
+        self._selector.register(self._wakeup, selectors.EVENT_READ)
+        self.publish(game)
+        game.add_listener(self.publish)
+
+    def publish(self, game: Game) -> None:
+        """Stores the game's current state to be sent. Passed to
+        `Game.add_listener`.
+
+        Args:
+            game: Game which changed.
+        """
+        state = game.get_state()
+        with self._lock:
+            self._state = state
+        self._wake()
+
+    def _wake(self) -> None:
+        """Interrupts the thread's wait."""
+        try:
+            self._waker.send(b'\0')
+        except BlockingIOError:
+            pass  # a wakeup is already pending
+
+    def stop(self) -> None:
+        """Stops the thread and disconnects all spectators."""
+        self._game.remove_listener(self.publish)
+        self._running = False
+        self._wake()
+
+    def _accept(self) -> None:
+        """Connects waiting spectators."""
+        while True:
+            try:
+                connection = self._server.accept()[0]
+            except BlockingIOError:
+                return
+            spectator = Spectator(connection, self.rate)
+            if self._update is not None:
+                spectator.queue(self._update)
+            self.spectators.append(spectator)
+
+    def _encode(self) -> None:
+        """Encodes the latest state, if there's a new one, and queues it to
+        every spectator."""
+        with self._lock:
+            state, self._state = self._state, None
+        if state is None:
+            return
+        self._update = json.dumps(state, separators=(',', ':')).encode()
+        self._update += b'\n'
+        for spectator in self.spectators:
+            spectator.queue(self._update)
+
+    def _send(self) -> Optional[float]:
+        """Sends updates to every spectator able to receive them.
+
+        Returns:
+            Seconds until a waiting spectator may be sent an update, or None
+            if none is waiting.
+        """
+        now = monotonic()
+        timeout: Optional[float] = None
+        for spectator in list(self.spectators):
+            try:
+                spectator.send(now)
+            except OSError:
+                self._disconnect(spectator)
+                continue
+            writing = spectator.sending
+            registered = spectator.fileno() in self._selector.get_map()
+            if writing and not registered:
+                self._selector.register(spectator, selectors.EVENT_WRITE)
+            elif not writing and registered:
+                self._selector.unregister(spectator)
+            wait = spectator.wait(now)
+            if wait is not None:
+                timeout = wait if timeout is None else min(timeout, wait)
+        return timeout
+
+    def _disconnect(self, spectator: Spectator) -> None:
+        """Removes a spectator and closes its connection.
+
+        Args:
+            spectator: Spectator to remove.
+        """
+        self.spectators.remove(spectator)
+        try:
+            self._selector.unregister(spectator)
+        except KeyError:
+            pass
+        spectator.close()
+
+    def run(self) -> None:
+        """Accepts spectators and sends them updates until stopped."""
+        timeout: Optional[float] = None
+        while self._running:
+            for key, _ in self._selector.select(timeout):
+                if key.fileobj is self._server:
+                    self._accept()
+                elif key.fileobj is self._wakeup:
+                    try:
+                        self._wakeup.recv(CHUNK)
+                    except BlockingIOError:
+                        pass
+            self._encode()
+            timeout = self._send()
+        for spectator in list(self.spectators):
+            self._disconnect(spectator)
+        self._selector.close()
+        for connection in (self._server, self._wakeup, self._waker):
+            connection.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Plays a game which spectators can follow over TCP.')
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--rate', type=float, default=RATE,
+                        help='maximal updates per second to each spectator')
+    args = parser.parse_args()
+
+    game = Game('player')
+    game.setup()
+    broadcaster = Broadcaster(game, args.host, args.port, args.rate)
+    broadcaster.start()
+    try:
+        game.show_board()
+    finally:
+        broadcaster.stop()
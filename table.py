@@ -3,30 +3,29 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pygame
 from pygame.constants import KEYDOWN, K_ESCAPE, QUIT
-from pygame.font import Font
 from pygame.rect import Rect
 from pygame.surface import Surface
 
+from periodical.atlas import ATLAS
 from periodical.card import border_and_fill, Card
-from periodical.config import (BLACK_FONT, Board, MEGA_CARD, NUM, PATH, Size,
-                               SMALL_FONT, SMALLER_FONT, SMALLEST_FONT,
+from periodical.catalog import is_extra_element
+from periodical.config import (BLACK_FONT, Board, CELL, LAYOUT, MEGA_CARD,
+                               NUM, PATH, SHELL, Size, TABLE_BORDER,
                                WHITE_FONT, Zone)
-from periodical.utils import get_element_info
+from periodical.text import render_text
+from periodical.utils import build_atlas, cache_atlas, get_element_info
 
 
-CELL = Size(width=40, height=50)
-SHELL = Size(width=CELL.width, height=80)
 AROUND = 10
-BORDER = 1
 GROUPS = 18
 ADDITIONAL_GROUPS = 14
 PERIODS = 10
 ADDITIONAL_PERIODS = 3
-FONT = Font(None, 24)
 MAX_NUM_RANGE = 5
 CARD_COL = 7
 CARD_COL_ADDITION = 2
 BUTTON_GROUP = 12
+BACKGROUND = (250, 250, 250)
 LANTHANIDES = 57, 71, 3, 6, 'lanthanide'
 ACTINIDES = 89, 103, 3, 7, 'actinide'
 
@@ -38,11 +37,14 @@ class Cell(ABC):
         group: Element's group.
         period: Element's period.
         category: Element's categorical classification.
+        key: Unique name of the cell's images in the atlas.
     """
-    def __init__(self, group: int, period: int, category: str) -> None:
+    def __init__(self, group: int, period: int, category: str,
+                 key: str) -> None:
         self.group = group - 1
         self.period = period - 1
         self.category = category.title()
+        self.key = key
 
     def get_rect(self, shells: bool) -> Rect:
         """Returns a Rect object containing the size and position of the cell
@@ -66,9 +68,9 @@ class Cell(ABC):
         addition = AROUND / 2
         x_addition = y_addition = 0
         if self.group != 0:
-            x_addition = BORDER
+            x_addition = TABLE_BORDER
         if self.period != 0:
-            y_addition = BORDER
+            y_addition = TABLE_BORDER
 
         return Rect((int((size.width - x_addition) * (group)
                          + addition),
@@ -86,8 +88,8 @@ class Cell(ABC):
 
     def render(self) -> None:
         """Create cell image and get its target position."""
-        self.img = self.show()
-        self.shell_img = self.show_shells()
+        self.img = ATLAS.fetch(f'{self.key}/cell', self.show)
+        self.shell_img = ATLAS.fetch(f'{self.key}/shell', self.show_shells)
         self.pos = self.get_rect(False)
         self.shell_pos = self.get_rect(True)
 
@@ -107,7 +109,7 @@ class Element(Cell):
     def __init__(self, name: str, symbol: str, number: int, group: int,
                  period: int, category: str, mass: int,
                  shells: List[int]) -> None:
-        super().__init__(group, period, category)
+        super().__init__(group, period, category, f'element/{number}')
         self.name = name.title()
         self.symbol = symbol.title()
         self.number = str(number)
@@ -120,12 +122,12 @@ class Element(Cell):
         Returns:
             Image of the element to be printed to the screen.
         """
-        element = border_and_fill(CELL, self.category, BORDER)
+        element = border_and_fill(CELL, self.category, TABLE_BORDER)
         centerx = element.get_rect().centerx
-        number = FONT.render(self.number, *BLACK_FONT)
+        number = LAYOUT.cell_font.render(self.number, *BLACK_FONT)
         number_pos = number.get_rect(centerx=centerx,
                                      centery=element.get_height() / 3)
-        symbol = FONT.render(self.symbol, *BLACK_FONT)
+        symbol = LAYOUT.cell_font.render(self.symbol, *BLACK_FONT)
         symbol_pos = symbol.get_rect(centerx=centerx,
                                      centery=element.get_height() / 3 * 2)
 
@@ -140,16 +142,16 @@ class Element(Cell):
         Returns:
             Large image of the element to be printed to the screen.
         """
-        element = border_and_fill(SHELL, self.category, BORDER)
+        element = border_and_fill(SHELL, self.category, TABLE_BORDER)
         shells = self.card.shells
         length = len(shells) + 2
         rect = element.get_rect()
         row = {i: (rect.height / length) * i for i in range(1, length)}
-        number = SMALLER_FONT.render(str(self.number), *WHITE_FONT)
+        number = LAYOUT.smaller_font.render(str(self.number), *WHITE_FONT)
         num_pos = number.get_rect(centerx=rect.centerx, centery=row[1])
         element.blit(number, num_pos)
         for i, shell in enumerate(shells, start=2):
-            text = SMALLEST_FONT.render(str(shell), *BLACK_FONT)
+            text = LAYOUT.smallest_font.render(str(shell), *BLACK_FONT)
             pos = text.get_rect(centerx=rect.centerx, centery=row[i])
             element.blit(text, pos)
 
@@ -168,7 +170,7 @@ class ElementGroup(Cell):
     """
     def __init__(self, first: int, last: int, group: int, period: int,
                  category: str) -> None:
-        super().__init__(group, period, category)
+        super().__init__(group, period, category, f'group/{first}-{last}')
         self.first = first
         self.last = last
 
@@ -181,11 +183,11 @@ class ElementGroup(Cell):
         Returns:
             Image of the cell to be printed to the screen.
         """
-        group = border_and_fill(size, self.category, BORDER)
-        font = SMALL_FONT
+        group = border_and_fill(size, self.category, TABLE_BORDER)
+        font = LAYOUT.small_font
         num_range = f'{self.first}-{self.last}'
         if len(num_range) > MAX_NUM_RANGE:
-            font = SMALLEST_FONT
+            font = LAYOUT.smallest_font
         number = font.render(num_range, *BLACK_FONT)
         number_pos = number.get_rect(center=group.get_rect().center)
 
@@ -242,15 +244,15 @@ def get_element_collision(cells: List[Element], pos: Tuple[int, int],
     return None
 
 
-def get_screen(shells: bool) -> Surface:
-    """Returns surface object representing the screen.
+def get_screen_size(shells: bool) -> Tuple[int, int]:
+    """Returns the size of the screen.
 
     Args:
         shells: Determines the size of the cells on the table, and their
                 corresponding position.
 
     Returns:
-        Surface object representing the screen.
+        Width and height of the screen.
     """
     size, groups, periods = CELL, GROUPS, PERIODS
 
@@ -258,14 +260,58 @@ def get_screen(shells: bool) -> Surface:
         size = SHELL
         groups += ADDITIONAL_GROUPS
         periods -= ADDITIONAL_PERIODS
-    screen = pygame.display.set_mode((
-        ((size.width - BORDER) * (groups - 1) + size.width  # type: ignore
-         + AROUND),
-        (size.height - BORDER) * (periods - 1) + size.height + AROUND))
-    screen.fill((250, 250, 250))
+    return (int((size.width - TABLE_BORDER) * (groups - 1) + size.width
+                + AROUND),
+            int((size.height - TABLE_BORDER) * (periods - 1) + size.height
+                + AROUND))
+
+
+def get_screen(shells: bool) -> Surface:
+    """Returns surface object representing the screen.
+
+    Args:
+        shells: Determines the size of the cells on the table, and their
+                corresponding position.
+
+    Returns:
+        Surface object representing the screen.
+    """
+    screen = pygame.display.set_mode(get_screen_size(shells))
+    screen.fill(BACKGROUND)
     return screen
 
 
+def compose_view(elements: List[Element], groups: List[ElementGroup],
+                 shells: bool) -> Surface:
+    """Returns a complete image of one of the table's views.
+
+    Args:
+        elements: All elements on the table.
+        groups: All element groups on the table.
+        shells: Determines the size of the cells on the table, and their
+                corresponding position.
+
+    Returns:
+        Image of the entire view, including the mode changing button.
+    """
+    view = Surface(get_screen_size(shells)).convert()
+    view.fill(BACKGROUND)
+
+    cells: List[Cell] = []
+    cells.extend(elements)
+    if not shells:
+        cells.extend(groups)
+    for cell in cells:
+        img, pos = cell.img, cell.pos
+        if shells:
+            img = cell.shell_img
+            pos = cell.shell_pos
+        view.blit(img, pos)
+
+    show_mode_button(view, shells)
+    return view
+
+
 def get_button(shells: bool) -> Board:
     """Returns button size and position.
 
@@ -280,8 +326,9 @@ def get_button(shells: bool) -> Board:
     if shells:
         size = SHELL
         pos += ADDITIONAL_GROUPS
-    return Board(width=size.width * 4 - BORDER * 3, height=size.height,
-                 x=int((size.width - BORDER) * pos + AROUND / 2), y=AROUND / 2)
+    return Board(width=size.width * 4 - TABLE_BORDER * 3, height=size.height,
+                 x=int((size.width - TABLE_BORDER) * pos + AROUND / 2),
+                 y=AROUND / 2)
 
 
 def show_mode_button(screen: Surface, shells: bool) -> None:
@@ -292,17 +339,32 @@ def show_mode_button(screen: Surface, shells: bool) -> None:
         shells: Determines the size of the cells on the table, and their
                 corresponding position.
     """
+    button = ATLAS.fetch(f'mode_button/{shells}',
+                         lambda: draw_mode_button(shells))
+    button_size = get_button(shells)
+    button_pos = button.get_rect(left=button_size.x, top=button_size.y)
+    screen.blit(button, button_pos)
+
+
+def draw_mode_button(shells: bool) -> Surface:
+    """Creates mode changing button.
+
+    Args:
+        shells: Determines the size of the cells on the table, and their
+                corresponding position.
+
+    Returns:
+        Image of the mode changing button.
+    """
     if shells:
         message = 'VIEW ELEMENT DETAILS'
     else:
         message = 'VIEW VALANCE SHELLS'
-    button = border_and_fill(get_button(shells), 'mulligan', BORDER)
-    text = Font(None, 18).render(message, *BLACK_FONT)
+    button = border_and_fill(get_button(shells), 'mulligan', TABLE_BORDER)
+    text = render_text(LAYOUT.mode_font, message, *BLACK_FONT)
     text_pos = text.get_rect(center=button.get_rect().center)
     button.blit(text, text_pos)
-    button_size = get_button(shells)
-    button_pos = button.get_rect(left=button_size.x, top=button_size.y)
-    screen.blit(button, button_pos)
+    return button
 
 
 def get_mega_card_pos(shells: bool) -> Tuple[NUM, NUM]:
@@ -320,10 +382,24 @@ def get_mega_card_pos(shells: bool) -> Tuple[NUM, NUM]:
     if shells:
         col += CARD_COL_ADDITION
         row += SHELL.height * 1.5
-    return ((CELL.width - BORDER) * (col - 1.5) + CELL.width
+    return ((CELL.width - TABLE_BORDER) * (col - 1.5) + CELL.width
             - MEGA_CARD.width / 2 + AROUND / 2, row)
 
 
+def build_table_atlas(elements: List[Element],
+                      groups: List[ElementGroup]) -> None:
+    """Renders every cell and the large card of each element into the atlas.
+
+    Args:
+        elements: All elements on the table.
+        groups: All element groups on the table.
+    """
+    for seq in (elements, groups):
+        for cell in seq:  # type: ignore
+            cell.render()
+    build_atlas(element.card for element in elements)
+
+
 def show_table(elements: List[Element], groups: List[ElementGroup]) -> None:
     """Prints an image of the periodic table to the screen.
 
@@ -334,9 +410,10 @@ def show_table(elements: List[Element], groups: List[ElementGroup]) -> None:
     screen = get_screen(shells)
     pygame.display.set_caption('Periodical')
 
-    for seq in (elements, groups):
-        for cell in seq:  # type: ignore
-            cell.render()
+    cache_atlas(lambda: build_table_atlas(elements, groups))
+    views = {mode: compose_view(elements, groups, mode)
+             for mode in (False, True)}
+    detail: Optional[Surface] = None
 
     while True:
         for event in pygame.event.get():
@@ -348,35 +425,25 @@ def show_table(elements: List[Element], groups: List[ElementGroup]) -> None:
                 if event.button == 1:
                     button = get_button(shells)
                     if Rect(button.pos, button.size).collidepoint(event.pos):
-                        if shells:
-                            shells = False
-                            screen = get_screen(shells)
-                        else:
-                            shells = True
-                            screen = get_screen(shells)
+                        # the views differ in size, so the window must follow
+                        shells = not shells
+                        screen = get_screen(shells)
+                        detail = None
                     element = get_element_collision(elements, event.pos,
                                                     shells)
                     if element:
                         element.card.mega_render()
-                        screen.blit(element.card.img,
-                                    get_mega_card_pos(shells))
-
-        cells: List[Cell] = []
-        cells.extend(elements)
-        if not shells:
-            cells.extend(groups)
-        for cell in cells:
-            img, pos = cell.img, cell.pos
-            if shells:
-                img = cell.shell_img
-                pos = cell.shell_pos
-            screen.blit(img, pos)
+                        detail = element.card.img
 
-        show_mode_button(screen, shells)
+        screen.blit(views[shells], (0, 0))
+        if detail:
+            screen.blit(detail, get_mega_card_pos(shells))
         pygame.display.flip()
 
 
 if __name__ == '__main__':
-    elements = create_elements(get_element_info(PATH)[:-1])
+    elements = create_elements([element for element
+                                in get_element_info(PATH)
+                                if not is_extra_element(element)])
     groups = [ElementGroup(*LANTHANIDES), ElementGroup(*ACTINIDES)]
     show_table(elements, groups)
@@ -0,0 +1,185 @@
+import json
+import os
+import struct
+from threading import Event, Thread
+from time import time
+from typing import Any, BinaryIO, Dict, Iterator
+
+from periodical.config import Metric
+
+
+RECORD = struct.Struct('<dBBHff')
+CAPACITY = 4096
+FLUSH_INTERVAL = 1.0
+JSON_EXTENSIONS = '.ndjson', '.jsonl'
+
+
+def is_json(path: str) -> bool:
+    """Returns whether or not events are written to the path as json lines,
+    based on its extension. Any other extension is written as binary
+    records."""
+    return os.path.splitext(path)[1].lower() in JSON_EXTENSIONS
+
+
+def decode(fields: Any) -> Dict[str, Any]:
+    """Returns an event as a dictionary.
+
+    Args:
+        fields: Unpacked fields of a binary record.
+
+    Returns:
+        Serializable event.
+    """
+    timestamp, metric, seat, number, mass, value = fields
+    return {'time': timestamp, 'event': Metric(metric).name.lower(),
+            'player': seat, 'element': number, 'mass': round(mass, 3),
+            'value': value}
+
+
+def read_events(path: str) -> Iterator[Dict[str, Any]]:
+    """Yields the events of a file written by `Telemetry`.
+
+    Args:
+        path: Path of a json lines or binary file of events.
+
+    Yields:
+        Each event, as written by `decode`.
+    """
+    if is_json(path):
+        with open(path, 'r', encoding='utf-8') as file_handler:
+            for line in file_handler:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, 'rb') as file_handler:
+            data = file_handler.read()
+        # a trailing partial record is left by an interrupted write
+        data = data[:len(data) - len(data) % RECORD.size]
+        for fields in RECORD.iter_unpack(data):
+            yield decode(fields)
+
+
+class Telemetry(Thread):
+    """A class for recording gameplay events into a preallocated ring buffer,
+    flushed to a file by a background thread.
+
+    Recording packs a fixed size record into the buffer in place, with no
+    allocation, locking or I/O, so it may be called from the UI thread.
+    The buffer is written out every `interval` seconds, or sooner once half
+    full. If recording outpaces writing by a whole buffer, the oldest
+    unwritten events are dropped and counted.
+
+    Events are written as json lines if the path ends with one of
+    `JSON_EXTENSIONS`, or as `RECORD` structs otherwise. Both can be read
+    with `read_events`.
+
+    Attributes:
+        path: Path of the file events are appended to.
+        capacity: Amount of events the buffer holds, a power of 2.
+        interval: Maximal seconds between writes.
+        dropped: Amount of events overwritten before being written.
+        written: Amount of events written.
+    """
+    def __init__(self, path: str, capacity: int = CAPACITY,
+                 interval: float = FLUSH_INTERVAL) -> None:
+        super().__init__(name='telemetry', daemon=True)
+        self.path = path
+        self.capacity = 1 << max(capacity - 1, 1).bit_length()
+        self.interval = interval
+        self.dropped = 0
+        self.written = 0
+        self._mask = self.capacity - 1
+        self._threshold = self.capacity // 2
+        self._buffer = bytearray(self.capacity * RECORD.size)
+        self._view = memoryview(self._buffer)
+        self._head = 0
+        self._tail = 0
+        self._ready = Event()
+        self._stopping = Event()
+        self._json = is_json(path)
+
+    @property
+    def recorded(self) -> int:
+        """Returns the amount of events recorded."""
+        return self._head
+
+    def record(self, metric: Metric, seat: int, number: int = 0,
+               mass: float = 0.0, value: float = 0.0) -> None:
+        """Records an event. Only one thread may record events.
+
+        Args:
+            metric: Kind of event.
+            seat: Index of the player the event belongs to.
+            number: Atomic number of the card involved, if any.
+            mass: Atomic mass of the card involved, if any.
+            value: Amount measured, see `Metric`.
+        """
+        head = self._head
+        RECORD.pack_into(self._buffer, (head & self._mask) * RECORD.size,
+                         time(), metric.value, seat, number, mass, value)
+        self._head = head + 1
+        if head - self._tail >= self._threshold and not self._ready.is_set():
+            self._ready.set()
+
+    def _collect(self) -> bytes:
+        """Copies the unwritten events out of the buffer, dropping those
+        overwritten meanwhile.
+
+        Returns:
+            Unwritten records, oldest first.
+        """
+        head = self._head
+        tail = max(self._tail, head - self.capacity)
+        start, end = tail & self._mask, head & self._mask
+        if head == tail:
+            data = b''
+        elif start < end:
+            data = bytes(self._view[start * RECORD.size:end * RECORD.size])
+        else:
+            data = (bytes(self._view[start * RECORD.size:])
+                    + bytes(self._view[:end * RECORD.size]))
+        # events recorded while copying may have overwritten the oldest ones,
+        # including the one being recorded, whose slot is packed first
+        overwritten = self._head + 1 - self.capacity - tail
+        if overwritten > 0:
+            data = data[min(overwritten, head - tail) * RECORD.size:]
+        self.dropped += head - self._tail - len(data) // RECORD.size
+        self._tail = head
+        return data
+
+    def _flush(self, file_handler: BinaryIO) -> None:
+        """Writes the unwritten events to the file.
+
+        Args:
+            file_handler: File opened for binary appending.
+        """
+        data = self._collect()
+        if not data:
+            return
+        if self._json:
+            file_handler.write(b''.join(
+                json.dumps(decode(fields)).encode() + b'\n'
+                for fields in RECORD.iter_unpack(data)))
+        else:
+            file_handler.write(data)
+        file_handler.flush()
+        self.written += len(data) // RECORD.size
+
+    def stop(self) -> None:
+        """Writes the remaining events and stops the thread."""
+        self._stopping.set()
+        self._ready.set()
+        if self.is_alive():
+            self.join()
+
+    def run(self) -> None:
+        """Writes the buffer to the file until stopped."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'ab') as file_handler:
+            while not self._stopping.is_set():
+                self._ready.wait(self.interval)
+                self._ready.clear()
+                self._flush(file_handler)
+            self._flush(file_handler)
@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from periodical import config  # noqa: E402
+
+ELEMENTS_AMOUNT = 118
+CATEGORIES = ('Reactive Nonmetal', 'Noble Gas', 'Alkali Metal',
+              'Alkaline Earth Metal', 'Metalloid', 'Post Transition Metal',
+              'Transition Metal', 'Lanthanide', 'Actinide')
+SHELL_CAPACITIES = 2, 8, 18, 32, 32, 18, 8
+
+
+def _shells(number: int) -> list:
+    """Returns the electron shells of an element, filled in order."""
+    shells = []
+    for capacity in SHELL_CAPACITIES:
+        if number <= 0:
+            break
+        shells.append(min(capacity, number))
+        number -= capacity
+    return shells
+
+
+def write_catalog(path: str, amount: int = ELEMENTS_AMOUNT) -> None:
+    """Writes a catalog of made up elements, in the real catalog's format.
+
+    Args:
+        path: Path of the json file.
+        amount: Amount of elements.
+    """
+    elements = [{'name': f'element{number}',
+                 'symbol': f'E{number}',
+                 'number': number,
+                 'atomic_mass': number * 2.4 if number > 1 else 1.008,
+                 'category': CATEGORIES[number % len(CATEGORIES)].lower(),
+                 'shells': _shells(number),
+                 'xpos': (number - 1) % 18 + 1,
+                 'ypos': (number - 1) // 18 + 1}
+                for number in range(1, amount + 1)]
+    with open(path, 'w', encoding='utf-8') as file_handler:
+        json.dump({'elements': elements}, file_handler)
+
+
+# the catalog's path is imported by name, so it is replaced before any other
+# module of the package is imported
+DATA_DIRECTORY = tempfile.mkdtemp(prefix='periodical-tests-')
+config.PATH = os.path.join(DATA_DIRECTORY, 'elements.json')
+config.EFFECTS_PATH = os.path.join(DATA_DIRECTORY, 'effects.json')
+config.OPENINGS_PATH = os.path.join(DATA_DIRECTORY, 'openings.book')
+config.CACHE_PATH = os.path.join(DATA_DIRECTORY, 'cache')
+write_catalog(config.PATH)
+
+
+@pytest.fixture
+def catalog_writer(tmp_path):
+    """Returns a function writing a catalog of the given amount of elements
+    into a temporary directory, and returning its path."""
+    def write(amount: int = ELEMENTS_AMOUNT) -> str:
+        path = str(tmp_path / 'elements.json')
+        write_catalog(path, amount)
+        return path
+    return write
@@ -0,0 +1,18 @@
+import pygame
+from pygame.surface import Surface
+
+from periodical.atlas import Atlas
+from periodical.config import Size
+
+
+def test_switch_keeps_the_previous_set_only():
+    pygame.display.set_mode((1, 1))
+    atlas = Atlas(Size(width=64, height=64), name='1.0')
+    for name in ('1.0', '1.05', '1.1'):
+        if name != atlas.name:
+            atlas.switch(name)
+        atlas.add(name, Surface((8, 8)))
+    atlas.switch('1.05')
+    assert '1.05' in atlas and len(atlas) == 1
+    atlas.switch('1.0')
+    assert len(atlas) == 0 and not atlas.sheets
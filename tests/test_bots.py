@@ -0,0 +1,46 @@
+from array import array
+from random import Random
+
+from periodical import bots
+from periodical.config import (Action, LIGHT_END, LIGHT_START,
+                               STARTING_END)
+from periodical.game import Game
+from periodical.openings import (enumerate_hands, enumerate_markets,
+                                 OpeningBook)
+
+
+LINE = (Action.MULLIGAN, 0), (Action.END_TURN, 0)
+
+
+def _write_book(path):
+    """Writes a book suggesting the same line for every opening."""
+    starting = list(range(1, STARTING_END + 1))
+    light = list(range(LIGHT_START, LIGHT_END + 1))
+    size = len(enumerate_hands(starting)) * len(enumerate_markets(light))
+    OpeningBook(starting, light, [LINE], array('H', bytes(2 * size))).save(
+        path)
+
+
+def _empty_hand(game):
+    """Harvests the current player's whole hand and ends the turn."""
+    for card in game.current_player.get_hand():
+        assert game.perform(Action.HARVEST, card.number)
+    assert game.perform(Action.END_TURN)
+
+
+def test_book_is_followed_in_the_first_turn_only(tmp_path, monkeypatch):
+    path = str(tmp_path / 'openings.book')
+    _write_book(path)
+    monkeypatch.setattr(bots, 'OPENINGS_PATH', path)
+    game = Game('bot', seed=0)
+    game.setup()
+    assert bots.book(game, Random(0)) == LINE[0]
+
+    game = Game('bot', seed=0)
+    game.setup()
+    _empty_hand(game)
+    _empty_hand(game)
+    player = game.current_player
+    # a player who emptied their hand every turn may still take a mulligan
+    assert player.can_mulligan() and player.get_turns() == 2
+    assert bots.book(game, Random(0)) != LINE[0]
@@ -0,0 +1,21 @@
+import os
+
+from periodical.atlas import INDEX
+from periodical.config import CACHE_LIMIT
+from periodical.utils import prune_cache
+
+
+def test_prune_keeps_the_latest_caches(tmp_path):
+    caches = [tmp_path / f'{i:064x}' for i in range(CACHE_LIMIT + 3)]
+    for i, cache in enumerate(caches):
+        cache.mkdir()
+        index = cache / INDEX
+        index.write_text('{}')
+        os.utime(index, (i, i))
+    (caches[-1] / INDEX).unlink()
+    other = tmp_path / 'other'
+    other.mkdir()
+    prune_cache(str(caches[0]))
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        [caches[0].name, other.name]
+        + [cache.name for cache in caches[-CACHE_LIMIT:-1]])
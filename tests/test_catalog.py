@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from periodical.catalog import Catalog
+
+
+def _add_extra_element(path):
+    """Appends the real elements file's extra entry to a catalog."""
+    with open(path, encoding='utf-8') as file_handler:
+        catalog = json.load(file_handler)
+    catalog['elements'].append({
+        'name': 'Ununennium', 'symbol': 'Uue', 'number': 119,
+        'atomic_mass': 315, 'category': 'unknown', 'shells': [2, 8, 18, 32,
+                                                              32, 18, 8, 1],
+        'xpos': 1, 'ypos': 8})
+    with open(path, 'w', encoding='utf-8') as file_handler:
+        json.dump(catalog, file_handler)
+
+
+def test_extra_element_is_left_out(catalog_writer):
+    path = catalog_writer()
+    _add_extra_element(path)
+    catalog = Catalog(path)
+    assert catalog.last == 118 and 119 not in catalog
+
+
+def test_large_catalogs_are_kept_whole(catalog_writer):
+    path = catalog_writer(3000)
+    assert len(Catalog(path)) == 3000
+    with pytest.warns(UserWarning, match='2000 elements'):
+        assert Catalog(path, 1000).last == 1000
@@ -0,0 +1,20 @@
+from periodical.config import Zone
+from periodical.decks import MarketDeck, StartingDeck
+
+
+def test_draws_are_recorded_only_while_marked():
+    for deck in (StartingDeck(), MarketDeck(1, Zone.LIGHT_DECK, last=10)):
+        order = [card.number for card in deck.peek()]
+        deck.draw()
+        outer = deck.mark()
+        assert outer == 0
+        deck.draw()
+        inner = deck.mark()
+        deck.draw()
+        deck.rewind(inner)
+        assert [card.number for card in deck.peek()] == order[2:]
+        deck.rewind(outer)
+        assert [card.number for card in deck.peek()] == order[1:]
+        deck.draw()
+        assert deck.mark() == 0
+        deck.rewind(0)
@@ -0,0 +1,70 @@
+from periodical.catalog import get_catalog
+from periodical.config import Action, PATH
+from periodical.effects import Effects, load_specs, SAMPLE_PATH
+from periodical.game import Game
+
+
+LANTHANIDE = 7
+HAND = [LANTHANIDE, 1, 2, 3, 4]
+
+
+def _deal(specs=None) -> Game:
+    """Returns a game whose player holds a Lanthanide and four other cards,
+    with the given effect specs, the sample specs by default."""
+    game = Game('p', seed=0)
+    game.setup()
+    snapshot = game.get_snapshot()
+    snapshot['players'][0].update(hand=HAND, table=[], unused=[], lab=[],
+                                  synthesis=None, syntheses=1)
+    game.load_snapshot(snapshot)
+    game.current_player.effects = Effects(specs or load_specs(SAMPLE_PATH),
+                                          get_catalog(PATH))
+    return game
+
+
+def _synthesized(game: Game) -> int:
+    """Returns the amount of cards synthesized from the hand, one at a
+    time, until a synthesis fails."""
+    count = 0
+    for number in HAND[1:]:
+        if not game.perform(Action.SYNTHESIZE, number):
+            break
+        count += 1
+    return count
+
+
+def test_synthesis_effect_before_synthesizing():
+    game = _deal()
+    assert game.perform(Action.PLAY, LANTHANIDE)
+    assert game.current_player.get_syntheses() == 2
+    assert _synthesized(game) == 2
+
+
+def test_synthesis_effect_amount():
+    specs = {'categories': {'Lanthanide': {'synthesis': 3}}, 'elements': {}}
+    game = _deal(specs)
+    assert game.perform(Action.PLAY, LANTHANIDE)
+    assert _synthesized(game) == 4
+
+
+def test_syntheses_reset_and_undo():
+    game = _deal()
+    undo = game.make(Action.PLAY, LANTHANIDE)
+    assert game.current_player.get_syntheses() == 2
+    game.unmake(undo)
+    assert game.current_player.get_syntheses() == 1
+    game.perform(Action.PLAY, LANTHANIDE)
+    game.perform(Action.END_TURN)
+    assert game.current_player.get_syntheses() == 1
+
+
+def test_no_effects_without_specs(tmp_path):
+    specs = load_specs(str(tmp_path / 'effects.json'))
+    assert specs == {'categories': {}, 'elements': {}}
+    effects = Effects(specs, get_catalog(PATH))
+    assert not any(effects.dispatch)
+    game = Game('p', seed=0)
+    game.setup()
+    assert not any(action is Action.PLAY for action, _ in game.get_moves())
+    card = game.current_player.get_hand()[0]
+    assert not game.perform(Action.PLAY, card.number)
@@ -0,0 +1,41 @@
+from collections import Counter
+
+from periodical.build_openings import evaluate_hand, search
+from periodical.catalog import get_catalog
+from periodical.config import Action, GENERAL_END, PATH
+from periodical.effects import Effects
+from periodical.game import Game
+
+
+MARKETS = [(3, 3, 3), (3, 4, 5), (3, 5, 18), (16, 17, 18)]
+
+
+def _bought(line):
+    """Returns the amount of each light market element a line buys."""
+    return Counter(number for action, number in line
+                   if action is Action.BUY and number > GENERAL_END)
+
+
+def test_lines_buy_only_revealed_cards():
+    for market, (value, line) in zip(MARKETS, evaluate_hand(0, MARKETS)):
+        assert line[-1] == (Action.END_TURN, 0)
+        bought = _bought(line)
+        assert all(bought[number] <= market.count(number)
+                   for number in bought)
+
+
+def test_refills_equal_to_revealed_cards_are_not_bought():
+    game = Game('book', seed=0)
+    game.setup()
+    snapshot = game.get_snapshot()
+    snapshot['players'][0].update(hand=[9, 18, 27, 36, 45], table=[],
+                                  unused=[], lab=[], energy=0,
+                                  synthesis=None, syntheses=1)
+    snapshot['light_market'] = [3, 3, 3]
+    snapshot['light_deck'] = [3, 3] + [number for number in range(4, 19)]
+    game.load_snapshot(snapshot)
+    game.current_player.effects = Effects(
+        {'categories': {}, 'elements': {}}, get_catalog(PATH))
+    dealt = list(game.light_market)
+    value, line = search(game, {id(card) for card in dealt}, {})
+    assert _bought(line)[3] == 3
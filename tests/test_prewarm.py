@@ -0,0 +1,23 @@
+import os
+import time
+
+from periodical.atlas import RENDER_LOCK
+from periodical.prewarm import Prewarmer
+
+
+def test_cancelled_while_waiting_to_save(tmp_path):
+    prewarmer = Prewarmer([], str(tmp_path), cached=-1)
+    with RENDER_LOCK:
+        prewarmer.start()
+        # the prewarmer has no cards, so it soon waits for the lock to save
+        time.sleep(0.1)
+        prewarmer.cancel()
+    prewarmer.join()
+    assert os.listdir(tmp_path) == []
+
+
+def test_saves_when_not_cancelled(tmp_path):
+    prewarmer = Prewarmer([], str(tmp_path), cached=-1)
+    prewarmer.start()
+    prewarmer.join()
+    assert os.listdir(tmp_path)
@@ -0,0 +1,48 @@
+from typing import List
+
+from periodical.bots import greedy
+from periodical.config import Action, MOVE
+from periodical.game import Game
+from periodical.replay import MOVE_RECORD, ReplayArchive
+from periodical.simulate import play_game
+
+
+SEED = 3
+
+
+def _play_to(seed: int, moves: List[MOVE], turn: int) -> Game:
+    """Returns a game dealt from a seed, with the moves of its turns before
+    the given one performed."""
+    game = Game('bot', seed=seed)
+    game.setup()
+    current = 1
+    for action, number in moves:
+        if current == turn:
+            break
+        assert game.perform(action, number)
+        if action is Action.END_TURN:
+            current += 1
+    return game
+
+
+def test_open_matches_direct_play(tmp_path):
+    history: List[MOVE] = []
+    play_game(greedy, SEED, history=history)
+    turns = 1 + sum(action is Action.END_TURN for action, _ in history)
+    path = str(tmp_path / 'games.replay')
+    archive = ReplayArchive(path, interval=4)
+    archive.add(7, SEED, history)
+    archive.close()
+
+    archive = ReplayArchive(path)
+    assert archive.games() == [7]
+    for turn in range(1, turns + 1):
+        opened = archive.open(7, turn)
+        direct = _play_to(SEED, history, turn)
+        assert opened.get_snapshot() == direct.get_snapshot()
+    archive.close()
+
+
+def test_move_record_holds_large_atomic_numbers():
+    data = MOVE_RECORD.pack(Action.BUY.value, 4000)
+    assert MOVE_RECORD.unpack(data) == (Action.BUY.value, 4000)
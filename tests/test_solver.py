@@ -0,0 +1,72 @@
+from collections import Counter
+
+from periodical import player as player_module
+from periodical.config import Action
+from periodical.effects import SAMPLE_PATH
+from periodical.game import Game
+from periodical.solver import count_turns, Solver
+
+# seed 0 deals 8, 9, 2, 6 and 4, and keeps 5, 3, 1, 10 and 7 in the deck
+SEED = 0
+
+
+def _replay(seed, line):
+    """Returns the amount of each element in the lab after a line."""
+    game = Game('solver', seed=seed)
+    game.setup()
+    for action, number in line:
+        assert game.perform(action, number)
+    return Counter(card.number for card in game.current_player.get_lab())
+
+
+def _solve(target, **kwargs):
+    """Returns a solver, its solution and whether it was proven optimal,
+    checking that the solution reaches the goal."""
+    solver = Solver(SEED, target, **kwargs)
+    line, optimal = solver.solve()
+    assert line is not None
+    lab = _replay(SEED, line)
+    assert all(lab[number] >= amount
+               for number, amount in solver.target.items())
+    return solver, line, optimal
+
+
+def test_fewest_turns_on_small_deals():
+    # one synthesis a turn, a mulligan draws the deck in the first turn, and
+    # synthesizing 9 spends 2, whose bought copies are drawn in the third
+    for target, turns in (([9], 1), ([10], 1), ([10, 9], 2), ([10, 7], 2),
+                          ([9, 2], 3)):
+        solver, line, optimal = _solve(target)
+        assert optimal
+        assert count_turns(line) == solver.minimum == turns
+
+
+def test_targets_needing_a_purchase_are_solved():
+    game = Game('solver', seed=SEED)
+    game.setup()
+    player = game.current_player
+    assert 11 not in {card.number
+                      for card in player.get_hand() + player.get_deck()}
+    for target in ([10, 11], [3, 11]):
+        # 11 is bought, and drawn once the discard pile is reshuffled
+        _, line, optimal = _solve(target)
+        assert optimal
+        assert (Action.BUY, 11) in line
+        assert count_turns(line) == 3
+
+
+def test_effects_are_searched(monkeypatch):
+    monkeypatch.setattr(player_module, 'EFFECTS_PATH', SAMPLE_PATH)
+    # 8 is an actinide, whose card allows a second synthesis when played, so
+    # 2 may be synthesized before 9 spends it
+    _, line, optimal = _solve([9, 2])
+    assert optimal
+    assert (Action.PLAY, 8) in line
+    assert count_turns(line) == 1
+
+
+def test_unproven_solutions_are_flagged():
+    solver, line, optimal = _solve([10, 11], max_nodes=10)
+    assert solver.nodes > 10
+    assert optimal == (count_turns(line) == solver.minimum)
+    assert count_turns(line) >= solver.minimum
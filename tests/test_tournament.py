@@ -0,0 +1,24 @@
+from periodical.tournament import Tournament
+
+
+NAMES = ['greedy', 'collector']
+
+
+def _results(tournament):
+    """Returns the recorded results and ratings of a tournament."""
+    return ({key: vars(test) for key, test in tournament.tests.items()},
+            tournament.ratings)
+
+
+def test_results_are_recorded_in_seed_order(tmp_path):
+    whole = Tournament(NAMES, max_games=6)
+    whole.run(workers=1, batch=4)
+    parallel = Tournament(NAMES, max_games=6)
+    parallel.run(workers=2, batch=4)
+    assert _results(parallel) == _results(whole)
+
+    path = str(tmp_path / 'checkpoint.json')
+    Tournament(NAMES, path=path, max_games=3).run(workers=2, batch=4)
+    resumed = Tournament(NAMES, path=path, max_games=6)
+    resumed.run(workers=2, batch=4)
+    assert _results(resumed) == _results(whole)
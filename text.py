@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, Tuple
+
+from pygame.font import Font
+from pygame.surface import Surface
+
+from periodical.atlas import RENDER_LOCK
+from periodical.config import TEXT_CACHE_SIZE
+
+
+class SurfaceCache:
+    """A class for keeping a bounded amount of recently used surfaces.
+
+    Once full, the least recently used surface is dropped for each new one.
+
+    Attributes:
+        size: Maximal amount of surfaces to keep.
+    """
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._surfaces: 'OrderedDict[Hashable, Surface]' = OrderedDict()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._surfaces
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def fetch(self, key: Hashable, draw: Callable[[], Surface]) -> Surface:
+        """Returns a kept surface, drawing and keeping it if necessary.
+
+        Args:
+            key: Unique description of the surface.
+            draw: Function creating the surface.
+
+        Returns:
+            Requested surface.
+        """
+        try:
+            self._surfaces.move_to_end(key)
+            return self._surfaces[key]
+        except KeyError:
+            surface = self._surfaces[key] = draw()
+            if len(self._surfaces) > self.size:
+                self._surfaces.popitem(last=False)
+            return surface
+
+    def clear(self) -> None:
+        """Drops all kept surfaces."""
+        self._surfaces.clear()
+
+
+TEXT = SurfaceCache(TEXT_CACHE_SIZE)
+
+
+def render_text(font: Font, text: str, antialias: bool,
+                color: Tuple[int, int, int]) -> Surface:
+    """Returns an image of the text, rendering it only if it isn't cached.
+
+    Args:
+        font: Font to render the text with.
+        text: Text to render.
+        antialias: Whether or not to smooth the text's edges.
+        color: RGB color of the text.
+
+    Returns:
+        Image of the text.
+    """
+    return TEXT.fetch((font, text, antialias, color),
+                      lambda: _render(font, text, antialias, color))
+
+
+def _render(font: Font, text: str, antialias: bool,
+            color: Tuple[int, int, int]) -> Surface:
+    """Renders text while no other thread is rendering."""
+    with RENDER_LOCK:
+        return font.render(text, antialias, color)
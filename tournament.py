@@ -0,0 +1,314 @@
+import argparse
+import json
+import math
+import os
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                wait)
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from periodical.bots import STRATEGIES
+from periodical.simulate import LAB_GOAL, MAX_TURNS, play_game
+
+
+ELO_K = 16
+INITIAL_RATING = 1500
+MIN_SOLO_GAMES = 30
+
+
+class SPRT:
+    """A class for a sequential probability ratio test deciding whether one
+    strategy beats another.
+
+    Draws carry no information on the win rate and are only counted.
+
+    Attributes:
+        p0: Win rate under the hypothesis that the first strategy isn't better.
+        p1: Win rate under the hypothesis that the first strategy is better.
+        alpha: Probability of wrongly accepting the second hypothesis.
+        beta: Probability of wrongly accepting the first hypothesis.
+        wins: Games won by the first strategy.
+        losses: Games won by the second strategy.
+        draws: Games neither strategy won.
+    """
+    def __init__(self, p0: float = 0.45, p1: float = 0.55,
+                 alpha: float = 0.05, beta: float = 0.05, wins: int = 0,
+                 losses: int = 0, draws: int = 0) -> None:
+        self.p0 = p0
+        self.p1 = p1
+        self.alpha = alpha
+        self.beta = beta
+        self.wins = wins
+        self.losses = losses
+        self.draws = draws
+
+    @property
+    def games(self) -> int:
+        """Returns the amount of games recorded."""
+        return self.wins + self.losses + self.draws
+
+    @property
+    def llr(self) -> float:
+        """Returns the log-likelihood ratio of the two hypotheses."""
+        return (self.wins * math.log(self.p1 / self.p0)
+                + self.losses * math.log((1 - self.p1) / (1 - self.p0)))
+
+    def decide(self) -> Optional[bool]:
+        """Returns the test's decision, if one was reached.
+
+        Returns:
+            True if the first strategy is better, False if it isn't, None if
+            more games are needed.
+        """
+        if self.llr >= math.log((1 - self.beta) / self.alpha):
+            return True
+        if self.llr <= math.log(self.beta / (1 - self.alpha)):
+            return False
+        return None
+
+    def update(self, first: int, second: int) -> None:
+        """Records a game's result.
+
+        Args:
+            first: Turns needed by the first strategy.
+            second: Turns needed by the second strategy.
+        """
+        if first < second:
+            self.wins += 1
+        elif first > second:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+
+class Solo:
+    """A class for measuring a strategy's turns to the goal, until the mean
+    is known precisely enough.
+
+    Attributes:
+        precision: Required half-width of the mean's 95% confidence interval.
+        games: Games recorded.
+        total: Sum of turns over all games.
+        squares: Sum of squared turns over all games.
+    """
+    def __init__(self, precision: float = 0.25, games: int = 0,
+                 total: float = 0, squares: float = 0) -> None:
+        self.precision = precision
+        self.games = games
+        self.total = total
+        self.squares = squares
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean amount of turns."""
+        return self.total / self.games if self.games else 0.0
+
+    @property
+    def margin(self) -> float:
+        """Returns the half-width of the mean's 95% confidence interval."""
+        if self.games < 2:
+            return math.inf
+        variance = ((self.squares - self.total ** 2 / self.games)
+                    / (self.games - 1))
+        return 1.96 * math.sqrt(max(variance, 0) / self.games)
+
+    def decide(self) -> Optional[bool]:
+        """Returns True once the mean is precise enough, None otherwise."""
+        if self.games >= MIN_SOLO_GAMES and self.margin <= self.precision:
+            return True
+        return None
+
+    def update(self, turns: int) -> None:
+        """Records a game's result.
+
+        Args:
+            turns: Turns needed by the strategy.
+        """
+        self.games += 1
+        self.total += turns
+        self.squares += turns ** 2
+
+
+def play_match(names: Tuple[str, ...], seed: int, goal: int,
+               max_turns: int) -> Tuple[int, ...]:
+    """Plays the same deal with each strategy.
+
+    Args:
+        names: Names of strategies to play.
+        seed: Seed of the deal.
+        goal: Amount of unique elements required in the lab.
+        max_turns: Amount of turns after which a game is abandoned.
+
+    Returns:
+        Turns needed by each strategy.
+    """
+    return tuple(play_game(STRATEGIES[name], seed, goal, max_turns)
+                 for name in names)
+
+
+class Tournament:
+    """A class for running strategies against each other, or alone, across a
+    process pool, stopping each pairing once its result is decided.
+
+    Attributes:
+        names: Names of participating strategies.
+        solo: Whether to measure each strategy alone instead of in pairs.
+        path: Path of the checkpoint file, if any.
+        max_games: Amount of games after which a pairing is left undecided.
+        goal: Amount of unique elements required in the lab.
+        max_turns: Amount of turns after which a game is abandoned.
+    """
+    def __init__(self, names: List[str], solo: bool = False,
+                 path: Optional[str] = None, max_games: int = 2000,
+                 goal: int = LAB_GOAL, max_turns: int = MAX_TURNS) -> None:
+        self.names = names
+        self.solo = solo
+        self.path = path
+        self.max_games = max_games
+        self.goal = goal
+        self.max_turns = max_turns
+        self.ratings = {name: float(INITIAL_RATING) for name in names}
+        self.tests: Dict[Tuple[str, ...], Any] = {}
+        self._seeds: Dict[Tuple[str, ...], int] = {}
+        if solo:
+            keys = [(name,) for name in names]
+        else:
+            keys = list(combinations(names, 2))
+        for key in keys:
+            self.tests[key] = Solo() if solo else SPRT()
+            self._seeds[key] = 0
+        if path and os.path.exists(path):
+            self._load()
+
+    def _load(self) -> None:
+        """Restores results and ratings from the checkpoint file."""
+        with open(str(self.path), 'r', encoding='utf-8') as file_handler:
+            checkpoint = json.load(file_handler)
+        self.ratings.update(checkpoint['ratings'])
+        for entry in checkpoint['tests']:
+            key = tuple(entry['names'])
+            if key in self.tests:
+                vars(self.tests[key]).update(entry['test'])
+                self._seeds[key] = entry['seed']
+
+    def save(self) -> None:
+        """Writes results and ratings to the checkpoint file, if there is
+        one."""
+        if not self.path:
+            return
+        checkpoint = {
+            'ratings': self.ratings,
+            'tests': [{'names': key, 'seed': self._seeds[key],
+                       'test': vars(test)}
+                      for key, test in self.tests.items()],
+        }
+        temp = f'{self.path}.tmp'
+        with open(temp, 'w', encoding='utf-8') as file_handler:
+            json.dump(checkpoint, file_handler, indent=2)
+        os.replace(temp, self.path)
+
+    def _is_open(self, key: Tuple[str, ...]) -> bool:
+        """Returns whether or not more games are needed for the key."""
+        test = self.tests[key]
+        return test.decide() is None and test.games < self.max_games
+
+    def _record(self, key: Tuple[str, ...], result: Tuple[int, ...]) -> None:
+        """Records a game's result and updates the ratings.
+
+        Args:
+            key: Names of strategies that played.
+            result: Turns needed by each strategy.
+        """
+        self.tests[key].update(*result)
+        if self.solo:
+            return
+        first, second = key
+        score = 0.5 if result[0] == result[1] else float(result[0] < result[1])
+        expected = 1 / (1 + 10 ** ((self.ratings[second]
+                                    - self.ratings[first]) / 400))
+        self.ratings[first] += ELO_K * (score - expected)
+        self.ratings[second] -= ELO_K * (score - expected)
+
+    def run(self, workers: Optional[int] = None, batch: int = 8) -> None:
+        """Plays games until every test is decided or out of games. Results
+        are recorded in the order of their seeds, whatever order they
+        complete in, and saved to the checkpoint after every completed
+        batch, so resuming plays on from the first unrecorded seed.
+
+        Args:
+            workers: Amount of worker processes, defaults to the CPU count.
+            batch: Amount of games queued for each open test at a time.
+        """
+        pending: Dict[Future, Tuple[Tuple[str, ...], int]] = {}
+        submitted = dict(self._seeds)
+        results: Dict[Tuple[str, ...], Dict[int, Tuple[int, ...]]] = {
+            key: {} for key in self.tests}
+        with ProcessPoolExecutor(workers) as pool:
+            while True:
+                for key in self.tests:
+                    while (self._is_open(key)
+                           and submitted[key] - self._seeds[key] < batch):
+                        future = pool.submit(play_match, key, submitted[key],
+                                             self.goal, self.max_turns)
+                        pending[future] = key, submitted[key]
+                        submitted[key] += 1
+                if not pending:
+                    break
+                done: Set[Future] = wait(pending,
+                                         return_when=FIRST_COMPLETED)[0]
+                for future in done:
+                    key, seed = pending.pop(future)
+                    results[key][seed] = future.result()
+                    while (self._seeds[key] in results[key]
+                           and self._is_open(key)):
+                        self._record(key, results[key].pop(self._seeds[key]))
+                        self._seeds[key] += 1
+                self.save()
+
+    def report(self) -> str:
+        """Returns a summary of all results.
+
+        Returns:
+            Human readable table of results.
+        """
+        lines = []
+        for key, test in self.tests.items():
+            if self.solo:
+                lines.append(f'{key[0]}: {test.mean:.2f} turns '
+                             f'(+-{test.margin:.2f}, {test.games} games)')
+                continue
+            verdict = {True: 'better', False: 'not better',
+                       None: 'undecided'}[test.decide()]
+            lines.append(f'{key[0]} vs {key[1]}: {verdict} '
+                         f'({test.wins}-{test.losses}-{test.draws}, '
+                         f'llr {test.llr:.2f})')
+        if not self.solo:
+            for name, rating in sorted(self.ratings.items(),
+                                       key=lambda x: -x[1]):
+                lines.append(f'{name}: {rating:.0f}')
+        return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Runs automated strategies against each other.')
+    parser.add_argument('strategies', nargs='*',
+                        help='strategies to run, defaults to all of: '
+                             + ', '.join(STRATEGIES))
+    parser.add_argument('--solo', action='store_true',
+                        help='measure turns to the goal of each strategy')
+    parser.add_argument('--checkpoint', help='file to save and resume from')
+    parser.add_argument('--max-games', type=int, default=2000)
+    parser.add_argument('--goal', type=int, default=LAB_GOAL)
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--workers', type=int)
+    args = parser.parse_args()
+    unknown = set(args.strategies) - set(STRATEGIES)
+    if unknown:
+        parser.error(f'unknown strategies: {", ".join(sorted(unknown))}')
+
+    tournament = Tournament(args.strategies or list(STRATEGIES), args.solo,
+                            args.checkpoint, args.max_games, args.goal,
+                            args.max_turns)
+    tournament.run(args.workers)
+    print(tournament.report())
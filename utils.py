@@ -1,33 +1,33 @@
-import json
-from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import os
+import re
+import shutil
+from threading import Event
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import pygame
+from pygame.rect import Rect
 from pygame.surface import Surface
 
+from periodical.atlas import ATLAS, INDEX, RENDER_LOCK
 from periodical.card import border_and_fill, Card
-from periodical.config import (BLACK_FONT, BUTTON, BUTTON_BORDER, CARD,
-                               ELEMENTS_AMOUNT, FONT, NUM, PATH, Pos, Zone)
+from periodical.catalog import get_catalog, iter_elements
+from periodical.config import (BASE_BUTTON_BORDER, BASE_CARD_BORDER,
+                               BLACK_FONT, BUTTON, BUTTON_CACHE_SIZE,
+                               BUTTONS, CACHE_LIMIT, CACHE_PATH, CARD, CELL,
+                               CELL_FONT_SIZE, COLORS, FONT_FACE, FONT_SIZE,
+                               HIGHLIGHT, LAYOUT, MEGA_CARD, MODE_FONT_SIZE,
+                               NUM, PATH, Pos, set_scale, SHELL,
+                               SMALL_FONT_SIZE, SMALLER_FONT_SIZE,
+                               SMALLEST_FONT_SIZE, TABLE_BORDER, Zone)
+from periodical.text import render_text, SurfaceCache, TEXT
 
 
-def create_cards(elements: List[Dict[str, Any]],
-                 first: int, last: int) -> List[Card]:
-    """Returns list of cards based on the passed elements and the given range.
+BUTTON_IMAGES = SurfaceCache(BUTTON_CACHE_SIZE)
+FINGERPRINT = re.compile(r'[0-9a-f]{64}')
 
-    Args:
-        elements: Complete details of each element.
-        first: Number of first element to create a card for.
-        last: Number of last element to create a card for.
-
-    Returns:
-        List of cards each depicting a unique element.
-    """
-    return [Card(element['name'], element['symbol'], element['number'],
-                 element['atomic_mass'], element['category'],
-                 element['shells'], Zone.LIMBO)
-            for element in elements
-            if first <= element['number'] <= last]
 
-
-def get_element_info(path: str) -> Any:
+def get_element_info(path: str) -> List[Dict[str, Any]]:
     """Extracts element info from json file.
 
     Args:
@@ -36,9 +36,7 @@ def get_element_info(path: str) -> Any:
     Returns:
         Complete details of each element.
     """
-    with open(path, 'r', encoding='utf-8') as file_handler:
-        file = file_handler.read()
-    return json.loads(file)['elements']
+    return list(iter_elements(path))
 
 
 def generate_cards(*, first: Optional[int] = None,
@@ -46,18 +44,15 @@ def generate_cards(*, first: Optional[int] = None,
     """Returns list of Card objects based on range.
 
     Args:
-        first: Number of first element to create a card for.
-        last: Number of last element to create a card for.
+        first: Number of first element to create a card for, defaults to the
+               first element in the catalog.
+        last: Number of last element to create a card for, defaults to the
+              last element in the catalog.
 
     Returns:
         List of cards each depicting a unique element.
     """
-    if not first:
-        first = 1
-    if not last:
-        last = ELEMENTS_AMOUNT
-    cards = create_cards(get_element_info(PATH), first, last)
-    return cards
+    return get_catalog(PATH).create_cards(first, last)
 
 
 def interact_with(deck: List[Card], card: Card, add: bool = False) -> None:
@@ -103,18 +98,188 @@ def calc_surface_heights(height: NUM) -> Tuple[NUM, NUM]:
             (height * 2 - CARD.height) / 3)
 
 
-def show_button(screen: Surface, text: str, pos: Pos, name: str) -> None:
-    """Pastes a button image onto the game screen.
+def show_button(text: str, pos: Pos, name: str) -> Tuple[Surface, Rect]:
+    """Returns a button image and its location on the screen.
 
     Args:
-        screen: Surface object onto which to paste images.
         text: Button's text.
         pos: Button's position on the screen.
         name: Name of button for coloring purposes.
+
+    Returns:
+        Image of the button and its location.
+    """
+    button = BUTTON_IMAGES.fetch((text, name),
+                                 lambda: draw_button(text, name))
+    return button, button.get_rect(center=pos.pos)
+
+
+def draw_button(text: str, name: str) -> Surface:
+    """Creates a button image.
+
+    Args:
+        text: Button's text.
+        name: Name of button for coloring purposes.
+
+    Returns:
+        Image of the button.
+    """
+    button = get_button_background(name).copy()
+    title = render_text(LAYOUT.font, text, *BLACK_FONT)
+    button.blit(title, title.get_rect(center=button.get_rect().center))
+    return button
+
+
+def get_button_background(name: str) -> Surface:
+    """Returns the bordered and colored background of a button.
+
+    Args:
+        name: Name of button for coloring purposes.
+
+    Returns:
+        Button's background image.
+    """
+    return ATLAS.fetch(f'button/{name}',
+                       lambda: border_and_fill(BUTTON, name,
+                                               LAYOUT.button_border))
+
+
+def build_atlas(cards: Iterable[Card]) -> None:
+    """Renders both images of each card and every button background into the
+    atlas, so that drawing them later requires no rendering.
+
+    Args:
+        cards: Cards to render.
+    """
+    for card in cards:
+        card.mega_render()
+        card.render()
+    for name in BUTTONS:
+        get_button_background(name)
+
+
+def get_render_fingerprint(path: str) -> str:
+    """Returns a hash of everything that affects the look of rendered images.
+
+    Args:
+        path: Path to json file of element info.
+
+    Returns:
+        Hexadecimal digest of the element catalog, colors, scale, font face
+        and sizes, border widths and image sizes.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file_handler:
+        for chunk in iter(lambda: file_handler.read(1 << 16), b''):
+            digest.update(chunk)
+    settings = (
+        sorted(COLORS.items()),
+        LAYOUT.scale,
+        FONT_FACE or pygame.font.get_default_font(),
+        (FONT_SIZE, SMALL_FONT_SIZE, SMALLER_FONT_SIZE, SMALLEST_FONT_SIZE,
+         CELL_FONT_SIZE, MODE_FONT_SIZE),
+        (BASE_CARD_BORDER, BASE_BUTTON_BORDER, LAYOUT.card_border,
+         LAYOUT.button_border, LAYOUT.highlight_width, TABLE_BORDER),
+        [size.size for size in (CARD, MEGA_CARD, HIGHLIGHT, CELL, SHELL,
+                                BUTTON)],
+    )
+    digest.update(repr(settings).encode())
+    return digest.hexdigest()
+
+
+def get_cache_directory() -> str:
+    """Returns the disk cache directory matching the current render settings.
+
+    Returns:
+        Path of the directory.
+    """
+    return os.path.join(CACHE_PATH, get_render_fingerprint(PATH))
+
+
+def prune_cache(directory: str) -> None:
+    """Deletes the render caches next to the given one, least recently
+    written first, until at most `CACHE_LIMIT` are left.
+
+    Caches are named by render fingerprint, so other directories are left
+    alone, and caches without an index, whose save was interrupted, are
+    deleted first.
+
+    Args:
+        directory: Disk cache directory in use, which is kept.
+    """
+    parent = os.path.dirname(directory)
+    try:
+        names = os.listdir(parent)
+    except OSError:
+        return
+    caches = []
+    for name in names:
+        path = os.path.join(parent, name)
+        if (path == directory or not FINGERPRINT.fullmatch(name)
+                or not os.path.isdir(path)):
+            continue
+        try:
+            written = os.path.getmtime(os.path.join(path, INDEX))
+        except OSError:
+            written = 0.0
+        caches.append((written, path))
+    caches.sort(reverse=True)
+    for _, path in caches[CACHE_LIMIT - 1:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def update_cached_atlas(directory: str, cached: int,
+                        cancelled: Optional[Event] = None) -> None:
+    """Writes the atlas back to the disk cache if anything was added to it,
+    then prunes the caches of other render settings.
+
+    Args:
+        directory: Disk cache directory.
+        cached: Amount of images in the atlas when it was loaded.
+        cancelled: Event which, if set once the atlas can no longer change,
+                   skips writing, as the atlas may have switched scales.
+    """
+    with RENDER_LOCK:
+        if cancelled is not None and cancelled.is_set():
+            return
+        if len(ATLAS) > cached:
+            try:
+                ATLAS.save(directory)
+            except (OSError, pygame.error):
+                return
+            prune_cache(directory)
+
+
+def apply_scale(scale: float) -> bool:
+    """Lays out the screen for a scale factor, and switches to the images
+    rendered at that scale. Images of the previous scale stay in memory, so
+    returning to it renders nothing.
+
+    Args:
+        scale: Factor to scale all lengths by.
+
+    Returns:
+        True if the scale changed, False otherwise.
+    """
+    if scale == LAYOUT.scale:
+        return False
+    with RENDER_LOCK:
+        set_scale(scale)
+        ATLAS.switch(str(scale))
+        BUTTON_IMAGES.clear()
+        TEXT.clear()
+    return True
+
+
+def cache_atlas(build: Callable[[], None]) -> None:
+    """Loads the atlas from the disk cache, then builds whatever it is missing
+    and writes it back to the cache if anything was added.
+
+    Args:
+        build: Function rendering all required images into the atlas.
     """
-    button = border_and_fill(BUTTON, name, BUTTON_BORDER)
-    title = FONT.render(text, *BLACK_FONT)
-    button_pos = button.get_rect(center=pos.pos)
-    title_pos = title.get_rect(center=button_pos.center)
-    for surface, position in ((button, button_pos), (title, title_pos)):
-        screen.blit(surface, position)
+    directory = get_cache_directory()
+    ATLAS.load(directory)
+    cached = len(ATLAS)
+    build()
+    update_cached_atlas(directory, cached)